@@ -1,5 +1,4 @@
 """Landscape Model component of the LEffectModel effect module."""
-from osgeo import ogr
 import shutil
 import numpy as np
 import os
@@ -8,6 +7,36 @@ import datetime
 import attrib
 import msgpack
 import time
+import threading
+import collections
+import contextlib
+import hashlib
+import json
+import glob
+import fnmatch
+import zipfile
+import sys
+import asyncio
+try:
+    import resource
+except ImportError:
+    resource = None
+
+MODELS = ("CatchmentGUTSSD", "CatchmentGUTSIT", "LPopSD", "LPopIT")
+CACHE_ENTRY_LOCKS = {}
+CACHE_ENTRY_LOCKS_LOCK = threading.Lock()
+# noinspection SpellCheckingInspection
+POPULATION_OUTPUT_FILES = (
+    "x1s{}r{}_adultMetapop.txt",
+    "x1s{}r{}_embryoMetapop.txt",
+    "x1s{}r{}_extantLocalPopsMetapop.txt",
+    "x1s{}r{}_juvAndAdultMetapop.txt",
+    "x1s{}r{}_juvenileMetapop.txt",
+    "x1s{}r{}_adultPopByReach.txt",
+    "x1s{}r{}_embryoPopByReach.txt",
+    "x1s{}r{}_juvAndAdultPopByReach.txt",
+    "x1s{}r{}_juvenilePopByReach.txt"
+)
 
 
 def retry_rename(src, dst, retries=5, delay=1.0):
@@ -23,754 +52,4487 @@ def retry_rename(src, dst, retries=5, delay=1.0):
                 raise
 
 
-class LEffectModel(base.Component):
+def remove_path(path):
     """
-    Encapsulation of the LEffectModel module as a Landscape Model component. The module provides two models: LGUTS and
-    LPop. LGUTS is a reduced GUTS model at catchment scale. It has two variants: GUTS-RED-IT, a reduced GUTS model
-    version with Individual Tolerance, and GUTS-RED-SD, a reduced GUTS version with Stochastic Death. LPop is a
-    DEB-based population model at catchment scale, parameterized for Asellus aquaticus. It makes use of the
-    GUTS- RED-IT or GUTS-RED-SD models. There is also an Abj-DEB version with population regulation through
-    density-dependent mortality.
+    Removes a file, a symbolic link or a directory tree if it exists.
+
+    Args:
+        path: The path to remove.
+
+    Returns:
+        Nothing.
     """
-    # RELEASES
-    VERSION = base.VersionCollection(
-        base.VersionInfo("2.1.6", "2023-09-20"),
-        base.VersionInfo("2.1.5", "2023-09-18"),
-        base.VersionInfo("2.1.4", "2023-09-13"),
-        base.VersionInfo("2.1.3", "2023-09-12"),
-        base.VersionInfo("2.1.2", "2023-09-11"),
-        base.VersionInfo("2.1.1", "2023-03-09"),
-        base.VersionInfo("2.1.0", "2022-03-08"),
-        base.VersionInfo("2.0.14", "2021-12-10"),
-        base.VersionInfo("2.0.13", "2021-11-18"),
-        base.VersionInfo("2.0.12", "2021-10-12"),
-        base.VersionInfo("2.0.11", "2021-10-11"),
-        base.VersionInfo("2.0.10", "2021-09-17"),
-        base.VersionInfo("2.0.9", "2021-08-18"),
-        base.VersionInfo("2.0.8", "2021-08-16"),
-        base.VersionInfo("2.0.7", "2021-08-05"),
-        base.VersionInfo("2.0.6", "2021-07-21"),
-        base.VersionInfo("2.0.5", "2021-07-16"),
-        base.VersionInfo("2.0.4", "2021-02-02"),
-        base.VersionInfo("2.0.3", "2021-01-23"),
-        base.VersionInfo("2.0.2", "2020-12-09"),
-        base.VersionInfo("2.0.1", "2020-12-03"),
-        base.VersionInfo("2.0.0", "2020-10-22"),
-        base.VersionInfo("1.4.0", "2020-10-23"),
-        base.VersionInfo("1.3.35", "2020-08-12"),
-        base.VersionInfo("1.3.34", "2020-08-04"),
-        base.VersionInfo("1.3.33", "2020-07-30"),
-        base.VersionInfo("1.3.30", "2020-06-22"),
-        base.VersionInfo("1.3.29", "2020-06-15"),
-        base.VersionInfo("1.3.27", "2020-05-20"),
-        base.VersionInfo("1.3.24", "2020-04-02"),
-        base.VersionInfo("1.3.18", "2020-03-12"),
-        base.VersionInfo("1.3.14", "2020-02-07"),
-        base.VersionInfo("1.3.13", "2020-02-07"),
-        base.VersionInfo("1.3.11", "2020-01-27"),
-        base.VersionInfo("1.3.10", "2020-01-23"),
-        base.VersionInfo("1.3.9", "2020-02-24"),
-        base.VersionInfo("1.3.8", "2020-01-14"),
-        base.VersionInfo("1.2.37", None),
-        base.VersionInfo("1.2.5", None)
-    )
+    if os.path.islink(path):
+        os.remove(path)
+    elif os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
 
-    # AUTHORS
-    VERSION.authors.extend((
-        "Sascha Bub (component) - sascha.bub@gmx.de",
-        "Thorsten Schad (component) - thorsten.schad@bayer.com",
-        "Hans Baveco (module) - hans.baveco@wur.nl"
-    ))
 
-    # ACKNOWLEDGEMENTS
-    VERSION.acknowledgements.extend((
-        "[MessagePack](https://msgpack.org)",
-        "[NumPy](https://numpy.org)"
-    ))
+def reflink_file(source, destination):
+    """
+    Creates a copy-on-write clone of a file if the file system supports it.
 
-    # ROADMAP
-    VERSION.roadmap.extend((
-        """Start module GUI in background 
-        ([#2](https://gitlab.bayer.com/aqrisk-landscape/leffectmodel-component/-/issues/2))""",
-        "Numbering of reaches ([#4](https://gitlab.bayer.com/aqrisk-landscape/leffectmodel-component/-/issues/4))"
-    ))
+    Args:
+        source: The path of the file to clone.
+        destination: The path of the clone.
 
-    # CHANGELOG
-    # noinspection SpellCheckingInspection
-    VERSION.added("1.2.5", "`components.Lguts` component")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.2.5", "`components.Lguts` updated")
-    # noinspection SpellCheckingInspection
-    VERSION.fixed("1.3.8", "Fix of `components.Lguts` concentration input for large sets of concentrations")
-    # noinspection SpellCheckingInspection
-    VERSION.fixed("1.3.9", "Update of `components.Lguts` to fit temporal output scale of module")
-    # noinspection SpellCheckingInspection
-    VERSION.fixed("1.3.10", "`components.Lguts` for single-year runs")
-    # noinspection SpellCheckingInspection
-    VERSION.fixed("1.3.11", "`components.Lguts` temporal referencing")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.3.13", "Margin of Safety outputs from `components.Lguts` added")
-    # noinspection SpellCheckingInspection
-    VERSION.fixed("1.3.14", "`components.Lguts` error introduced during re-factory")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.3.18", "Storage of individual survival for all multiplication factors in `components.Lguts` ")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.3.24", "`components.Lguts` uses base function to call module")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.3.27", "`components.Lguts` specifies scales")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.3.29", "Input slicing in `components.Lguts`")
-    # noinspection SpellCheckingInspection
-    VERSION.fixed("1.3.30", "`components.Lguts` GUTS-SD parameterization")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.3.33", "`components.Lguts` checks input types strictly")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.3.33", "`components.Lguts` checks for physical units")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.3.33", "`components.Lguts` checks for scales")
-    # noinspection SpellCheckingInspection
-    VERSION.changed("1.3.34", "`components.Lguts` renamed to `components.LgutsRed` ")
-    # noinspection SpellCheckingInspection
-    VERSION.fixed("1.3.34", "Physical units of killing rate in `components.LgutsRed` ")
-    # noinspection SpellCheckingInspection
-    VERSION.fixed("1.3.35", "`components.LgutsRed` output scale")
+    Returns:
+        A boolean indicating whether the clone was created.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return False
     # noinspection SpellCheckingInspection
-    VERSION.changed("1.4.0", "`components.LgutsRed` renamed to `LEffectModel` ")
+    ficlone = 0x40049409
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), ficlone, src.fileno())
+        return True
+    except OSError:
+        if os.path.exists(destination):
+            os.remove(destination)
+        return False
+
+
+def link_file(source, destination, writable=False):
+    """
+    Makes a file available at another path, avoiding a physical copy of its content where possible.
+
+    Args:
+        source: The path of the existing file.
+        destination: The path where the file is made available.
+        writable: Specifies whether the destination file may be written to. Writable files are never hardlinked, as
+            writing to a hardlink would also change the source.
+
+    Returns:
+        The method used to make the file available, either `reflink`, `hardlink` or `copy`.
+    """
+    if reflink_file(source, destination):
+        return "reflink"
+    if not writable:
+        try:
+            os.link(source, destination)
+            return "hardlink"
+        except OSError:
+            pass
+    shutil.copyfile(source, destination)
+    return "copy"
+
+
+def read_population_file(file_path, number_columns):
+    """
+    Reads a tab-separated population output file of the module.
+
+    Args:
+        file_path: The path of the module output file.
+        number_columns: The number of value columns following the day number and the date column.
+
+    Returns:
+        A two-dimensional integer array with the day number in the first column followed by the values.
+    """
+    return np.loadtxt(
+        file_path, np.int64, delimiter="\t", usecols=(0, *range(2, 2 + number_columns)), ndmin=2)
+
+
+def read_population_values(file_path, number_days, number_columns, data_type):
+    """
+    Reads a population output file of the module into a daily array.
+
+    Args:
+        file_path: The path of the module output file.
+        number_days: The total number of simulated days.
+        number_columns: The number of value columns following the day number and the date column.
+        data_type: The integer data type of the returned array. Values are checked to fit into it.
+
+    Returns:
+        A two-dimensional array of values per day and column.
+    """
+    values = np.zeros((number_days, number_columns), data_type)
+    records = read_population_file(file_path, number_columns)
+    check_integer_range(records[:, 1:], data_type, file_path)
+    values[records[:, 0] - 1] = records[:, 1:]
+    return values
+
+
+def population_factor_files(model_system_path, multiplication_factor, number_runs):
+    """
+    Gets the output files of a multiplication factor of a population model run if they are complete, i.e., if all
+    output files of all runs exist and end with a complete line.
+
+    Args:
+        model_system_path: The output directory of the population model.
+        multiplication_factor: The index of the multiplication factor, starting at 1.
+        number_runs: The number of runs of the population model.
+
+    Returns:
+        A list of the paths of the output files or `None` if they are not complete.
+    """
     # noinspection SpellCheckingInspection
-    VERSION.changed("1.4.0", "`components.LgutsRed` uses new LEffectModel module")
-    VERSION.changed("2.0.0", "First independent release")
-    VERSION.added("2.0.1", "Changelog and release history")
-    VERSION.changed("2.0.2", "Module updated to version 20201208")
-    VERSION.changed("2.0.3", "`ReachListHydrography` expects list of identifiers now, no longer file name")
-    VERSION.fixed("2.0.3", "Determination of last year of simulation and application")
-    VERSION.changed("2.0.4", "Module updated to version 20210127")
-    VERSION.changed("2.0.5", "Markdown in changelog")
-    VERSION.changed("2.0.5", "Proofreading")
-    VERSION.fixed("2.0.5", "Data type access")
-    VERSION.added("2.0.6", "`NumberRuns` input")
-    VERSION.changed("2.0.6", "Output scales to cover internal Monte Carlo runs")
-    VERSION.added("2.0.7", "`Reaches` output")
-    VERSION.fixed("2.0.8", "Temporal scale of some outputs")
-    VERSION.added("2.0.9", "Base documentation")
-    VERSION.changed("2.0.10", "Make use of generic types for class attributes")
-    VERSION.changed("2.0.11", "Replaced legacy format strings by f-strings")
-    VERSION.changed("2.0.12", "Switched to Google docstring style")
-    VERSION.changed("2.0.13", "Removed reach inputs and output")
-    VERSION.changed("2.0.13", "Scale of multiplication factors from `global` to `other/factor` ")
-    VERSION.changed("2.0.13", "Reports element names of outputs")
-    VERSION.changed("2.0.14", "Specifies offset of outputs")
-    VERSION.changed("2.1.0", "Module updated to version 20211111")
-    VERSION.changed("2.1.1", "Module updated to version 20211111-1")
-    VERSION.added("2.1.2", "Information on runtime environment")
-    VERSION.changed("2.1.3", "Extended module information for Squeak runtime environment")
-    VERSION.added("2.1.3", "Creation of repository info during documentation")
-    VERSION.added("2.1.3", "Repository info, changelog, contributing note and readme to module")
-    VERSION.changed("2.1.4", "Spatial scale of `Concentrations` input")
-    VERSION.added("2.1.4", "Unit attribute to `Verbosity` input")
-    VERSION.changed("2.1.4", "Spatial scales of outputs")
-    VERSION.changed("2.1.5", "Updated component description")
-    VERSION.changed("2.1.5", "Updated input descriptions and removed stub descriptions")
-    VERSION.added("2.1.5", "Runtime note regarding removal of SimulationStart input")
-    VERSION.added("2.1.6", "Extended output descriptions")
-    VERSION.added("2.1.6", "Outputs with scale space/reach report geometries")
+    file_paths = [
+        os.path.join(
+            model_system_path, "x1", f"x1s{multiplication_factor}", file_name.format(multiplication_factor, run))
+        for run in range(1, number_runs + 1)
+        for file_name in POPULATION_OUTPUT_FILES
+    ]
+    for file_path in file_paths:
+        if not os.path.isfile(file_path) or os.path.getsize(file_path) == 0:
+            return None
+        with open(file_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                return None
+    return file_paths
 
-    def __init__(self, name, observer, store):
+
+def attach_shared_memory(name):
+    """
+    Attaches to a shared memory block created by another process without taking over its lifetime management.
+
+    Args:
+        name: The name of the shared memory block.
+
+    Returns:
+        The shared memory block.
+    """
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name)
+
+
+def read_population_values_into_shared_memory(file_path, number_days, number_columns, data_type, block_name):
+    """
+    Reads a population output file of the module into a shared memory block. Used by worker processes.
+
+    Args:
+        file_path: The path of the module output file.
+        number_days: The total number of simulated days.
+        number_columns: The number of value columns following the day number and the date column.
+        data_type: The name of the integer data type of the values.
+        block_name: The name of the shared memory block, which must hold the values of one file.
+
+    Returns:
+        Nothing.
+    """
+    block = attach_shared_memory(block_name)
+    try:
+        target = np.ndarray((number_days, number_columns), data_type, block.buf)
+        target[:] = read_population_values(file_path, number_days, number_columns, data_type)
+        del target
+    finally:
+        block.close()
+
+
+def iterate_population_files(file_paths, number_days, number_columns, data_type, number_workers=1):
+    """
+    Reads population output files of the module, optionally distributed across a pool of worker processes. Workers
+    parse files into shared memory blocks and values are yielded in the order of the file paths, regardless of the
+    order in which workers finish.
+
+    Args:
+        file_paths: A dictionary mapping keys to the paths of module output files.
+        number_days: The total number of simulated days.
+        number_columns: The number of value columns following the day number and the date column.
+        data_type: The integer data type of the values.
+        number_workers: The number of worker processes. Files are read sequentially if less than 2.
+
+    Returns:
+        A generator of tuples of key and values per day and column.
+    """
+    import concurrent.futures
+    from multiprocessing import shared_memory
+    if number_workers < 2 or len(file_paths) < 2:
+        for key, file_path in file_paths.items():
+            yield key, read_population_values(file_path, number_days, number_columns, data_type)
+        return
+    data_type = np.dtype(data_type)
+    block_size = max(number_days * number_columns * data_type.itemsize, 1)
+    blocks = [shared_memory.SharedMemory(create=True, size=block_size) for _ in range(2 * number_workers)]
+    try:
+        free_blocks = collections.deque(blocks)
+        pending = collections.deque()
+        with concurrent.futures.ProcessPoolExecutor(number_workers) as executor:
+            items = iter(file_paths.items())
+            while True:
+                for key, file_path in items:
+                    block = free_blocks.popleft()
+                    pending.append((key, block, executor.submit(
+                        read_population_values_into_shared_memory,
+                        file_path,
+                        number_days,
+                        number_columns,
+                        data_type.name,
+                        block.name
+                    )))
+                    if not free_blocks:
+                        break
+                if not pending:
+                    break
+                key, block, future = pending.popleft()
+                future.result()
+                values = np.ndarray((number_days, number_columns), data_type, block.buf).copy()
+                free_blocks.append(block)
+                yield key, values
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+@contextlib.contextmanager
+def stage_population_files(
+        file_paths, number_days, number_columns, data_type=None, number_workers=1, buffer_file=None):
+    """
+    Reads population output files of the module in a single pass into a staging array. If no data type is given,
+    values are staged in the smallest integer data type that holds all values read so far and the array is widened
+    when a file holds larger values.
+
+    Args:
+        file_paths: A dictionary mapping keys to the paths of module output files.
+        number_days: The total number of simulated days.
+        number_columns: The number of value columns following the day number and the date column.
+        data_type: The integer data type of the values, or `None` to determine it from the values.
+        number_workers: The number of worker processes. Files are read sequentially if less than 2.
+        buffer_file: The path prefix of a memory-mapped file holding the staging array. The array is kept in memory
+            if not specified.
+
+    Returns:
+        A context manager providing an array of values per file, day and column, in the order of the file paths.
+        Memory-mapped files are removed when the context is left.
+    """
+    shape = (len(file_paths), number_days, number_columns)
+    buffer_files = []
+
+    def allocate(allocated_type):
+        if buffer_file is None:
+            return np.zeros(shape, allocated_type)
+        buffer_files.append(f"{buffer_file}.{np.dtype(allocated_type).name}")
+        return np.memmap(buffer_files[-1], allocated_type, "w+", shape=shape)
+
+    staged = None
+    try:
+        staged = allocate(data_type or np.uint8)
+        minimum = maximum = 0
+        for i, (_, values) in enumerate(iterate_population_files(
+                file_paths, number_days, number_columns, data_type or np.int64, number_workers)):
+            if data_type is None and values.size > 0:
+                minimum = min(minimum, int(values.min()))
+                maximum = max(maximum, int(values.max()))
+                required_type = smallest_integer_type(minimum, maximum)
+                if required_type != staged.dtype:
+                    widened = allocate(required_type)
+                    widened[:i] = staged[:i]
+                    staged = widened
+                    if buffer_file is not None:
+                        remove_path(buffer_files[-2])
+            staged[i] = values
+        if buffer_file is not None:
+            staged.flush()
+        yield staged
+    finally:
+        del staged
+        for file_path in buffer_files:
+            remove_path(file_path)
+
+
+def read_table_into(file_path, target):
+    """
+    Reads a tab-separated table of numbers in a single pass into an existing array.
+
+    Args:
+        file_path: The path of the table.
+        target: The array receiving the values. Its shape must match the rows and columns of the table.
+
+    Returns:
+        Nothing.
+    """
+    target[...] = np.loadtxt(file_path, target.dtype, delimiter="\t", ndmin=2)
+
+
+def read_daily_table_into(file_path, target):
+    """
+    Reads the trailing columns of a tab-separated table with one row per day into an existing array. Leading columns,
+    e.g., day numbers and dates, are skipped and rows beyond the end of the table are left untouched.
+
+    Args:
+        file_path: The path of the table.
+        target: The array receiving the values. Its number of columns determines the number of trailing columns read
+            and it must have at least as many rows as the table.
+
+    Returns:
+        Nothing.
+    """
+    with open(file_path) as f:
+        number_columns = f.readline().rstrip("\r\n").count("\t") + 1
+    values = np.loadtxt(
+        file_path,
+        target.dtype,
+        delimiter="\t",
+        usecols=range(number_columns - target.shape[1], number_columns),
+        ndmin=2
+    )
+    target[:values.shape[0]] = values
+
+
+def read_table_into_shared_memory(file_path, block_name, shape, data_type, index, reader=read_table_into):
+    """
+    Reads a tab-separated table of numbers into a slice of an array in shared memory. Used by worker processes.
+
+    Args:
+        file_path: The path of the table.
+        block_name: The name of the shared memory block holding the array.
+        shape: The shape of the array.
+        data_type: The name of the data type of the array.
+        index: The index along the first axis of the array that receives the values.
+        reader: The function reading the table into the slice.
+
+    Returns:
+        Nothing.
+    """
+    block = attach_shared_memory(block_name)
+    try:
+        target = np.ndarray(shape, data_type, block.buf)
+        reader(file_path, target[index])
+        del target
+    finally:
+        block.close()
+
+
+def read_tables(file_paths, shape, data_type, number_workers=1, reader=read_table_into):
+    """
+    Reads tab-separated tables of numbers into consecutive slices of a new array. If multiple workers are used, the
+    array is allocated in shared memory and each worker process writes its tables directly into it.
+
+    Args:
+        file_paths: The paths of the tables, one per index along the first axis of the array.
+        shape: The shape of the array.
+        data_type: The data type of the array.
+        number_workers: The number of worker processes. Tables are read sequentially if less than 2.
+        reader: The function reading a table into a slice of the array.
+
+    Returns:
+        The array.
+    """
+    import concurrent.futures
+    from multiprocessing import shared_memory
+    data_type = np.dtype(data_type)
+    if number_workers < 2 or len(file_paths) < 2:
+        result = np.zeros(shape, data_type)
+        for index, file_path in enumerate(file_paths):
+            reader(file_path, result[index])
+        return result
+    block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * data_type.itemsize, 1))
+    try:
+        with concurrent.futures.ProcessPoolExecutor(min(number_workers, len(file_paths))) as executor:
+            for future in [
+                executor.submit(
+                    read_table_into_shared_memory, file_path, block.name, shape, data_type.name, index, reader)
+                for index, file_path in enumerate(file_paths)
+            ]:
+                future.result()
+        return np.ndarray(shape, data_type, block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def smallest_integer_type(minimum, maximum):
+    """
+    Determines the smallest integer data type that holds a range of values.
+
+    Args:
+        minimum: The smallest value to hold.
+        maximum: The largest value to hold.
+
+    Returns:
+        The NumPy data type.
+    """
+    if minimum >= 0:
+        candidates = (np.uint8, np.uint16, np.uint32, np.uint64)
+    else:
+        candidates = (np.int8, np.int16, np.int32, np.int64)
+    for candidate in candidates:
+        if np.iinfo(candidate).min <= minimum and maximum <= np.iinfo(candidate).max:
+            return np.dtype(candidate)
+    raise ValueError(f"No integer data type holds values from {minimum} to {maximum}")
+
+
+def check_integer_range(values, data_type, file_path):
+    """
+    Checks whether values fit into an integer data type.
+
+    Args:
+        values: The values to check.
+        data_type: The integer data type the values are stored as.
+        file_path: The file the values were read from, used for reporting.
+
+    Returns:
+        Nothing.
+    """
+    if values.size == 0:
+        return
+    data_type_info = np.iinfo(data_type)
+    if values.min() < data_type_info.min or values.max() > data_type_info.max:
+        raise ValueError(
+            f"Values in {file_path} range from {values.min()} to {values.max()} and do not fit into "
+            f"{data_type_info.dtype}"
+        )
+
+
+def encode_population_spans(values):
+    """
+    Encodes population time series by reach as the spans between their first and last non-zero value.
+
+    Args:
+        values: A two-dimensional array of daily values per reach.
+
+    Returns:
+        A tuple of the first day of the span per reach, the number of days of the span per reach and the values within
+        all spans concatenated in reach order.
+    """
+    non_zero = values != 0
+    has_values = non_zero.any(0)
+    first_day = np.where(has_values, non_zero.argmax(0), 0)
+    last_day = np.where(has_values, values.shape[0] - 1 - non_zero[::-1].argmax(0), -1)
+    days = np.arange(values.shape[0]).reshape((-1, 1))
+    in_span = (days >= first_day) & (days <= last_day)
+    return first_day, last_day - first_day + 1, values.T[in_span.T]
+
+
+def population_dense_view(spans, values, number_days):
+    """
+    Expands population outputs stored as spans into a dense array. Consumers can pass any subset of the spans, e.g.,
+    those of selected reaches, factors or runs.
+
+    Args:
+        spans: An array of spans with the first day, the number of days and the offset into the values along the last
+            axis, as stored in the `...Spans` outputs.
+        values: The values of all spans, as stored in the `...Values` outputs. Any array-like object supporting
+            slicing is accepted, so only the range of values needed is read.
+        number_days: The number of days of the dense time series.
+
+    Returns:
+        An array with the days along the first axis followed by the axes of the spans.
+    """
+    spans = np.asarray(spans, np.int64)
+    flat_spans = spans.reshape((-1, 3))
+    result = np.zeros((number_days, flat_spans.shape[0]), np.asarray(values[0:0]).dtype)
+    occupied = flat_spans[:, 1] > 0
+    if occupied.any():
+        first_value = int(flat_spans[occupied, 2].min())
+        last_value = int((flat_spans[occupied, 2] + flat_spans[occupied, 1]).max())
+        span_values = np.asarray(values[first_value:last_value])
+        lengths = flat_spans[:, 1]
+        series = np.repeat(np.arange(flat_spans.shape[0]), lengths)
+        position = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        result[np.repeat(flat_spans[:, 0], lengths) + position, series] = \
+            span_values[np.repeat(flat_spans[:, 2] - first_value, lengths) + position]
+    return result.reshape((number_days,) + spans.shape[:-1])
+
+
+class ModelOutputContainer(base.OutputContainer):
+    """
+    The outputs of an LEffectModel component. Besides the outputs bound to the output specifications, outputs of the
+    individual models of a multi-model run are addressable as `<model>/<output>`, e.g.,
+    `CatchmentGUTSIT/GutsSurvivalReaches`, and are bound to the specification of the output on first access.
+    """
+
+    def __init__(self, component, outputs, bind):
         """
-        Initializes a LEffectModule component.
+        Initializes a ModelOutputContainer.
 
         Args:
-            name: The name of the component.
-            observer: The default observer of the component.
+            component: The component owning the outputs.
+            outputs: The outputs bound to the output specifications.
+            bind: A function binding the output of a model, given the name of the output and its namespaced name.
+        """
+        super(ModelOutputContainer, self).__init__(component, outputs)
+        self._bind = bind
+
+    def __getitem__(self, item):
+        try:
+            return super(ModelOutputContainer, self).__getitem__(item)
+        except KeyError:
+            model, separator, name = item.partition("/")
+            if not separator or model not in MODELS:
+                raise
+            output = self._bind(name, item)
+            self.append(output)
+            return output
+
+
+class ModelOutputs:
+    """
+    The outputs of a single model of a multi-model run, i.e., the outputs of the component namespaced by the model.
+    """
+
+    def __init__(self, outputs, model):
+        """
+        Initializes ModelOutputs.
+
+        Args:
+            outputs: The outputs of the component.
+            model: The model whose outputs are addressed.
+        """
+        self._outputs = outputs
+        self._model = model
+
+    def __getitem__(self, item):
+        return self._outputs[f"{self._model}/{item}"]
+
+
+class DeferredOutput(base.Output):
+    """
+    A component output whose values are read from module output files only when they are requested for the first
+    time. Each module output file provides the values of a single multiplication factor and run.
+    """
+
+    def __init__(self, *args, **keywords):
+        """
+        Initializes a DeferredOutput.
+
+        Args:
+            *args: The positional arguments of a `base.Output`.
+            **keywords: The keyword arguments of a `base.Output`.
+        """
+        super(DeferredOutput, self).__init__(*args, **keywords)
+        self._loader = None
+        self._pending = {}
+        self._factor_axis = None
+        self._axis_lengths = (0, 0)
+        self._lock = threading.Lock()
+
+    def defer(self, loader, file_paths, factor_axis):
+        """
+        Defers the ingestion of module output files until the values are read.
+
+        Args:
+            loader: A function storing the values of a file. It is called with the multiplication factor index, the
+                run index (both starting at 1) and the path of the file.
+            file_paths: A dictionary mapping tuples of multiplication factor and run indices to file paths. The
+                dictionary covers all multiplication factors and runs of the output.
+            factor_axis: The axis of the output that represents multiplication factors. Runs are expected along the
+                following axis.
+
+        Returns:
+            Nothing.
+        """
+        with self._lock:
+            self._loader = loader
+            self._pending = dict(file_paths)
+            self._factor_axis = factor_axis
+            self._axis_lengths = (
+                max((key[0] for key in self._pending), default=0), max((key[1] for key in self._pending), default=0))
+
+    @property
+    def complete(self):
+        """
+        Specifies whether all values of the output are stored.
+
+        Returns:
+            `True` if no module output files are pending.
+        """
+        with self._lock:
+            return not self._pending
+
+    def materialize(self, slices=None):
+        """
+        Stores the values of all module output files that are needed for a selection and not yet stored.
+
+        Args:
+            slices: The slices of the output that are requested. If `None`, all values are stored.
+
+        Returns:
+            Nothing.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            if slices is None or len(slices) <= self._factor_axis + 1:
+                keys = list(self._pending)
+            else:
+                factors = self._selected_indices(slices[self._factor_axis], self._axis_lengths[0])
+                runs = self._selected_indices(slices[self._factor_axis + 1], self._axis_lengths[1])
+                keys = [key for key in self._pending if key[0] - 1 in factors and key[1] - 1 in runs]
+            for key in sorted(keys):
+                self._loader(key[0], key[1], self._pending.pop(key))
+
+    @staticmethod
+    def _selected_indices(selection, length):
+        """
+        Gets the indices selected along an axis, following the indexing rules of NumPy.
+
+        Args:
+            selection: A slice, an integer index or a sequence of integer indices. Negative indices count from the
+                end of the axis.
+            length: The length of the axis.
+
+        Returns:
+            A set of zero-based indices.
+        """
+        indices = range(length)
+        if isinstance(selection, slice):
+            return set(indices[selection])
+        if np.ndim(selection) == 0:
+            return {indices[int(selection)]}
+        return {indices[int(index)] for index in selection}
+
+    def read_values(self, **keywords):
+        """
+        Reads the values of the output, storing any values of the requested selection not yet stored before.
+
+        Args:
+            **keywords: The keyword arguments passed to the store.
+
+        Returns:
+            The values of the output.
+        """
+        self.materialize(None if "select" in keywords else keywords.get("slices"))
+        return super(DeferredOutput, self).read_values(**keywords)
+
+
+class P2QuantileSketch:
+    """
+    Streaming estimation of quantiles for many independent series at once, using the P² algorithm by Jain and Chlamtac
+    (1985). Each series keeps five markers per quantile, so memory does not depend on the number of observations.
+    """
+
+    def __init__(self, shape, quantiles):
+        """
+        Initializes a P2QuantileSketch.
+
+        Args:
+            shape: The shape of a single observation, i.e., the number of independent series.
+            quantiles: The quantiles to estimate as values between 0 and 1.
+        """
+        self._quantiles = np.asarray(quantiles, np.float64)
+        self._count = 0
+        self._initial = np.zeros((5,) + tuple(shape), np.float32)
+        self._heights = None
+        self._positions = None
+        self._increments = np.stack((
+            np.zeros_like(self._quantiles),
+            self._quantiles / 2,
+            self._quantiles,
+            (1 + self._quantiles) / 2,
+            np.ones_like(self._quantiles)
+        ))
+
+    def add(self, observation):
+        """
+        Adds an observation to all series.
+
+        Args:
+            observation: The observed values, one per series.
+
+        Returns:
+            Nothing.
+        """
+        observation = np.asarray(observation, np.float32)
+        if self._count < 5:
+            self._initial[self._count] = observation
+            self._count += 1
+            if self._count == 5:
+                self._initial.sort(0)
+                self._heights = [self._initial.copy() for _ in self._quantiles]
+                self._positions = [
+                    np.broadcast_to(np.arange(2, 5, dtype=np.uint32).reshape(
+                        (3,) + (1,) * observation.ndim), (3,) + observation.shape).copy()
+                    for _ in self._quantiles
+                ]
+            return
+        self._count += 1
+        for q, (heights, positions) in enumerate(zip(self._heights, self._positions)):
+            np.minimum(heights[0], observation, heights[0])
+            np.maximum(heights[4], observation, heights[4])
+            for i in range(3):
+                positions[i] += observation < heights[i + 1]
+            desired = 1 + (self._count - 1) * self._increments[:, q]
+            for i in range(1, 4):
+                self._adjust(heights, positions, i, desired[i])
+
+    def _adjust(self, heights, positions, i, desired):
+        """
+        Moves a middle marker towards its desired position.
+
+        Args:
+            heights: The marker heights of a quantile.
+            positions: The positions of the three middle markers of a quantile.
+            i: The index of the marker to adjust.
+            desired: The desired position of the marker.
+
+        Returns:
+            Nothing.
+        """
+        position = positions[i - 1].astype(np.float64)
+        lower = 1. if i == 1 else positions[i - 2].astype(np.float64)
+        upper = float(self._count) if i == 3 else positions[i].astype(np.float64)
+        deviation = desired - position
+        direction = np.where(
+            (deviation >= 1) & (upper - position > 1),
+            1.,
+            np.where((deviation <= -1) & (lower - position < -1), -1., 0.)
+        )
+        if not direction.any():
+            return
+        height = heights[i].astype(np.float64)
+        lower_height = heights[i - 1]
+        upper_height = heights[i + 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            parabolic = height + direction / (upper - lower) * (
+                    (position - lower + direction) * (upper_height - height) / (upper - position) +
+                    (upper - position - direction) * (height - lower_height) / (position - lower)
+            )
+            linear = height + direction * np.where(
+                direction > 0,
+                (upper_height - height) / (upper - position),
+                (lower_height - height) / (lower - position)
+            )
+        adjusted = np.where((lower_height < parabolic) & (parabolic < upper_height), parabolic, linear)
+        moved = direction != 0
+        heights[i][moved] = adjusted[moved]
+        positions[i - 1][moved] = (position + direction)[moved]
+
+    def estimate(self):
+        """
+        Gets the current quantile estimates.
+
+        Returns:
+            An array with the quantiles along the last axis.
+        """
+        if self._count == 0:
+            raise ValueError("No observations added")
+        if self._count < 5:
+            return np.moveaxis(
+                np.quantile(self._initial[:self._count], self._quantiles, 0), 0, -1).astype(np.float32)
+        return np.stack([heights[2] for heights in self._heights], -1)
+
+
+def fit_log_logistic(doses, responses, maximum_iterations=100, tolerance=1e-10):
+    """
+    Fits three-parameter log-logistic curves `d / (1 + exp(b * (ln(x) - c)))` to many dose-response series at once.
+    All series share the same doses and are fitted simultaneously with a Levenberg-Marquardt solver, whose normal
+    equations are solved for all series in a single batched operation per iteration.
+
+    Args:
+        doses: A one-dimensional array of positive doses in ascending order.
+        responses: An array of responses with the doses along its last axis.
+        maximum_iterations: The maximum number of iterations.
+        tolerance: The relative decrease of the sum of squared residuals below which a fit is considered converged.
+            A fit is also considered converged if the relative change of all parameters is below the square root of
+            the tolerance.
+
+    Returns:
+        A tuple of arrays of the upper limit `d`, the slope `b`, the logarithm of the dose of 50% effect `c` and a flag
+        whether the fit converged, each with the shape of the responses without their last axis.
+    """
+    shape = responses.shape[:-1]
+    log_doses = np.log(np.asarray(doses, np.float64))
+    responses = np.asarray(responses, np.float64).reshape((-1, log_doses.size))
+    upper = responses.max(1)
+    relative = responses / np.where(upper > 0, upper, 1)[:, np.newaxis]
+    below_half = relative < .5
+    first_below = np.argmax(below_half, 1)
+    previous = np.maximum(first_below - 1, 0)
+    rows = np.arange(responses.shape[0])
+    span = relative[rows, previous] - relative[rows, first_below]
+    weight = np.where(span > 0, (relative[rows, previous] - .5) / np.where(span > 0, span, 1), 0)
+    parameters = np.column_stack((
+        upper,
+        np.full(responses.shape[0], 2.),
+        np.where(
+            below_half.any(1),
+            log_doses[previous] + weight * (log_doses[first_below] - log_doses[previous]),
+            log_doses[-1] + 1
+        )
+    ))
+
+    def evaluate(p):
+        remaining = 1 / (1 + np.exp(np.clip(p[:, 1:2] * (log_doses - p[:, 2:3]), -50, 50)))
+        return p[:, 0:1] * remaining, remaining
+
+    predicted, remaining = evaluate(parameters)
+    residuals = responses - predicted
+    sum_of_squares = (residuals ** 2).sum(1)
+    damping = np.full(responses.shape[0], 1e-3)
+    total_sum_of_squares = (responses ** 2).sum(1)
+    converged = sum_of_squares <= tolerance * total_sum_of_squares
+    active = np.flatnonzero(~converged)
+    for _ in range(maximum_iterations):
+        if active.size == 0:
+            break
+        p = parameters[active]
+        remaining_active = remaining[active]
+        sensitivity = p[:, 0:1] * remaining_active * (1 - remaining_active)
+        jacobian = np.stack((
+            remaining_active,
+            -sensitivity * (log_doses - p[:, 2:3]),
+            sensitivity * p[:, 1:2]
+        ), 2)
+        transposed = jacobian.transpose((0, 2, 1))
+        normal_matrix = transposed @ jacobian
+        gradient = transposed @ residuals[active, :, np.newaxis]
+        diagonal = normal_matrix[:, np.arange(3), np.arange(3)]
+        damped = normal_matrix + (damping[active, np.newaxis] * diagonal + 1e-12)[:, :, np.newaxis] * np.eye(3)
+        step = np.linalg.solve(damped, gradient)[:, :, 0]
+        candidate = p + step
+        candidate_predicted, candidate_remaining = evaluate(candidate)
+        candidate_residuals = responses[active] - candidate_predicted
+        candidate_sum_of_squares = (candidate_residuals ** 2).sum(1)
+        improved = np.isfinite(candidate_sum_of_squares) & (candidate_sum_of_squares < sum_of_squares[active])
+        improvement = np.where(improved, sum_of_squares[active] - candidate_sum_of_squares, 0)
+        accepted = active[improved]
+        parameters[accepted] = candidate[improved]
+        remaining[accepted] = candidate_remaining[improved]
+        residuals[accepted] = candidate_residuals[improved]
+        previous_sum_of_squares = sum_of_squares[active]
+        sum_of_squares[accepted] = candidate_sum_of_squares[improved]
+        damping[active] = np.where(improved, damping[active] / 10, damping[active] * 10)
+        fitted = sum_of_squares[active] <= tolerance * total_sum_of_squares[active]
+        stationary = improved & (
+                (improvement <= tolerance * previous_sum_of_squares) |
+                (np.abs(step) <= np.sqrt(tolerance) * (np.abs(p) + np.sqrt(tolerance))).all(1)
+        )
+        done = fitted | stationary | (damping[active] > 1e10)
+        converged[active[done]] = (fitted | stationary)[done]
+        active = active[~done]
+    converged &= (parameters[:, 0] > 0) & (parameters[:, 1] > 0) & np.isfinite(parameters).all(1)
+    return (
+        parameters[:, 0].reshape(shape),
+        parameters[:, 1].reshape(shape),
+        parameters[:, 2].reshape(shape),
+        converged.reshape(shape)
+    )
+
+
+class PhaseStatistics:
+    """
+    Records the resource usage of the phases of a component run.
+
+    Wall time and processor time are measured for every phase. Processor time includes the time of terminated child
+    processes, i.e., of the module. Peak resident memory and bytes read and written are taken from the operating
+    system if available and are otherwise reported as not-a-number. The peak resident memory is the peak of the
+    summed resident memory of the component's process and its child processes during a phase. It is sampled in the
+    background and complemented by the peak of child processes that terminated during the phase with a new maximum,
+    so that short peaks of the module are not missed. Bytes read and written refer to the component's process.
+
+    All metrics except wall time are read from process-wide counters. If phases run concurrently, e.g., the module
+    runs of reach partitions, each phase also counts the resource usage of its concurrent siblings. The values of such
+    phases are therefore overlapping totals that must not be summed up across concurrent phases.
+    """
+    PHASES = (
+        "prepare_runtime_environment",
+        "prepare_startup_statements",
+        "prepare_coefficients",
+        "prepare_reach_list",
+        "prepare_concentrations",
+        "prepare_control",
+        "prepare_water_temperatures",
+        "run_module",
+        "rename_module_outputs",
+        "store_results",
+        "archive_module_outputs"
+    )
+    METRICS = ("count", "wall_time", "cpu_time", "peak_rss", "bytes_read", "bytes_written")
+    SAMPLING_INTERVAL = .1
+
+    def __init__(self, observer):
+        """
+        Initializes a PhaseStatistics.
+
+        Args:
+            observer: The observer receiving a message per measured phase.
+        """
+        self._observer = observer
+        self._values = np.zeros((len(self.PHASES), len(self.METRICS)))
+        self._values[:, 3] = np.nan
+        self._lock = threading.Lock()
+
+    @property
+    def values(self):
+        """
+        Gets the recorded statistics.
+
+        Returns:
+            An array with a row per phase and a column per metric. Repeated phases are summed up, except for the peak
+            resident memory, which is the maximum.
+        """
+        return self._values
+
+    @staticmethod
+    def _resident_memory():
+        """
+        Gets the current resident memory of the component's process and all its child processes.
+
+        Returns:
+            The resident memory in bytes or not-a-number if unknown.
+        """
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+        if psutil:
+            process = psutil.Process()
+            resident_memory = process.memory_info().rss
+            for child in process.children(True):
+                try:
+                    resident_memory += child.memory_info().rss
+                except psutil.Error:
+                    pass
+            return resident_memory
+        if not os.path.exists("/proc/self/statm"):
+            return np.nan
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        resident_memory = 0
+        pids = ["self"]
+        while pids:
+            pid = pids.pop()
+            try:
+                with open(f"/proc/{pid}/statm") as f:
+                    resident_memory += int(f.read().split()[1]) * page_size
+                for task in os.listdir(f"/proc/{pid}/task"):
+                    with open(f"/proc/{pid}/task/{task}/children") as f:
+                        pids.extend(f.read().split())
+            except OSError:
+                pass
+        return resident_memory
+
+    @staticmethod
+    def _children_peak_memory():
+        """
+        Gets the largest peak resident memory of all terminated child processes. The peak is reported in bytes on
+        macOS and in kilobytes on other platforms.
+
+        Returns:
+            The peak resident memory in bytes or not-a-number if unknown.
+        """
+        if resource:
+            peak_memory = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+            return peak_memory if sys.platform == "darwin" else peak_memory * 1024
+        return np.nan
+
+    @staticmethod
+    def _io_counters():
+        """
+        Gets the bytes read and written by the current process.
+
+        Returns:
+            A tuple of bytes read and bytes written, each not-a-number if unknown.
+        """
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+        bytes_read = bytes_written = np.nan
+        if psutil and hasattr(psutil.Process, "io_counters"):
+            io_counters = psutil.Process().io_counters()
+            bytes_read = io_counters.read_bytes
+            bytes_written = io_counters.write_bytes
+        elif os.path.exists("/proc/self/io"):
+            with open("/proc/self/io") as f:
+                counters = dict(line.split(": ") for line in f.read().splitlines())
+            bytes_read = int(counters["read_bytes"])
+            bytes_written = int(counters["write_bytes"])
+        return bytes_read, bytes_written
+
+    def _sample_memory(self, stopped, peak_rss):
+        """
+        Samples the resident memory until stopped.
+
+        Args:
+            stopped: An event signaling the end of the phase.
+            peak_rss: A list holding the peak resident memory, updated in place.
+
+        Returns:
+            Nothing.
+        """
+        while not stopped.wait(self.SAMPLING_INTERVAL):
+            peak_rss[0] = np.fmax(peak_rss[0], self._resident_memory())
+
+    @contextlib.contextmanager
+    def measure(self, phase):
+        """
+        Measures a phase.
+
+        Args:
+            phase: The name of the phase as listed in `PHASES`.
+
+        Returns:
+            A context manager measuring the enclosed statements.
+        """
+        index = self.PHASES.index(phase)
+        times = os.times()
+        bytes_read, bytes_written = self._io_counters()
+        children_peak_rss = self._children_peak_memory()
+        peak_rss = [self._resident_memory()]
+        stopped = threading.Event()
+        sampler = threading.Thread(target=self._sample_memory, args=(stopped, peak_rss), daemon=True)
+        sampler.start()
+        wall_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - wall_time
+            cpu_time = sum(os.times()[:4]) - sum(times[:4])
+            stopped.set()
+            sampler.join()
+            peak_rss = np.fmax(peak_rss[0], self._resident_memory())
+            children_peak_rss_end = self._children_peak_memory()
+            if children_peak_rss_end > children_peak_rss:
+                peak_rss = np.fmax(peak_rss, children_peak_rss_end)
+            bytes_read_end, bytes_written_end = self._io_counters()
+            with self._lock:
+                values = self._values[index]
+                values[0] += 1
+                values[1] += wall_time
+                values[2] += cpu_time
+                values[3] = np.fmax(values[3], peak_rss)
+                values[4] += bytes_read_end - bytes_read
+                values[5] += bytes_written_end - bytes_written
+            if self._observer:
+                self._observer.write_message(
+                    5,
+                    f"Phase {phase} took {wall_time:.3f} s wall time and {cpu_time:.3f} s CPU time, peak RSS "
+                    f"{peak_rss / 2 ** 20:.1f} MiB, read {(bytes_read_end - bytes_read) / 2 ** 20:.1f} MiB, "
+                    f"wrote {(bytes_written_end - bytes_written) / 2 ** 20:.1f} MiB"
+                )
+
+
+class ProgressMonitor:
+    """
+    Runs the module while reporting its progress and detecting stalls.
+
+    Progress is derived from the module output files that are written when a unit of work, e.g., a run of a
+    multiplication factor, is completed. The console output of the module is forwarded to the observer. A module run
+    is considered stalled if neither its console output nor any file below the watched output directory changed
+    within the stall timeout. A stalled module is terminated.
+    """
+    POLL_INTERVAL = 10
+
+    def __init__(
+            self,
+            observer,
+            output_path,
+            completion_pattern,
+            number_units,
+            days_per_unit,
+            interval,
+            stall_timeout,
+            poll=None
+    ):
+        """
+        Initializes a ProgressMonitor.
+
+        Args:
+            observer: The observer receiving progress messages.
+            output_path: The directory below which the module writes its outputs.
+            completion_pattern: A glob pattern of the files marking completed units of work.
+            number_units: The total number of units of work.
+            days_per_unit: The number of simulated days per unit of work.
+            interval: The interval of progress messages in seconds. Zero disables progress messages.
+            stall_timeout: The number of seconds without activity after which the module is terminated. Zero
+                disables stall detection.
+            poll: An optional function called in a worker thread while the module runs, at least every
+                `POLL_INTERVAL` seconds, e.g., to pick up completed outputs.
+        """
+        self._observer = observer
+        self._output_path = output_path
+        self._completion_pattern = completion_pattern
+        self._number_units = number_units
+        self._days_per_unit = days_per_unit
+        self._interval = interval
+        self._stall_timeout = stall_timeout
+        self._poll = poll
+        self._last_activity = time.monotonic()
+        self._output_state = None
+
+    async def _forward_console(self, stream):
+        """
+        Forwards the console output of the module to the observer.
+
+        Args:
+            stream: The console output stream of the module.
+
+        Returns:
+            Nothing.
+        """
+        async for line in stream:
+            self._last_activity = time.monotonic()
+            line = line.decode(errors="replace").rstrip()
+            if self._observer and line:
+                self._observer.write_message(5, line)
+
+    def _check_outputs(self):
+        """
+        Checks whether files below the output directory changed since the last check.
+
+        Returns:
+            Nothing.
+        """
+        latest_modification = total_size = number_files = 0
+        for directory, _, file_names in os.walk(self._output_path):
+            for file_name in file_names:
+                try:
+                    status = os.stat(os.path.join(directory, file_name))
+                except OSError:
+                    continue
+                latest_modification = max(latest_modification, status.st_mtime_ns)
+                total_size += status.st_size
+                number_files += 1
+        output_state = (latest_modification, total_size, number_files)
+        if output_state != self._output_state:
+            self._output_state = output_state
+            self._last_activity = time.monotonic()
+
+    def report(self, elapsed):
+        """
+        Reports the progress of the module run.
+
+        Args:
+            elapsed: The seconds elapsed since the start of the module.
+
+        Returns:
+            Nothing.
+        """
+        completed = min(len(glob.glob(self._completion_pattern)), self._number_units)
+        message = f"Module progress: {completed} of {self._number_units} completed after {elapsed:.0f} s"
+        if completed > 0:
+            message += (
+                f", {completed * self._days_per_unit / elapsed:.1f} simulated days per second, estimated "
+                f"{elapsed / completed * (self._number_units - completed):.0f} s remaining"
+            )
+        if self._observer:
+            self._observer.write_message(5, message)
+
+    async def run(self, command, working_directory, launcher=None):
+        """
+        Runs the module as an asynchronous subprocess and monitors it until it terminates.
+
+        Args:
+            command: The command line of the module.
+            working_directory: The working directory of the module.
+            launcher: An optional launcher providing the options of the subprocess and configuring it once started.
+
+        Returns:
+            Nothing.
+        """
+        start = time.monotonic()
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=working_directory,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            **(launcher.subprocess_options if launcher else {})
+        )
+        console = None
+        try:
+            if launcher:
+                unsupported = launcher.configure(process.pid)
+                if unsupported and self._observer:
+                    self._observer.write_message(
+                        3, f"Could not apply {' and '.join(unsupported)} to the module process")
+            console = asyncio.ensure_future(self._forward_console(process.stdout))
+            exit_code = asyncio.ensure_future(process.wait())
+            self._last_activity = start
+            next_report = start + self._interval
+            timeouts = [timeout for timeout in (self._interval, self._stall_timeout) if timeout]
+            poll_interval = min(timeouts + [self.POLL_INTERVAL]) if timeouts or self._poll else None
+            while not (await asyncio.wait({exit_code}, timeout=poll_interval))[0]:
+                if self._poll:
+                    await asyncio.to_thread(self._poll)
+                now = time.monotonic()
+                if self._stall_timeout:
+                    await asyncio.to_thread(self._check_outputs)
+                    if now - self._last_activity > self._stall_timeout:
+                        raise TimeoutError(
+                            f"Module terminated after {self._stall_timeout} s without console output or output "
+                            f"file changes"
+                        )
+                if self._interval and now >= next_report:
+                    self.report(now - start)
+                    next_report = now + self._interval
+            await console
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if console is not None and not console.done():
+                console.cancel()
+        if self._interval:
+            self.report(time.monotonic() - start)
+        if process.returncode != 0:
+            raise ValueError(f"Module exited with code {process.returncode}")
+
+
+class ModuleLauncher:
+    """
+    Launches the Squeak virtual machine running the module without a display. A native virtual machine is used if
+    configured, e.g., on Linux, otherwise the console virtual machine of the module, run through Wine on platforms
+    other than Windows. Launched processes can be bound to a set of processors and run with a lower scheduling
+    priority, so that concurrent module instances do not compete with other work on the same machine.
+    """
+
+    def __init__(self, module_path, virtual_machine=None, processor_affinity=None, niceness=0):
+        """
+        Initializes a ModuleLauncher.
+
+        Args:
+            module_path: The directory of the module holding the Windows virtual machines.
+            virtual_machine: The path of a native Squeak virtual machine or `None` to use the console virtual machine
+                of the module.
+            processor_affinity: The indices of the processors on which launched processes may run or `None` to run
+                them on all processors.
+            niceness: The increment of the niceness of launched processes. Positive values lower their priority.
+        """
+        self._module_path = module_path
+        self._virtual_machine = virtual_machine
+        self._processor_affinity = processor_affinity
+        self._niceness = niceness
+
+    @property
+    def wine(self):
+        """The path of Wine if the console virtual machine of the module is run through it, else `None`."""
+        if self._virtual_machine or os.name == "nt":
+            return None
+        return shutil.which("wine")
+
+    def command(self, image, statements):
+        """
+        Assembles the command line of the virtual machine.
+
+        Args:
+            image: The file name of the image.
+            statements: The file name of the startup statements.
+
+        Returns:
+            A tuple of command line arguments.
+        """
+        if self._virtual_machine:
+            return self._virtual_machine, "-vm-display-null", "-vm-sound-null", image, statements
+        command = (os.path.join(self._module_path, "SqueakConsole.exe"), "-headless", image, statements)
+        wine = self.wine
+        return command if wine is None else (wine,) + command
+
+    @property
+    def adjusts_processes(self):
+        """Whether launched processes need options or configuration beyond their command line."""
+        return bool(self._processor_affinity or self._niceness or self.wine)
+
+    @property
+    def subprocess_options(self):
+        """The keyword arguments for starting the virtual machine as subprocess."""
+        options = {}
+        if self.wine:
+            options["env"] = dict(os.environ, WINEDEBUG="-all")
+        return options
+
+    def configure(self, pid):
+        """
+        Applies the processor affinity and niceness to a started virtual machine. They are applied right after the
+        virtual machine is started, so that threads and processes it starts later inherit them. Requires `psutil` on
+        Windows.
+
+        Args:
+            pid: The process identifier of the virtual machine.
+
+        Returns:
+            A list of the names of the settings that could not be applied.
+        """
+        settings = [name for name, value in (
+            ("processor affinity", self._processor_affinity), ("niceness", self._niceness)) if value]
+        if not settings:
+            return []
+        if os.name == "posix":
+            unsupported = []
+            if self._processor_affinity:
+                try:
+                    os.sched_setaffinity(pid, self._processor_affinity)
+                except (AttributeError, OSError):
+                    unsupported.append("processor affinity")
+            if self._niceness:
+                try:
+                    os.setpriority(
+                        os.PRIO_PROCESS, pid, os.getpriority(os.PRIO_PROCESS, pid) + self._niceness)
+                except OSError:
+                    unsupported.append("niceness")
+            return unsupported
+        try:
+            import psutil
+        except ImportError:
+            return settings
+        process = psutil.Process(pid)
+        if self._processor_affinity:
+            process.cpu_affinity(list(self._processor_affinity))
+        if self._niceness:
+            process.nice(
+                psutil.BELOW_NORMAL_PRIORITY_CLASS if self._niceness > 0 else psutil.ABOVE_NORMAL_PRIORITY_CLASS)
+        return []
+
+
+class ResumeManifest:
+    """
+    Records the completed stages of a component run in its processing path, so that an interrupted run can be
+    resumed. A stage is a set of files that is complete once recorded. Recorded stages are valid as long as all their
+    files still exist with the recorded sizes and the configuration of the run did not change.
+    """
+
+    def __init__(self, processing_path, configuration):
+        """
+        Initializes a ResumeManifest and loads previously recorded stages.
+
+        Args:
+            processing_path: The processing path of the run.
+            configuration: A JSON-serializable description of the run. Stages recorded for another configuration are
+                discarded.
+        """
+        self._processing_path = processing_path
+        self._file_path = os.path.join(processing_path, "resume_manifest.json")
+        self._configuration = configuration
+        self._stages = {}
+        if os.path.exists(self._file_path):
+            with open(self._file_path) as f:
+                manifest = json.load(f)
+            if manifest.get("configuration") == configuration:
+                self._stages = manifest.get("stages", {})
+
+    def is_complete(self, stage):
+        """
+        Checks whether a stage was recorded and its files are still unchanged.
+
+        Args:
+            stage: The name of the stage.
+
+        Returns:
+            A boolean indicating whether the stage is complete.
+        """
+        if stage not in self._stages:
+            return False
+        for relative_path, size in self._stages[stage].items():
+            file_path = os.path.join(self._processing_path, relative_path)
+            if not os.path.isfile(file_path) or os.path.getsize(file_path) != size:
+                return False
+        return True
+
+    def complete(self, stage, file_paths):
+        """
+        Records a stage as completed.
+
+        Args:
+            stage: The name of the stage.
+            file_paths: The paths of the files produced by the stage.
+
+        Returns:
+            Nothing.
+        """
+        self._stages[stage] = {
+            os.path.relpath(file_path, self._processing_path): os.path.getsize(file_path) for file_path in file_paths}
+        staging_file = f"{self._file_path}.tmp"
+        with open(staging_file, "w") as f:
+            json.dump({"configuration": self._configuration, "stages": self._stages}, f, indent=1)
+        os.replace(staging_file, self._file_path)
+
+
+class ModuleOutputArchiver:
+    """
+    Streams module output files into a compressed ZIP archive in a background thread, so that outputs are compressed
+    while the module continues with further years or multiplication factors. Files are compressed with Zstandard if
+    supported by the Python runtime and with Deflate otherwise. The archive is written to a temporary file that
+    replaces an existing archive only when it is closed, so that the archive of a previous run is kept if a run fails.
+    Archived files are only removed once the archive is closed, i.e., after the component read them.
+    """
+
+    def __init__(self, archive_path, root_path):
+        """
+        Initializes a ModuleOutputArchiver and creates the temporary archive.
+
+        Args:
+            archive_path: The file path of the archive.
+            root_path: The directory to which the names of archived files are relative.
+        """
+        import concurrent.futures
+        self._root_path = root_path
+        self._archive_path = archive_path
+        self._archive = zipfile.ZipFile(
+            f"{archive_path}.partial", "w", getattr(zipfile, "ZIP_ZSTANDARD", zipfile.ZIP_DEFLATED), allowZip64=True)
+        self._executor = concurrent.futures.ThreadPoolExecutor(1)
+        self._futures = []
+        self._paths = []
+
+    def add(self, path):
+        """
+        Schedules the archiving of a file or of all files within a directory.
+
+        Args:
+            path: The path of the file or directory.
+
+        Returns:
+            Nothing.
+        """
+        self._paths.append(path)
+        self._futures.append(self._executor.submit(self._write, path))
+
+    def _write(self, path):
+        """
+        Writes a file or all files within a directory into the archive.
+
+        Args:
+            path: The path of the file or directory.
+
+        Returns:
+            Nothing.
+        """
+        if os.path.isfile(path):
+            file_paths = [path]
+        else:
+            file_paths = sorted(
+                os.path.join(directory, file_name)
+                for directory, _, file_names in os.walk(path)
+                for file_name in file_names
+            )
+        for file_path in file_paths:
+            self._archive.write(file_path, os.path.relpath(file_path, self._root_path).replace(os.sep, "/"))
+
+    def close(self, remove=True, discard=False):
+        """
+        Waits for all scheduled files to be archived, closes the archive and moves it into place. If archiving
+        failed, the temporary archive is discarded.
+
+        Args:
+            remove: Specifies whether the archived files and directories are removed.
+            discard: Specifies whether the temporary archive is discarded instead of replacing an existing archive,
+                e.g., if the run failed.
+
+        Returns:
+            Nothing.
+        """
+        try:
+            for future in self._futures:
+                future.result()
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            self._executor.shutdown()
+            self._archive.close()
+            if discard:
+                os.remove(f"{self._archive_path}.partial")
+            else:
+                os.replace(f"{self._archive_path}.partial", self._archive_path)
+        if remove:
+            for path in self._paths:
+                remove_path(path)
+
+
+class ModuleOutputArchive:
+    """
+    Random access to the module output files archived by a component run with `ArchiveModuleOutputs`. The central
+    directory of the archive serves as index, so that individual files are read without unpacking the archive.
+    """
+    FILE_NAME = "module_outputs.zip"
+
+    def __init__(self, archive_path):
+        """
+        Initializes a ModuleOutputArchive.
+
+        Args:
+            archive_path: The file path of the archive or the `ProcessingPath` of the run that created it.
+        """
+        if os.path.isdir(archive_path):
+            archive_path = os.path.join(archive_path, self.FILE_NAME)
+        self._archive = zipfile.ZipFile(archive_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def names(self, pattern="*"):
+        """
+        Lists the archived files.
+
+        Args:
+            pattern: A shell-style pattern that names of listed files match, e.g., `ecotalk/*/x1s2/*_adultMetapop.txt`.
+
+        Returns:
+            A list of names of archived files, relative to the `ProcessingPath` of the run.
+        """
+        return fnmatch.filter(self._archive.namelist(), pattern)
+
+    def open(self, name):
+        """
+        Opens an archived file for reading, e.g., by `numpy.loadtxt`.
+
+        Args:
+            name: The name of the archived file, relative to the `ProcessingPath` of the run.
+
+        Returns:
+            A binary file object decompressing the file while it is read.
+        """
+        return self._archive.open(name)
+
+    def read(self, name):
+        """
+        Reads an archived file.
+
+        Args:
+            name: The name of the archived file, relative to the `ProcessingPath` of the run.
+
+        Returns:
+            The content of the file as bytes.
+        """
+        return self._archive.read(name)
+
+    def close(self):
+        """
+        Closes the archive.
+
+        Returns:
+            Nothing.
+        """
+        self._archive.close()
+
+
+def read_parameter_file(file_path):
+    """
+    Reads a coefficient or control file prepared for the module.
+
+    Args:
+        file_path: The path of the file.
+
+    Returns:
+        A dictionary mapping parameter names to their values as strings.
+    """
+    parameters = {}
+    with open(file_path) as f:
+        for line in f:
+            fields = line.rstrip("\n").split(",")
+            if len(fields) > 1 and fields[0].endswith(":"):
+                parameters[fields[0][:-1]] = fields[1]
+    return parameters
+
+
+class PopulationEngine:
+    """
+    A native implementation of the LPop model using NumPy. Individuals have an abj dynamic energy budget with
+    metabolic acceleration between birth and metamorphosis, simulated daily with rates corrected for the water
+    temperature, and a reduced GUTS model (SD or IT), simulated hourly in sub-hourly steps. Food is not limiting, so
+    that the scaled reserve density equals the scaled functional response. Populations are regulated by
+    density-dependent mortality and connected by the migration of juveniles and adults along the river network.
+    Embryos develop in the reach in which they were produced and are not exposed. The states of all individuals of
+    all reaches are kept in arrays and updated at once. The engine reads the coefficient, control, concentration and
+    water temperature files prepared for the module and writes the population output files of the module.
+    """
+    DEB_PARAMETERS = (
+        "arrhenius_temperature",
+        "reference_temperature",
+        "energy_conductance",
+        "somatic_maintenance_rate",
+        "energy_investment_ratio",
+        "length_at_birth",
+        "length_at_metamorphosis",
+        "length_at_puberty",
+        "embryo_development_time",
+        "maximum_reproduction_rate",
+        "scaled_functional_response",
+        "individual_variation",
+        "initial_adults_per_reach"
+    )
+
+    def __init__(
+            self, model, coefficients, control, data_path, downstream_indices, habitat_areas, deb_parameters):
+        """
+        Initializes a PopulationEngine.
+
+        Args:
+            model: The identifier of the model, `LPopSD` or `LPopIT`.
+            coefficients: The coefficients of the module as read from the coefficient file.
+            control: The control parameters of the module as read from the control file.
+            data_path: The directory of the prepared concentration and water temperature files.
+            downstream_indices: The index of the next downstream reach of each simulated reach or -1 for outlets.
+            habitat_areas: The habitat area of each simulated reach in square meters.
+            deb_parameters: A dictionary of the values of all `DEB_PARAMETERS` of the simulated species. Lengths are
+                structural lengths in centimeters, times are in days, rates refer to the reference temperature in
+                Kelvin.
+        """
+        if model not in ("LPopSD", "LPopIT"):
+            raise ValueError("Unexpected model: " + model)
+        missing_parameters = [name for name in self.DEB_PARAMETERS if name not in deb_parameters]
+        if missing_parameters:
+            raise ValueError(f"Missing DEB parameters: {', '.join(missing_parameters)}")
+        unknown_parameters = [name for name in deb_parameters if name not in self.DEB_PARAMETERS]
+        if unknown_parameters:
+            raise ValueError(f"Unknown DEB parameters: {', '.join(unknown_parameters)}")
+        self._stochastic_death = model == "LPopSD"
+        self._coefficients = {key: float(value) for key, value in coefficients.items()}
+        self._first_year = int(control["startYear"])
+        self._last_year = int(control["endYear"])
+        self._steps_within_hour = int(control["stepsInHr"])
+        self._use_temperature_data = control["useTemperatureData"] == "1"
+        self._data_path = data_path
+        self._downstream_indices = np.asarray(downstream_indices, np.int64)
+        self._habitat_areas = np.asarray(habitat_areas, np.float64)
+        self._deb_parameters = {name: float(value) for name, value in deb_parameters.items()}
+        number_reaches = self._downstream_indices.size
+        inflowing = self._downstream_indices >= 0
+        self._upstream_counts = np.bincount(self._downstream_indices[inflowing], minlength=number_reaches)
+        self._upstream_offsets = np.concatenate(((0,), np.cumsum(self._upstream_counts)[:-1]))
+        self._upstream_indices = np.flatnonzero(inflowing)[
+            np.argsort(self._downstream_indices[inflowing], kind="stable")]
+
+    @classmethod
+    def from_processing_path(cls, processing_path, model, downstream_indices, habitat_areas, deb_parameters):
+        """
+        Creates a PopulationEngine from the module inputs prepared in a processing path.
+
+        Args:
+            processing_path: The working directory of the module.
+            model: The identifier of the model, `LPopSD` or `LPopIT`.
+            downstream_indices: The index of the next downstream reach of each simulated reach or -1 for outlets.
+            habitat_areas: The habitat area of each simulated reach in square meters.
+            deb_parameters: A dictionary of the values of all `DEB_PARAMETERS` of the simulated species.
+
+        Returns:
+            A PopulationEngine.
+        """
+        parameters_path = os.path.join(processing_path, "ETInput", f"{model}ModelSystem", "parameters")
+        # noinspection SpellCheckingInspection
+        return cls(
+            model,
+            read_parameter_file(os.path.join(parameters_path, f"{model}ModelSystem_coefs.csv")),
+            read_parameter_file(os.path.join(parameters_path, f"{model}ModelSystem_control.csv")),
+            os.path.join(processing_path, "ETInput", "CatchmentModelSystem", "data"),
+            downstream_indices,
+            habitat_areas,
+            deb_parameters
+        )
+
+    @property
+    def first_day(self):
+        """The first simulated day."""
+        return datetime.date(self._first_year, 1, 1)
+
+    @property
+    def number_days(self):
+        """The number of simulated days."""
+        return (datetime.date(self._last_year + 1, 1, 1) - self.first_day).days
+
+    def get_temperatures(self):
+        """
+        Gets the daily water temperatures, either from the prepared water temperature file or from the forcing
+        function of the module.
+
+        Returns:
+            An array of water temperatures in degrees Celsius per simulated day.
+        """
+        if self._use_temperature_data:
+            temperatures = np.loadtxt(
+                os.path.join(self._data_path, "water_temperature_101096_1979-2020.csv"),
+                delimiter=",",
+                usecols=1,
+                ndmin=1
+            )
+            if temperatures.size < self.number_days:
+                raise ValueError("Water temperatures do not cover the simulated period")
+            return temperatures[:self.number_days]
+        day_numbers = np.array(
+            [(self.first_day + datetime.timedelta(d)).timetuple().tm_yday for d in range(self.number_days)])
+        # noinspection SpellCheckingInspection
+        return self._coefficients["envTav"] - self._coefficients["envTamp"] * np.cos(
+            2 * np.pi * (day_numbers - self._coefficients["envTminShift"]) / 365)
+
+    def read_concentrations(self, year):
+        """
+        Reads the hourly concentrations prepared for a year.
+
+        Args:
+            year: The year.
+
+        Returns:
+            An array of concentrations per hour of the year and reach or `None` if there is no exposure in the year.
+        """
+        # noinspection SpellCheckingInspection
+        file_path = os.path.join(self._data_path, f"rummen_{year}.msgpack")
+        if not os.path.isfile(file_path):
+            return None
+        with open(file_path, "rb") as f:
+            concentrations = np.array(msgpack.unpack(f), np.float32)
+        number_hours = (datetime.date(year + 1, 1, 1) - datetime.date(year, 1, 1)).days * 24
+        return np.ascontiguousarray(concentrations[:, 1:number_hours + 1].T) * np.float32(
+            self._coefficients["conversionToGutsFactor"])
+
+    def draw_thresholds(self, rng, number):
+        """
+        Draws individual thresholds of the GUTS-IT model from a log-logistic distribution.
+
+        Args:
+            rng: The random number generator.
+            number: The number of thresholds.
+
+        Returns:
+            An array of thresholds or zeros for the GUTS-SD model.
+        """
+        if self._stochastic_death:
+            return np.zeros(number)
+        u = rng.random(number)
+        return self._coefficients["m"] * (u / (1 - u)) ** (1 / self._coefficients["beta"])
+
+    def create_individuals(self, rng, reaches, stage, lengths, buffers):
+        """
+        Creates the states of new individuals.
+
+        Args:
+            rng: The random number generator.
+            reaches: The indices of the reaches of the individuals.
+            stage: The stage of the individuals, 0 for embryos, 1 for juveniles and 2 for adults.
+            lengths: The structural lengths of individuals of average size.
+            buffers: The reproduction buffers of the individuals.
+
+        Returns:
+            A dictionary of state arrays.
+        """
+        size_factors = rng.lognormal(0, self._deb_parameters["individual_variation"], reaches.size)
+        return {
+            "reach": reaches,
+            "stage": np.full(reaches.size, stage, np.int8),
+            "length": lengths * size_factors,
+            "size_factor": size_factors,
+            "buffer": buffers,
+            "embryo_age": np.zeros(reaches.size),
+            "damage": np.zeros(reaches.size),
+            "threshold": self.draw_thresholds(rng, reaches.size)
+        }
+
+    def expose(self, state, mobile, exposure, survival):
+        """
+        Simulates the GUTS damage of juveniles and adults during a day. Damage is simulated in sub-hourly steps only
+        for individuals in exposed reaches and, for GUTS-SD, individuals whose damage exceeds the threshold, while
+        the damage of all other individuals decays exponentially.
+
+        Args:
+            state: The states of the individuals.
+            mobile: A mask of juveniles and adults.
+            exposure: The hourly concentrations of the day per reach or `None` if there is no exposure.
+            survival: The daily survival probabilities of the individuals, updated in place.
+
+        Returns:
+            Nothing.
+        """
+        c = self._coefficients
+        individuals = np.flatnonzero(mobile)
+        reaches = state["reach"][individuals]
+        damage = state["damage"][individuals]
+        if exposure is None:
+            stepped = np.zeros(individuals.size, bool)
+        else:
+            stepped = exposure.any(0)[reaches]
+        if self._stochastic_death:
+            stepped |= damage > c["z"]
+        state["damage"][individuals[~stepped]] = damage[~stepped] * np.exp(-c["kd"])
+        survival[individuals] *= np.exp(-c["hb"])
+        if not stepped.any():
+            return
+        individuals = individuals[stepped]
+        reaches = reaches[stepped]
+        damage = damage[stepped]
+        time_step = 1 / (24 * self._steps_within_hour)
+        damage_decay = np.exp(-c["kd"] * time_step)
+        hazard = np.zeros(damage.size)
+        peak = damage.copy()
+        for h in range(24):
+            concentration = 0. if exposure is None else exposure[h, reaches]
+            for _ in range(self._steps_within_hour):
+                damage = concentration + (damage - concentration) * damage_decay
+                if self._stochastic_death:
+                    hazard += np.maximum(damage - c["z"], 0)
+                else:
+                    np.maximum(peak, damage, peak)
+        state["damage"][individuals] = damage
+        if self._stochastic_death:
+            survival[individuals] *= np.exp(-c["b"] * hazard * time_step)
+        else:
+            survival[individuals] *= peak < state["threshold"][individuals]
+
+    def grow(self, state, mobile, temperature_correction):
+        """
+        Simulates the growth, maturation and reproduction of individuals during a day.
+
+        Args:
+            state: The states of the individuals.
+            mobile: A mask of juveniles and adults.
+            temperature_correction: The factor by which rates are corrected for the water temperature.
+
+        Returns:
+            Nothing.
+        """
+        p = self._deb_parameters
+        f = p["scaled_functional_response"]
+        g = p["energy_investment_ratio"]
+        maximum_length = p["energy_conductance"] / (p["somatic_maintenance_rate"] * g) * state["size_factor"][mobile]
+        maximum_acceleration = p["length_at_metamorphosis"] / p["length_at_birth"]
+        length = state["length"][mobile]
+        acceleration = np.minimum(length / p["length_at_birth"], maximum_acceleration)
+        length += temperature_correction * np.maximum(
+            p["energy_conductance"] * acceleration / (3 * (f + g)) * (f - length / (maximum_length * acceleration)), 0)
+        state["length"][mobile] = length
+        scaled_length = length / (maximum_length * maximum_acceleration)
+        scaled_length_at_puberty = p["length_at_puberty"] / (maximum_length * maximum_acceleration)
+        reproduction_rate = p["maximum_reproduction_rate"] / (1 - scaled_length_at_puberty ** 3) * np.maximum(
+            f / (g + f) * (g + scaled_length) * scaled_length ** 2 - scaled_length_at_puberty ** 3, 0)
+        adult = state["stage"][mobile] == 2
+        state["buffer"][np.flatnonzero(mobile)[adult]] += temperature_correction * reproduction_rate[adult]
+        state["stage"][mobile] = np.maximum(state["stage"][mobile], np.where(length >= p["length_at_puberty"], 2, 1))
+        embryos = state["stage"] == 0
+        state["embryo_age"][embryos] += temperature_correction
+        state["stage"][embryos & (state["embryo_age"] >= p["embryo_development_time"])] = 1
+
+    def migrate(self, state, migrating, rng):
+        """
+        Moves migrating individuals to the next downstream reach or to a random upstream reach. Individuals leaving
+        the simulated reaches at outlets are lost, individuals of headwater reaches moving upstream stay.
+
+        Args:
+            state: The states of the individuals.
+            migrating: A mask of migrating individuals.
+            rng: The random number generator.
+
+        Returns:
+            A mask of individuals lost at outlets.
+        """
+        downstream = migrating & (rng.random(migrating.size) < self._coefficients["downStreamProb"])
+        targets = self._downstream_indices[state["reach"][downstream]]
+        lost = np.zeros(migrating.size, bool)
+        lost[np.flatnonzero(downstream)[targets < 0]] = True
+        state["reach"][downstream] = np.maximum(targets, 0)
+        upstream = np.flatnonzero(migrating & ~downstream)
+        origins = state["reach"][upstream]
+        has_upstream = self._upstream_counts[origins] > 0
+        origins = origins[has_upstream]
+        choices = (rng.random(origins.size) * self._upstream_counts[origins]).astype(np.int64)
+        state["reach"][upstream[has_upstream]] = self._upstream_indices[self._upstream_offsets[origins] + choices]
+        return lost
+
+    def simulate(self, multiplication_factor, rng):
+        """
+        Simulates a Monte Carlo run of the population model.
+
+        Args:
+            multiplication_factor: The factor applied to the concentrations.
+            rng: The random number generator of the run.
+
+        Returns:
+            A generator of the numbers of embryos, juveniles and adults per reach for each simulated day.
+        """
+        p = self._deb_parameters
+        c = self._coefficients
+        number_reaches = self._downstream_indices.size
+        temperature_corrections = np.exp(
+            p["arrhenius_temperature"] / p["reference_temperature"] -
+            p["arrhenius_temperature"] / (self.get_temperatures() + 273.15)
+        )
+        maximum_length = p["energy_conductance"] / (p["somatic_maintenance_rate"] * p["energy_investment_ratio"])
+        initial_reaches = np.repeat(np.arange(number_reaches), int(p["initial_adults_per_reach"]))
+        state = self.create_individuals(
+            rng,
+            initial_reaches,
+            2,
+            rng.uniform(
+                p["length_at_puberty"],
+                .9 * maximum_length * p["length_at_metamorphosis"] / p["length_at_birth"],
+                initial_reaches.size
+            ),
+            rng.uniform(0, c["minClutchSize"], initial_reaches.size)
+        )
+        concentrations = None
+        for d in range(self.number_days):
+            day = self.first_day + datetime.timedelta(d)
+            if d == 0 or (day.month == 1 and day.day == 1):
+                concentrations = self.read_concentrations(day.year)
+            hour = (day.timetuple().tm_yday - 1) * 24
+            mobile = state["stage"] > 0
+            survival = np.full(mobile.size, np.exp(-c["backgroundMortality"]))
+            self.expose(
+                state,
+                mobile,
+                None if concentrations is None else concentrations[hour:hour + 24] * multiplication_factor,
+                survival
+            )
+            self.grow(state, mobile, temperature_corrections[d])
+            mobile = state["stage"] > 0
+            density = np.bincount(state["reach"][mobile], minlength=number_reaches) / self._habitat_areas
+            survival[mobile] *= np.exp(-c["muDD"] * density[state["reach"][mobile]])
+            surviving = rng.random(survival.size) < survival
+            surviving &= ~self.migrate(state, mobile & surviving & (rng.random(mobile.size) < c["migrationProb"]), rng)
+            clutches = np.where(
+                surviving & (state["stage"] == 2) & (state["buffer"] >= c["minClutchSize"]),
+                np.floor(state["buffer"]),
+                0
+            ).astype(np.int64)
+            state["buffer"] -= clutches
+            offspring = self.create_individuals(
+                rng,
+                np.repeat(state["reach"], clutches),
+                0,
+                np.full(clutches.sum(), p["length_at_birth"]),
+                np.zeros(clutches.sum())
+            )
+            state = {key: np.concatenate((values[surviving], offspring[key])) for key, values in state.items()}
+            yield np.bincount(
+                state["stage"].astype(np.int64) * number_reaches + state["reach"], minlength=3 * number_reaches
+            ).reshape((3, number_reaches))
+
+    def write_population_outputs(self, factor_path, factor_index, run, multiplication_factor, seed):
+        """
+        Simulates a Monte Carlo run and writes its outputs in the format of the module.
+
+        Args:
+            factor_path: The output directory of the multiplication factor.
+            factor_index: The one-based index of the multiplication factor used in file names.
+            run: The one-based index of the run.
+            multiplication_factor: The factor applied to the concentrations.
+            seed: The seed sequence of the random number generator of the run.
+
+        Returns:
+            Nothing.
+        """
+        os.makedirs(factor_path, exist_ok=True)
+        with contextlib.ExitStack() as stack:
+            files = [
+                stack.enter_context(open(os.path.join(factor_path, file_name.format(factor_index, run)), "w"))
+                for file_name in POPULATION_OUTPUT_FILES
+            ]
+            counts = self.simulate(multiplication_factor, np.random.default_rng(seed))
+            for d, (embryos, juveniles, adults) in enumerate(counts):
+                prefix = f"{d + 1}\t{(self.first_day + datetime.timedelta(d)).isoformat()}\t"
+                juveniles_and_adults = juveniles + adults
+                for f, values in zip(files, (
+                        adults.sum(),
+                        embryos.sum(),
+                        np.count_nonzero(juveniles_and_adults),
+                        juveniles_and_adults.sum(),
+                        juveniles.sum()
+                )):
+                    f.write(f"{prefix}{values}\n")
+                for f, values in zip(files[5:], (adults, embryos, juveniles_and_adults, juveniles)):
+                    f.write(prefix + "\t".join(map(str, values.tolist())) + "\n")
+
+
+def write_population_engine_outputs(engine, factor_path, factor_index, run, multiplication_factor, seed):
+    """
+    Simulates a Monte Carlo run of a population engine and writes its outputs. Used as task of worker processes.
+
+    Args:
+        engine: The population engine.
+        factor_path: The output directory of the multiplication factor.
+        factor_index: The one-based index of the multiplication factor used in file names.
+        run: The one-based index of the run.
+        multiplication_factor: The factor applied to the concentrations.
+        seed: The seed sequence of the random number generator of the run.
+
+    Returns:
+        Nothing.
+    """
+    engine.write_population_outputs(factor_path, factor_index, run, multiplication_factor, seed)
+
+
+def population_statistics_output_specifications(output_name):
+    """
+    Specifies the outputs holding summary statistics of a population output by reach.
+
+    Args:
+        output_name: The name of the population output.
+
+    Returns:
+        A tuple of output specifications.
+    """
+    shape = (
+        """the total number of days in the years at least partly covered by the 
+        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+        the recovery period""",
+        "the number of reaches reported by the [Concentrations](#Concentrations) input",
+        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input"
+    )
+    annual_shape = (
+        """the number of years at least partly covered by the [Concentrations](#Concentrations) input 
+        plus the number of years of the warm-up period plus the number of years of the recovery period""",
+    ) + shape[1:]
+    element_names = (
+        None, "as specified by the `Concentrations` input", "as specified by the `MultiplicationFactors` input")
+    offset = ("the year of the `SimulationStart` input", None, None)
+    geometries = (None, "as specified by the `Concentrations` input", None)
+    return (
+        (
+            base.Output,
+            f"{output_name}Mean",
+            {"scales": "time/day, space/reach, other/factor", "unit": "1"},
+            f"The mean of the `{output_name}` output across Monte Carlo runs. Only reported if the "
+            "`PopulationOutputMode` is `statistics`.",
+            {
+                "type": np.ndarray,
+                "data_type": np.float32,
+                "shape": shape,
+                "chunks": "for fast retrieval of time series",
+                "element_names": element_names,
+                "offset": offset,
+                "geometries": geometries
+            }
+        ),
+        (
+            base.Output,
+            f"{output_name}Quantiles",
+            {"scales": "time/day, space/reach, other/factor, other/quantile", "unit": "1"},
+            f"Quantiles of the `{output_name}` output across Monte Carlo runs. Only reported if the "
+            "`PopulationOutputMode` is `statistics`.",
+            {
+                "type": np.ndarray,
+                "data_type": np.float32,
+                "shape": shape + ("the number of items in the `PopulationStatisticsQuantiles` input",),
+                "chunks": "for fast retrieval of time series",
+                "element_names": element_names + ("the `PopulationQuantiles` output",),
+                "offset": offset + (None,),
+                "geometries": geometries + (None,)
+            }
+        ),
+        (
+            base.Output,
+            f"{output_name}AnnualMinimum",
+            {"scales": "time/year, space/reach, other/factor", "unit": "1"},
+            f"The smallest daily value of the `{output_name}` output within a year across all Monte Carlo "
+            "runs. Only reported if the `PopulationOutputMode` is `statistics`.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": annual_shape,
+                "chunks": "for allowing compression (only one chunk per factor used)",
+                "element_names": element_names,
+                "offset": offset,
+                "geometries": geometries
+            }
+        ),
+        (
+            base.Output,
+            f"{output_name}AnnualMaximum",
+            {"scales": "time/year, space/reach, other/factor", "unit": "1"},
+            f"The largest daily value of the `{output_name}` output within a year across all Monte Carlo runs. "
+            "Only reported if the `PopulationOutputMode` is `statistics`.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": annual_shape,
+                "chunks": "for allowing compression (only one chunk per factor used)",
+                "element_names": element_names,
+                "offset": offset,
+                "geometries": geometries
+            }
+        )
+    )
+
+
+def population_sparse_output_specifications(output_name):
+    """
+    Specifies the outputs holding the sparse encoding of a population output by reach.
+
+    Args:
+        output_name: The name of the population output.
+
+    Returns:
+        A tuple of output specifications.
+    """
+    return (
+        (
+            base.Output,
+            f"{output_name}Spans",
+            {"scales": "space/reach, other/factor, other/runs, other/span", "unit": None},
+            f"The spans of the `{output_name}` time series between their first and last non-zero value. Along "
+            "the last axis, the first day of the span (relative to the first simulated day), the number of days "
+            f"and the offset of the span's values in the `{output_name}Values` output are given. Only reported "
+            "if the `PopulationOutputMode` is `sparse`.",
+            {
+                "type": np.ndarray,
+                "data_type": np.int64,
+                "shape": (
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`",
+                    "3"
+                ),
+                "chunks": "for allowing compression (only one chunk used)",
+                "element_names": (
+                    "as specified by the `Concentrations` input",
+                    "as specified by the `MultiplicationFactors` input",
+                    None,
+                    None
+                ),
+                "geometries": ("as specified by the `Concentrations` input", None, None, None)
+            }
+        ),
+        (
+            base.Output,
+            f"{output_name}Values",
+            {"scales": "other/value", "unit": "1"},
+            f"The values within the spans of the `{output_name}Spans` output. Only reported if the "
+            "`PopulationOutputMode` is `sparse`.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": ("the total number of days of all spans",),
+                "chunks": "for fast retrieval of contiguous ranges"
+            }
+        )
+    )
+
+
+class LEffectModel(base.Component):
+    """
+    Encapsulation of the LEffectModel module as a Landscape Model component. The module provides two models: LGUTS and
+    LPop. LGUTS is a reduced GUTS model at catchment scale. It has two variants: GUTS-RED-IT, a reduced GUTS model
+    version with Individual Tolerance, and GUTS-RED-SD, a reduced GUTS version with Stochastic Death. LPop is a
+    DEB-based population model at catchment scale, parameterized for Asellus aquaticus. It makes use of the
+    GUTS- RED-IT or GUTS-RED-SD models. There is also an Abj-DEB version with population regulation through
+    density-dependent mortality.
+    """
+    # RELEASES
+    VERSION = base.VersionCollection(
+        base.VersionInfo("2.2.0", "2026-10-19"),
+        base.VersionInfo("2.1.6", "2023-09-20"),
+        base.VersionInfo("2.1.5", "2023-09-18"),
+        base.VersionInfo("2.1.4", "2023-09-13"),
+        base.VersionInfo("2.1.3", "2023-09-12"),
+        base.VersionInfo("2.1.2", "2023-09-11"),
+        base.VersionInfo("2.1.1", "2023-03-09"),
+        base.VersionInfo("2.1.0", "2022-03-08"),
+        base.VersionInfo("2.0.14", "2021-12-10"),
+        base.VersionInfo("2.0.13", "2021-11-18"),
+        base.VersionInfo("2.0.12", "2021-10-12"),
+        base.VersionInfo("2.0.11", "2021-10-11"),
+        base.VersionInfo("2.0.10", "2021-09-17"),
+        base.VersionInfo("2.0.9", "2021-08-18"),
+        base.VersionInfo("2.0.8", "2021-08-16"),
+        base.VersionInfo("2.0.7", "2021-08-05"),
+        base.VersionInfo("2.0.6", "2021-07-21"),
+        base.VersionInfo("2.0.5", "2021-07-16"),
+        base.VersionInfo("2.0.4", "2021-02-02"),
+        base.VersionInfo("2.0.3", "2021-01-23"),
+        base.VersionInfo("2.0.2", "2020-12-09"),
+        base.VersionInfo("2.0.1", "2020-12-03"),
+        base.VersionInfo("2.0.0", "2020-10-22"),
+        base.VersionInfo("1.4.0", "2020-10-23"),
+        base.VersionInfo("1.3.35", "2020-08-12"),
+        base.VersionInfo("1.3.34", "2020-08-04"),
+        base.VersionInfo("1.3.33", "2020-07-30"),
+        base.VersionInfo("1.3.30", "2020-06-22"),
+        base.VersionInfo("1.3.29", "2020-06-15"),
+        base.VersionInfo("1.3.27", "2020-05-20"),
+        base.VersionInfo("1.3.24", "2020-04-02"),
+        base.VersionInfo("1.3.18", "2020-03-12"),
+        base.VersionInfo("1.3.14", "2020-02-07"),
+        base.VersionInfo("1.3.13", "2020-02-07"),
+        base.VersionInfo("1.3.11", "2020-01-27"),
+        base.VersionInfo("1.3.10", "2020-01-23"),
+        base.VersionInfo("1.3.9", "2020-02-24"),
+        base.VersionInfo("1.3.8", "2020-01-14"),
+        base.VersionInfo("1.2.37", None),
+        base.VersionInfo("1.2.5", None)
+    )
+
+    # AUTHORS
+    VERSION.authors.extend((
+        "Sascha Bub (component) - sascha.bub@gmx.de",
+        "Thorsten Schad (component) - thorsten.schad@bayer.com",
+        "Hans Baveco (module) - hans.baveco@wur.nl"
+    ))
+
+    # ACKNOWLEDGEMENTS
+    VERSION.acknowledgements.extend((
+        "[MessagePack](https://msgpack.org)",
+        "[NumPy](https://numpy.org)"
+    ))
+
+    # ROADMAP
+    VERSION.roadmap.extend((
+        """Start module GUI in background 
+        ([#2](https://gitlab.bayer.com/aqrisk-landscape/leffectmodel-component/-/issues/2))""",
+        "Numbering of reaches ([#4](https://gitlab.bayer.com/aqrisk-landscape/leffectmodel-component/-/issues/4))"
+    ))
+
+    # CHANGELOG
+    # noinspection SpellCheckingInspection
+    VERSION.added("1.2.5", "`components.Lguts` component")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.2.5", "`components.Lguts` updated")
+    # noinspection SpellCheckingInspection
+    VERSION.fixed("1.3.8", "Fix of `components.Lguts` concentration input for large sets of concentrations")
+    # noinspection SpellCheckingInspection
+    VERSION.fixed("1.3.9", "Update of `components.Lguts` to fit temporal output scale of module")
+    # noinspection SpellCheckingInspection
+    VERSION.fixed("1.3.10", "`components.Lguts` for single-year runs")
+    # noinspection SpellCheckingInspection
+    VERSION.fixed("1.3.11", "`components.Lguts` temporal referencing")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.3.13", "Margin of Safety outputs from `components.Lguts` added")
+    # noinspection SpellCheckingInspection
+    VERSION.fixed("1.3.14", "`components.Lguts` error introduced during re-factory")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.3.18", "Storage of individual survival for all multiplication factors in `components.Lguts` ")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.3.24", "`components.Lguts` uses base function to call module")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.3.27", "`components.Lguts` specifies scales")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.3.29", "Input slicing in `components.Lguts`")
+    # noinspection SpellCheckingInspection
+    VERSION.fixed("1.3.30", "`components.Lguts` GUTS-SD parameterization")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.3.33", "`components.Lguts` checks input types strictly")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.3.33", "`components.Lguts` checks for physical units")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.3.33", "`components.Lguts` checks for scales")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.3.34", "`components.Lguts` renamed to `components.LgutsRed` ")
+    # noinspection SpellCheckingInspection
+    VERSION.fixed("1.3.34", "Physical units of killing rate in `components.LgutsRed` ")
+    # noinspection SpellCheckingInspection
+    VERSION.fixed("1.3.35", "`components.LgutsRed` output scale")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.4.0", "`components.LgutsRed` renamed to `LEffectModel` ")
+    # noinspection SpellCheckingInspection
+    VERSION.changed("1.4.0", "`components.LgutsRed` uses new LEffectModel module")
+    VERSION.changed("2.0.0", "First independent release")
+    VERSION.added("2.0.1", "Changelog and release history")
+    VERSION.changed("2.0.2", "Module updated to version 20201208")
+    VERSION.changed("2.0.3", "`ReachListHydrography` expects list of identifiers now, no longer file name")
+    VERSION.fixed("2.0.3", "Determination of last year of simulation and application")
+    VERSION.changed("2.0.4", "Module updated to version 20210127")
+    VERSION.changed("2.0.5", "Markdown in changelog")
+    VERSION.changed("2.0.5", "Proofreading")
+    VERSION.fixed("2.0.5", "Data type access")
+    VERSION.added("2.0.6", "`NumberRuns` input")
+    VERSION.changed("2.0.6", "Output scales to cover internal Monte Carlo runs")
+    VERSION.added("2.0.7", "`Reaches` output")
+    VERSION.fixed("2.0.8", "Temporal scale of some outputs")
+    VERSION.added("2.0.9", "Base documentation")
+    VERSION.changed("2.0.10", "Make use of generic types for class attributes")
+    VERSION.changed("2.0.11", "Replaced legacy format strings by f-strings")
+    VERSION.changed("2.0.12", "Switched to Google docstring style")
+    VERSION.changed("2.0.13", "Removed reach inputs and output")
+    VERSION.changed("2.0.13", "Scale of multiplication factors from `global` to `other/factor` ")
+    VERSION.changed("2.0.13", "Reports element names of outputs")
+    VERSION.changed("2.0.14", "Specifies offset of outputs")
+    VERSION.changed("2.1.0", "Module updated to version 20211111")
+    VERSION.changed("2.1.1", "Module updated to version 20211111-1")
+    VERSION.added("2.1.2", "Information on runtime environment")
+    VERSION.changed("2.1.3", "Extended module information for Squeak runtime environment")
+    VERSION.added("2.1.3", "Creation of repository info during documentation")
+    VERSION.added("2.1.3", "Repository info, changelog, contributing note and readme to module")
+    VERSION.changed("2.1.4", "Spatial scale of `Concentrations` input")
+    VERSION.added("2.1.4", "Unit attribute to `Verbosity` input")
+    VERSION.changed("2.1.4", "Spatial scales of outputs")
+    VERSION.changed("2.1.5", "Updated component description")
+    VERSION.changed("2.1.5", "Updated input descriptions and removed stub descriptions")
+    VERSION.added("2.1.5", "Runtime note regarding removal of SimulationStart input")
+    VERSION.added("2.1.6", "Extended output descriptions")
+    VERSION.added("2.1.6", "Outputs with scale space/reach report geometries")
+    VERSION.added("2.2.0", "`RuntimeTemplatePath` input and linking of runtime files instead of copying them")
+    VERSION.added("2.2.0", "`PopulationDataType` input and compact integer data types of population outputs")
+    VERSION.changed("2.2.0", "Bulk parsing of population output files")
+    VERSION.added("2.2.0", "`PopulationOutputMode` input and summary statistics of population outputs by reach")
+    VERSION.added("2.2.0", "Sparse encoding of population outputs by reach")
+    VERSION.added("2.2.0", "`DeferPopulationOutputs` input and on-demand ingestion of population outputs")
+    VERSION.added("2.2.0", "`NumberWorkers` input and parallel reading of population outputs")
+    VERSION.added("2.2.0", "`SurvivalDataType` input and bulk parallel reading of GUTS survival outputs")
+    VERSION.added("2.2.0", "`MemoryMappedIngestion` input for out-of-core ingestion of population outputs by reach")
+    VERSION.added("2.2.0", "`RuntimeStatistics` output and phase-level resource usage messages")
+    VERSION.added("2.2.0", "`RuntimeStatisticsPhases` and `RuntimeStatisticsMetrics` outputs naming runtime statistics")
+    VERSION.added("2.2.0", "`ProgressInterval` and `StallTimeout` inputs for monitoring module runs")
+    VERSION.added("2.2.0", "`ReachListCachePath` input for reusing reach list shapefiles")
+    VERSION.changed("2.2.0", "Reach list written in a single layer transaction and GDAL imported on demand")
+    VERSION.added("2.2.0", "`PreparedInputCachePath` input for reusing prepared concentrations and temperatures")
+    VERSION.added("2.2.0", "`run_parameter_sweep` method for running GUTS parameter sets in a single module session")
+    VERSION.added("2.2.0", "`Resume` input and manifest of completed stages for resuming interrupted runs")
+    VERSION.added("2.2.0", "`NumberReachPartitions` input for concurrent LGUTS runs on partitions of reaches")
+    VERSION.added("2.2.0", "`run_async` method running the module as an asynchronous subprocess")
+    VERSION.changed("2.2.0", "Input and output specifications shared by instances and bound on first access")
+    VERSION.added("2.2.0", "`ReachesOfInterest`, `FirstYearOfInterest` and `LastYearOfInterest` inputs")
+    VERSION.added("2.2.0", "`DownstreamReaches` input and `SimulatedReaches` and `SimulatedReachGeometries` outputs")
+    VERSION.added(
+        "2.2.0",
+        "Native population engine and `PopulationEngine`, `HabitatAreas`, `RandomSeed` and `DebParameters` inputs"
+    )
+    VERSION.added("2.2.0", "`GutsSurvivalReachesPerDay` output ingesting daily survival if `Verbosity` is `1`")
+    VERSION.changed("2.2.0", "Module runs headless in the console virtual machine or a native `VirtualMachine`")
+    VERSION.added("2.2.0", "`ProcessorAffinity` and `ProcessNiceness` inputs for module processes")
+    VERSION.added("2.2.0", "`LP10`, `LP50` and `DoseResponseConverged` outputs of fitted dose-response curves")
+    VERSION.added("2.2.0", "`Models` input for concurrent runs of several models on the same exposure")
+    VERSION.added("2.2.0", "`ArchiveModuleOutputs` input and background archiving of module output files")
+
+    MODULE = base.Module(
+        "LEffectModel",
+        "20211111-1",
+        "module",
+        r"\module\doc\LEffectModel_Manual_20211111.pdf",
+        base.Module(
+            "Squeak",
+            "5.3",
+            "module",
+            "https://squeak.org/",
+            None,
+            True,
+            "module/release-notes/README"
+        )
+    )
+
+    INPUT_SPECIFICATIONS = (
+        (
+            "ProcessingPath",
+            (attrib.Class(str), attrib.Unit(None), attrib.Scales("global")),
+            "The working directory for the module. It is used for all files prepared as module inputs "
+            " or generated as (temporary) module outputs."
+        ),
+        (
+            "Model",
+            (
+                attrib.Class(str),
+                attrib.Unit(None),
+                attrib.Scales("global"),
+                attrib.InList(MODELS)
+            ),
+            "Specifies the model that is applied to the input data. This can either be an individual "
+            "based GUTS model (choices starting with `CatchmentGUTS`) or a population based effect "
+            "model (choices starting with `LPop`). The choice of model also determines whether a"
+            "stochastic death version (choices ending with `SD`) or an individual tolerance version "
+            "(choices ending with `IT`) is used. Ignored if the `Models` input is specified."
+        ),
+        (
+            "MinimumClutchSize",
+            (attrib.Class(int), attrib.Unit("1"), attrib.Scales("global")),
+            "Used by population models."
+        ),
+        (
+            "BackgroundMortalityRate",
+            (attrib.Class(float), attrib.Unit("1/d"), attrib.Scales("global")),
+            "Used by population models."
+        ),
+        (
+            "DensityDependentMortalityRate",
+            (attrib.Class(float), attrib.Unit("m²/d"), attrib.Scales("global")),
+            "Used by population models."
+        ),
+        (
+            "DominantRateConstant",
+            (attrib.Class(float), attrib.Unit("1/d"), attrib.Scales("global")),
+            "Used by all models."
+        ),
+        (
+            "BackgroundHazardRate",
+            (attrib.Class(float), attrib.Unit("1/d"), attrib.Scales("global")),
+            "Used by all models."
+        ),
+        (
+            "ParameterZOfSDModel",
+            (attrib.Class(float), attrib.Unit("ng/l"), attrib.Scales("global")),
+            "Used by stochastic death models."
+        ),
+        (
+            "ParameterBOfSDModel",
+            (attrib.Class(float), attrib.Unit("l/(ng*d)"), attrib.Scales("global")),
+            "Used by stochastic death models."
+        ),
+        (
+            "ThresholdOfITModel",
+            (attrib.Class(float), attrib.Unit("ng/l"), attrib.Scales("global")),
+            "Used by individual tolerance models."
+        ),
+        (
+            "BetaOfITModel",
+            (attrib.Class(float), attrib.Unit("1"), attrib.Scales("global")),
+            "Used by individual tolerance models."
+        ),
+        (
+            "AverageTemperatureParameterOfForcingFunction",
+            (attrib.Class(float), attrib.Unit("°C"), attrib.Scales("global")),
+            "Used by population models."
+        ),
+        (
+            "AmplitudeTemperatureFluctuationsParameter",
+            (attrib.Class(float), attrib.Unit("°C"), attrib.Scales("global")),
+            "Used by population models."
+        ),
+        (
+            "ShiftForwardOfDayNumberWithLowestTemperature",
+            (attrib.Class(int), attrib.Unit("d"), attrib.Scales("global")),
+            "Used by population models."
+        ),
+        (
+            "PerIndividualProbabilityOfMigration",
+            (attrib.Class(float), attrib.Unit("1/d"), attrib.Scales("global")),
+            "Used by population models."
+        ),
+        (
+            "ProbabilityOfAMigratingIndividualToMoveDownstream",
+            (attrib.Class(float), attrib.Unit("1"), attrib.Scales("global")),
+            "Used by population models."
+        ),
+        (
+            "SimulationStart",
+            (attrib.Class(datetime.date), attrib.Unit(None), attrib.Scales("global")),
+            "The first time step for which concentration input data is provided. This input also "
+            "defines the base year for LEffectModel simulations. Actual simulation starts "
+            "`NumberOfWarmUpYears` earlier and ends `RecoveryPeriodYears` later. This input will be "
+            "removed in a future version of the `LEffectModule` component."
+        ),
+        (
+            "Concentrations",
+            (attrib.Class(np.ndarray), attrib.Unit("ng/l"), attrib.Scales("time/hour, space/reach")),
+            None
+        ),
+        (
+            "NumberOfWarmUpYears",
+            (attrib.Class(int), attrib.Unit("y"), attrib.Scales("global")),
+            None
+        ),
+        (
+            "RecoveryPeriodYears",
+            (attrib.Class(int), attrib.Unit("y"), attrib.Scales("global")),
+            None
+        ),
+        (
+            "NumberOfStepsWithinOneHour",
+            (attrib.Class(int), attrib.Unit("1"), attrib.Scales("global")),
+            None
+        ),
+        (
+            "MultiplicationFactors",
+            (attrib.Class(list[float]), attrib.Unit("1"), attrib.Scales("other/factor")),
+            "To determine LP50 values, the concentration multiplication factor leading to a 50% "
+            "reduction of final survival in the GUTS model, simulations for all reaches are run "
+            "applying a series of multiplication factors to the hourly concentration time series. "
+            "Ideally, the full range from 0 to 100% effect (reduction of survival) should be covered, "
+            "to ensure a reliable LP50 estimation by fitting a dose-response relationship. As a kind "
+            "of brute-force approach, multiplication factors could be set according to a power "
+            "function, e.g., ranging from 2^-10 to 2^15 (1/512 to 16384)."
+        ),
+        (
+            "Verbosity",
+            (attrib.Class(int), attrib.Scales("global"), attrib.Unit(None), attrib.InList((0, 1))),
+            "If set to `1`, survival is reported per day, else only at the end of each simulated year. "
+            "Daily survival is stored in the `GutsSurvivalReachesPerDay` output. Annual survival is "
+            "reported regardless of this input."
+        ),
+        (
+            "NumberRuns",
+            (attrib.Class(int), attrib.Scales("global"), attrib.Unit("1")),
+            None
+        ),
+        (
+            "UseTemperatureInput",
+            (attrib.Class(bool), attrib.Scales("global"), attrib.Unit(None)),
+            "Specifies, whether the empirical water temperature data from the `WaterTemperature` input "
+            "is used or whether this data is ignored and a forcing function is applied, instead."
+        ),
+        (
+            "WaterTemperature",
+            (attrib.Class(np.ndarray), attrib.Scales("time/day"), attrib.Unit("°C")),
+            None
+        ),
+        (
+            "RuntimeTemplatePath",
+            (attrib.Class(str), attrib.Unit(None), attrib.Scales("global")),
+            "An optional directory holding a shared, read-only template of the module's runtime "
+            "files. The template is created once and processing directories link to it instead of "
+            "receiving a copy of the module image. Hardlinks require the template to reside on the "
+            "same volume as the `ProcessingPath`. If not set, the module directory is used as "
+            "template."
+        ),
+        (
+            "ReachListCachePath",
+            (attrib.Class(str), attrib.Unit(None), attrib.Scales("global")),
+            "An optional directory for caching reach list shapefiles. Shapefiles are keyed on the "
+            "sequence of reach identifiers reported by the `Concentrations` input and are only built "
+            "if no shapefile for the same sequence exists. Processing directories link to the cached "
+            "shapefiles."
+        ),
+        (
+            "PreparedInputCachePath",
+            (attrib.Class(str), attrib.Unit(None), attrib.Scales("global")),
+            "An optional directory for caching prepared module inputs. Prepared concentrations "
+            "are keyed on a fingerprint of the content of the `Concentrations` input and the "
+            "`SimulationStart`, prepared water temperatures on a fingerprint of the used "
+            "`WaterTemperature` values. Cached files are linked into the `ProcessingPath`, so that "
+            "runs differing only in module parameters skip the preparation of these inputs."
+        ),
+        (
+            "Resume",
+            (attrib.Class(bool), attrib.Unit(None), attrib.Scales("global")),
+            "If set to `true`, a run in an existing `ProcessingPath` reuses the stages completed by "
+            "a previous, interrupted run with the same configuration. Completed stages are recorded "
+            "in a manifest within the `ProcessingPath` and comprise prepared concentrations, years "
+            "of GUTS runs and multiplication factors of population model runs whose outputs are "
+            "complete for all runs. Only missing stages are recomputed. Stages are only recorded by "
+            "runs with `Resume` set to `true`. Must not be combined with `ArchiveModuleOutputs`. "
+            "Defaults to `false`."
+        ),
+        (
+            "NumberReachPartitions",
+            (attrib.Class(int), attrib.Unit("1"), attrib.Scales("global")),
+            "The number of partitions of reaches that are simulated concurrently by separate "
+            "module instances. Only applies to LGUTS models, as reaches are simulated independently. "
+            "Partitions are balanced by the exposure of their reaches and each partition uses its "
+            "own sub-directory of the `ProcessingPath`. Survival outputs are reported in the original "
+            "order of reaches. Resource usage of concurrent phases is reported as overlapping totals by "
+            "the `RuntimeStatistics` output. Defaults to `1`, i.e., all reaches are simulated by a single "
+            "module instance."
+        ),
+        (
+            "ReachesOfInterest",
+            (attrib.Class(list[int]), attrib.Unit(None), attrib.Scales("other/reach")),
+            "The identifiers of the reaches for which effects are simulated. If specified, only these "
+            "reaches are prepared and simulated and outputs by reach are reported for them, in the order "
+            "of the `Concentrations` input, with the `SimulatedReaches` output holding their identifiers. "
+            "For LPop models, the reaches upstream of the reaches of interest are included as well, as "
+            "populations depend on migration from upstream reaches. Defaults to all reaches."
+        ),
+        (
+            "DownstreamReaches",
+            (attrib.Class(np.ndarray), attrib.Unit(None), attrib.Scales("space/reach")),
+            "The identifier of the next downstream reach of each reach of the `Concentrations` input, or "
+            "an identifier not among the reaches for outlets. Required for selecting `ReachesOfInterest` "
+            "with LPop models and for the `native` `PopulationEngine`."
+        ),
+        (
+            "PopulationEngine",
+            (attrib.Class(str), attrib.Unit(None), attrib.Scales("global"), attrib.InList(("module", "native"))),
+            "The implementation used for simulating LPop models. If set to `module` (the default if the input "
+            "is not connected), the Squeak module is run. If set to `native`, an experimental implementation in "
+            "NumPy simulates the individuals of all reaches at once, with Monte Carlo runs distributed across "
+            "`NumberWorkers` processes. It uses the same coefficients, concentrations and water temperatures as "
+            "the module and writes the same output files, but requires the `DownstreamReaches` input for "
+            "migration, the `DebParameters` input for the energy budget of individuals and the `HabitatAreas` "
+            "input for density-dependent mortality. The native engine is not validated against the module and "
+            "its outputs may differ from those of the validated LPop model."
+        ),
+        (
+            "HabitatAreas",
+            (attrib.Class(np.ndarray), attrib.Unit("m²"), attrib.Scales("space/reach")),
+            "The habitat area of each reach of the `Concentrations` input, used by the `native` "
+            "`PopulationEngine` to derive population densities. Required for the `native` `PopulationEngine`."
+        ),
+        (
+            "RandomSeed",
+            (attrib.Class(int), attrib.Unit(None), attrib.Scales("global")),
+            "The seed from which the random number generators of the Monte Carlo runs of the `native` "
+            "`PopulationEngine` are derived. Runs are reproducible for a given seed. Defaults to a random seed."
+        ),
+        (
+            "DebParameters",
+            (attrib.Class(dict), attrib.Unit(None), attrib.Scales("global")),
+            "The parameters of the energy budget of individuals simulated by the `native` `PopulationEngine`, "
+            "specific to the simulated species. A dictionary of values for `arrhenius_temperature` (K), "
+            "`reference_temperature` (K), `energy_conductance` (cm/d), `somatic_maintenance_rate` (1/d), "
+            "`energy_investment_ratio`, `length_at_birth`, `length_at_metamorphosis` and `length_at_puberty` "
+            "(structural lengths in cm), `embryo_development_time` (d), `maximum_reproduction_rate` (1/d), "
+            "`scaled_functional_response`, `individual_variation` (the standard deviation of the logarithm of "
+            "individual size factors) and `initial_adults_per_reach`. Rates refer to the reference temperature. "
+            "Required for the `native` `PopulationEngine`."
+        ),
+        (
+            "FirstYearOfInterest",
+            (attrib.Class(int), attrib.Unit(None), attrib.Scales("global")),
+            "The first year for which effects are simulated. Concentrations of earlier years are "
+            "neither prepared nor simulated. For LPop models, the warm-up period precedes this year. "
+            "Defaults to the year of the `SimulationStart` input."
+        ),
+        (
+            "LastYearOfInterest",
+            (attrib.Class(int), attrib.Unit(None), attrib.Scales("global")),
+            "The last year for which effects are simulated. Concentrations of later years are neither "
+            "prepared nor simulated. For LPop models, the recovery period follows this year. Defaults "
+            "to the last year covered by the `Concentrations` input."
+        ),
+        (
+            "PopulationDataType",
+            (
+                attrib.Class(str),
+                attrib.Unit(None),
+                attrib.Scales("global"),
+                attrib.InList(("auto", "uint8", "uint16", "uint32", "int32", "int64"))
+            ),
+            "The integer data type used for storing population outputs. If set to `auto`, the "
+            "smallest unsigned integer type that holds all values of an output is used. The range of "
+            "values is tracked while the module outputs are read, so that the values are staged "
+            "before they are stored. Other data types override the automatic choice; values are "
+            "checked during ingestion and an error is raised if they do not fit into the specified "
+            "type. Defaults to `auto`."
+        ),
+        (
+            "PopulationOutputMode",
+            (
+                attrib.Class(str),
+                attrib.Unit(None),
+                attrib.Scales("global"),
+                attrib.InList(("full", "statistics", "sparse"))
+            ),
+            "Specifies how population outputs by reach are stored. If set to `full` (the default "
+            "if the input is not connected), the values of all Monte Carlo runs are stored. If set to "
+            "`statistics`, only summary statistics across runs are computed while reading the module "
+            "outputs and stored in the according `...Mean`, `...Quantiles`, `...AnnualMinimum` and "
+            "`...AnnualMaximum` outputs. Memory and storage needed then no longer depend on the "
+            "`NumberRuns`. If set to `sparse`, each time series is stored as the span between its "
+            "first and last non-zero value in the according `...Spans` and `...Values` outputs. This "
+            "avoids storing the leading and trailing zeros of never colonized reaches and extinct "
+            "local populations. Use the `population_dense_view` function to expand them."
+        ),
+        (
+            "DeferPopulationOutputs",
+            (attrib.Class(bool), attrib.Unit(None), attrib.Scales("global")),
+            "If set to `true`, population outputs are not read at the end of the component run. "
+            "Instead, the locations of the module output files are recorded and the files of a "
+            "multiplication factor and run are only read the first time a consumer requests these "
+            "values. Values that are never requested are never read and remain pending in the store. "
+            "The module output files in the `ProcessingPath` must therefore be kept as long as the "
+            "values may be requested. If "
+            "the `PopulationDataType` is `auto`, `uint32` is used, as values are not known in "
+            "advance. Population outputs by reach are only deferred if the `PopulationOutputMode` is "
+            "`full`. Defaults to `false`."
+        ),
+        (
+            "NumberWorkers",
+            (attrib.Class(int), attrib.Unit("1"), attrib.Scales("global")),
+            "The number of worker processes used to read module output files. Files are parsed in "
+            "parallel into shared memory, while values are written to the store by the component's "
+            "process in a fixed order. Defaults to `1`, i.e., files are read sequentially."
+        ),
+        (
+            "SurvivalDataType",
+            (
+                attrib.Class(str),
+                attrib.Unit(None),
+                attrib.Scales("global"),
+                attrib.InList(("float64", "float32"))
+            ),
+            "The floating point data type used for storing survival outputs. Defaults to "
+            "`float64`. Using `float32` halves memory and storage needs."
+        ),
+        (
+            "MemoryMappedIngestion",
+            (attrib.Class(bool), attrib.Unit(None), attrib.Scales("global")),
+            "If set to `true`, population outputs by reach are collected in a temporary "
+            "memory-mapped file within the `ProcessingPath` before they are written to the store in "
+            "large blocks. This bounds the memory used for large numbers of reaches, factors and runs "
+            "while avoiding many small writes, in particular if the `PopulationDataType` is `auto`, "
+            "where all values of an output are staged before they are stored. Only applies if the "
+            "`PopulationOutputMode` is `full` and outputs are not deferred. Defaults to `false`."
+        ),
+        (
+            "ProgressInterval",
+            (attrib.Class(int), attrib.Unit("s"), attrib.Scales("global")),
+            "The interval in seconds at which the progress of the module is reported to the "
+            "observer. Progress is derived from the module output files of completed runs and "
+            "includes the simulated days per second and an estimate of the remaining time. The "
+            "console output of the module is forwarded to the observer. Defaults to `0`, i.e., the "
+            "module is run without monitoring unless a `StallTimeout` is set."
+        ),
+        (
+            "StallTimeout",
+            (attrib.Class(int), attrib.Unit("s"), attrib.Scales("global")),
+            "The number of seconds after which a module run without any console output and without "
+            "changes of its output files is considered stalled. A stalled module is terminated and "
+            "the component fails. Defaults to `0`, i.e., stalls are not detected."
+        ),
+        (
+            "PopulationStatisticsQuantiles",
+            (attrib.Class(list[float]), attrib.Unit("1"), attrib.Scales("other/quantile")),
+            "The quantiles across Monte Carlo runs reported if the `PopulationOutputMode` is "
+            "`statistics`. Quantiles are estimated with a streaming sketch (P² algorithm) and are "
+            "exact for less than five runs. Defaults to the 5th, 50th and 95th percentile."
+        ),
+        (
+            "VirtualMachine",
+            (attrib.Class(str), attrib.Unit(None), attrib.Scales("global")),
+            "The path of a native Squeak virtual machine, e.g., of the OpenSmalltalk virtual machine on Linux, that "
+            "runs the module image without a display. If not set, the console virtual machine of the module is "
+            "run headless, through Wine on platforms other than Windows."
+        ),
+        (
+            "ProcessorAffinity",
+            (attrib.Class(list[int]), attrib.Unit(None), attrib.Scales("other/processor")),
+            "The indices of the processors on which module processes may run. Concurrent module instances share "
+            "these processors. Applying the affinity requires `psutil` on Windows. Defaults to all processors."
+        ),
+        (
+            "ProcessNiceness",
+            (attrib.Class(int), attrib.Unit(None), attrib.Scales("global")),
+            "The increment of the niceness of module processes. Positive values lower their scheduling "
+            "priority, so that other work on the same machine takes precedence. On Windows, positive and negative "
+            "values select the below and above normal priority class and require `psutil`. Defaults to `0`."
+        ),
+        (
+            "Models",
+            (attrib.Class(list[str]), attrib.Unit(None), attrib.Scales("other/model")),
+            "The models applied to the same input data within a single run, each one of the choices of the "
+            "`Model` input, which is ignored if this input is specified. The models run concurrently, each in a "
+            "sub-directory of the `ProcessingPath` named after the model. Reach lists, concentrations and water "
+            "temperatures are prepared only once for all models. Outputs are namespaced by the model, e.g., "
+            "`CatchmentGUTSIT/GutsSurvivalReaches`."
+        ),
+        (
+            "ArchiveModuleOutputs",
+            (attrib.Class(bool), attrib.Unit(None), attrib.Scales("global")),
+            "If set to `true`, the output files of the module are compressed into the archive "
+            "`module_outputs.zip` within the `ProcessingPath` and removed after they were read. Files are "
+            "archived in the background as soon as the module completed a year or the outputs of a "
+            "multiplication factor are complete. Output files of deferred population outputs are kept. Archived "
+            "files can be read individually with `ModuleOutputArchive`. As archived files are removed, runs "
+            "cannot be resumed from them and `Resume` must not be set. Defaults to `false`."
+        )
+    )
+
+    OUTPUT_SPECIFICATIONS = (
+        (
+            DeferredOutput,
+            "AdultMetaPopulation",
+            {"scales": "time/day, other/factor, other/runs", "unit": "1"},
+            "The total number of all adults.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": (
+                    """the total number of days in the years at least partly covered by the 
+                    [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+                    the recovery period""",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
+                "offset": ("the year of the `SimulationStart` input", None, None)
+            }
+        ),
+        (
+            DeferredOutput,
+            "AdultPopulationByReach",
+            {"scales": "time/day, space/reach, other/factor, other/runs", "unit": "1"},
+            "The number of adults.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": (
+                    """the total number of days in the years at least partly covered by the 
+                    [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+                    the recovery period""",
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (
+                    None,
+                    "as specified by the `Concentrations` input",
+                    "as specified by the `MultiplicationFactors` input",
+                    None
+                ),
+                "offset": ("the year of the `SimulationStart` input", None, None, None),
+                "geometries": (None, "as specified by the `Concentrations` input", None, None)
+            }
+        ),
+        (
+            DeferredOutput,
+            "EmbryoMetaPopulation",
+            {"scales": "time/day, other/factor, other/runs", "unit": "1"},
+            "The total number of all embryos.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": (
+                    """the total number of days in the years at least partly covered by the 
+                    [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+                    the recovery period""",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
+                "offset": ("the year of the `SimulationStart` input", None, None)
+            }
+        ),
+        (
+            DeferredOutput,
+            "EmbryoPopulationByReach",
+            {"scales": "time/day, space/reach, other/factor, other/runs", "unit": "1"},
+            "The number of embryos.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": (
+                    """the total number of days in the years at least partly covered by the 
+                    [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+                    the recovery period""",
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (
+                    None,
+                    "as specified by the `Concentrations` input",
+                    "as specified by the `MultiplicationFactors` input",
+                    None
+                ),
+                "offset": ("the year of the `SimulationStart` input", None, None, None),
+                "geometries": (None, "as specified by the `Concentrations` input", None, None)
+            }
+        ),
+        (
+            DeferredOutput,
+            "ExtantLocalPopulationsMetaPopulation",
+            {"scales": "time/day, other/factor, other/runs", "unit": "1"},
+            "The total number of populations that went extant.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": (
+                    """the total number of days in the years at least partly covered by the 
+                    [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+                    the recovery period""",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
+                "offset": ("the year of the `SimulationStart` input", None, None)
+            }
+        ),
+        (
+            DeferredOutput,
+            "JuvenileAndAdultMetaPopulation",
+            {"scales": "time/day, other/factor, other/runs", "unit": "1"},
+            "The total number of all adults and juveniles combined.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": (
+                    """the total number of days in the years at least partly covered by the 
+                    [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+                    the recovery period""",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
+                "offset": ("the year of the `SimulationStart` input", None, None)
+            }
+        ),
+        (
+            DeferredOutput,
+            "JuvenileAndAdultPopulationByReach",
+            {"scales": "time/day, space/reach, other/factor, other/runs", "unit": "1"},
+            "The number of juveniles and adults combined.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": (
+                    """the total number of days in the years at least partly covered by the 
+                    [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+                    the recovery period""",
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (
+                    None,
+                    "as specified by the `Concentrations` input",
+                    "as specified by the `MultiplicationFactors` input",
+                    None
+                ),
+                "offset": ("the year of the `SimulationStart` input", None, None, None),
+                "geometries": (None, "as specified by the `Concentrations` input", None, None)
+            }
+        ),
+        (
+            DeferredOutput,
+            "JuvenileMetaPopulation",
+            {"scales": "time/day, other/factor, other/runs", "unit": "1"},
+            "The total number of all juveniles.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": (
+                    """the total number of days in the years at least partly covered by the 
+                    [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+                    the recovery period""",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
+                "offset": ("the year of the `SimulationStart` input", None, None)
+            }
+        ),
+        (
+            DeferredOutput,
+            "JuvenilePopulationByReach",
+            {"scales": "time/day, space/reach, other/factor, other/runs", "unit": "1"},
+            "The number of juveniles.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `PopulationDataType` input",
+                "shape": (
+                    """the total number of days in the years at least partly covered by the 
+                    [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
+                    the recovery period""",
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
+                    "the `NumberRuns`"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (
+                    None,
+                    "as specified by the `Concentrations` input",
+                    "as specified by the `MultiplicationFactors` input",
+                    None
+                ),
+                "offset": ("the year of the `SimulationStart` input", None, None, None),
+                "geometries": (None, "as specified by the `Concentrations` input", None, None)
+            }
+        ),
+        (
+            base.Output,
+            "GutsSurvivalReaches",
+            {"scales": "time/year, space/reach, other/factor", "unit": "1"},
+            "The probability of an individual to survive.",
+            {
+                "type": np.ndarray,
+                "data_type": "as specified by the `SurvivalDataType` input",
+                "shape": (
+                    """the number of years at least partly covered by the [Concentrations](#Concentrations) input 
+                    plus the number of years of the warm-up period plus the number of years of the recovery 
+                    period""",
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input"
+                ),
+                "chunks": "for allowing compression (only one chunk used)",
+                "element_names": (
+                    None,
+                    "as specified by the `Concentrations` input",
+                    "as specified by the `MultiplicationFactors` input",
+                ),
+                "offset": ("the year of the `SimulationStart` input", None, None),
+                "geometries": (None, "as specified by the `Concentrations` input", None)
+            }
+        ),
+        (
+            base.Output,
+            "GutsSurvivalReachesPerDay",
+            {"scales": "time/day, space/reach, other/factor", "unit": "1"},
+            "The probability of an individual to survive until the end of each day of the simulated years. Only "
+            "reported for LGUTS models if the `Verbosity` is `1`.",
+            {
+                "type": np.ndarray,
+                "data_type": np.float32,
+                "shape": (
+                    "the number of days of the years at least partly covered by the [Concentrations](#Concentrations) "
+                    "input",
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input",
+                    "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input"
+                ),
+                "chunks": "for fast retrieval of time series",
+                "element_names": (
+                    None,
+                    "as specified by the `Concentrations` input",
+                    "as specified by the `MultiplicationFactors` input",
+                ),
+                "offset": ("the year of the `SimulationStart` input", None, None),
+                "geometries": (None, "as specified by the `Concentrations` input", None)
+            }
+        ),
+        (
+            base.Output,
+            "LP10",
+            {"scales": "time/year, space/reach", "unit": "1"},
+            "The multiplication factor of the `Concentrations` that reduces the survival of an individual by 10% "
+            "relative to the survival without effect of exposure, as estimated by a three-parameter log-logistic "
+            "dose-response curve fitted to the `GutsSurvivalReaches` of each year and reach. Only reported for LGUTS "
+            "models with at least three positive `MultiplicationFactors`. Values below the smallest "
+            "`MultiplicationFactors` are extrapolated. Values are not-a-number if the fit did not converge or if "
+            "no multiplication factor reduced the survival by 10% (right-censored).",
+            {
+                "type": np.ndarray,
+                "data_type": np.float64,
+                "shape": (
+                    "the number of years at least partly covered by the [Concentrations](#Concentrations) input",
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input"
+                ),
+                "chunks": "for allowing compression (only one chunk used)",
+                "element_names": (None, "as specified by the `Concentrations` input"),
+                "offset": ("the year of the `SimulationStart` input", None),
+                "geometries": (None, "as specified by the `Concentrations` input")
+            }
+        ),
+        (
+            base.Output,
+            "LP50",
+            {"scales": "time/year, space/reach", "unit": "1"},
+            "The multiplication factor of the `Concentrations` that reduces the survival of an individual by 50% "
+            "relative to the survival without effect of exposure, as estimated by a three-parameter log-logistic "
+            "dose-response curve fitted to the `GutsSurvivalReaches` of each year and reach. Only reported for LGUTS "
+            "models with at least three positive `MultiplicationFactors`. Values below the smallest "
+            "`MultiplicationFactors` are extrapolated. Values are not-a-number if the fit did not converge or if "
+            "no multiplication factor reduced the survival by 50% (right-censored).",
+            {
+                "type": np.ndarray,
+                "data_type": np.float64,
+                "shape": (
+                    "the number of years at least partly covered by the [Concentrations](#Concentrations) input",
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input"
+                ),
+                "chunks": "for allowing compression (only one chunk used)",
+                "element_names": (None, "as specified by the `Concentrations` input"),
+                "offset": ("the year of the `SimulationStart` input", None),
+                "geometries": (None, "as specified by the `Concentrations` input")
+            }
+        ),
+        (
+            base.Output,
+            "DoseResponseConverged",
+            {"scales": "time/year, space/reach", "unit": None},
+            "Whether the fit of the dose-response curve of a year and reach underlying the `LP10` and `LP50` outputs "
+            "converged. Only reported if the `LP10` and `LP50` outputs are reported.",
+            {
+                "type": np.ndarray,
+                "data_type": np.bool_,
+                "shape": (
+                    "the number of years at least partly covered by the [Concentrations](#Concentrations) input",
+                    "the number of reaches reported by the [Concentrations](#Concentrations) input"
+                ),
+                "chunks": "for allowing compression (only one chunk used)",
+                "element_names": (None, "as specified by the `Concentrations` input"),
+                "offset": ("the year of the `SimulationStart` input", None),
+                "geometries": (None, "as specified by the `Concentrations` input")
+            }
+        ),
+        (
+            base.Output,
+            "SimulatedReaches",
+            {"scales": "space/reach", "unit": None},
+            "The identifiers of the simulated reaches. Only reported if `ReachesOfInterest` are specified, in "
+            "which case outputs by reach refer to these reaches instead of the reaches of the `Concentrations` "
+            "input.",
+            {
+                "type": np.ndarray,
+                "data_type": np.int64,
+                "shape": ("the number of simulated reaches",),
+                "element_names": ("the `SimulatedReaches` output",),
+                "geometries": ("the `SimulatedReachGeometries` output",)
+            }
+        ),
+        (
+            base.Output,
+            "SimulatedReachGeometries",
+            {"scales": "space/reach", "unit": None},
+            "The geometries of the simulated reaches, as reported by the `Concentrations` input. Only reported if "
+            "`ReachesOfInterest` are specified.",
+            {
+                "type": list[bytes],
+                "shape": ("the number of simulated reaches",),
+                "element_names": ("the `SimulatedReaches` output",)
+            }
+        ),
+        (
+            base.Output,
+            "RuntimeStatistics",
+            {"scales": "other/phase, other/metric", "unit": None},
+            "The resource usage of the phases of the component run. Phases are, in this order, "
+            "`prepare_runtime_environment`, `prepare_startup_statements`, `prepare_coefficients`, "
+            "`prepare_reach_list`, `prepare_concentrations`, `prepare_control`, `prepare_water_temperatures`, "
+            "`run_module`, `rename_module_outputs`, `store_results` and `archive_module_outputs`. Metrics are, in "
+            "this order, the number of times a phase was entered, the wall time in seconds, the processor time in "
+            "seconds including the module's process, the peak resident memory of the component's process and "
+            "the module's process during the phase in bytes and the bytes read and written by the component's "
+            "process. Repeated phases are summed up, except for the peak resident memory. Unavailable metrics are "
+            "not-a-number. Phases and metrics are named by the `RuntimeStatisticsPhases` and "
+            "`RuntimeStatisticsMetrics` outputs. Processor time, memory and bytes are read from process-wide "
+            "counters, so that phases running concurrently for `NumberReachPartitions` greater than `1` count "
+            "the resource usage of each other. Their values are overlapping totals, e.g., the processor time of the "
+            "`run_module` phase may exceed the processor time of the component run.",
+            {
+                "type": np.ndarray,
+                "data_type": np.float64,
+                "shape": ("the number of phases", "the number of metrics"),
+                "element_names": ("the `RuntimeStatisticsPhases` output", "the `RuntimeStatisticsMetrics` output")
+            }
+        ),
+        (
+            base.Output,
+            "PopulationQuantiles",
+            {"scales": "other/quantile", "unit": "1"},
+            "The quantiles across Monte Carlo runs reported by the `...PopulationByReachQuantiles` outputs, "
+            "as specified by the `PopulationStatisticsQuantiles` input. Only reported if the "
+            "`PopulationOutputMode` is `statistics`.",
+            {
+                "type": list[float],
+                "shape": ("the number of items in the `PopulationStatisticsQuantiles` input",),
+                "element_names": ("the `PopulationQuantiles` output",)
+            }
+        ),
+        (
+            base.Output,
+            "RuntimeStatisticsPhases",
+            {"scales": "other/phase", "unit": None},
+            "The names of the phases of the `RuntimeStatistics` output.",
+            {
+                "type": list[str],
+                "shape": ("the number of phases",),
+                "element_names": ("the `RuntimeStatisticsPhases` output",)
+            }
+        ),
+        (
+            base.Output,
+            "RuntimeStatisticsMetrics",
+            {"scales": "other/metric", "unit": None},
+            "The names of the metrics of the `RuntimeStatistics` output, i.e., `count`, `wall_time`, `cpu_time`, "
+            "`peak_rss`, `bytes_read` and `bytes_written`.",
+            {
+                "type": list[str],
+                "shape": ("the number of metrics",),
+                "element_names": ("the `RuntimeStatisticsMetrics` output",)
+            }
+        )
+    ) + tuple(
+        specification
+        for population in ("Adult", "Embryo", "JuvenileAndAdult", "Juvenile")
+        for specification in population_statistics_output_specifications(f"{population}PopulationByReach") +
+        population_sparse_output_specifications(f"{population}PopulationByReach")
+    )
+
+    def __init__(self, name, observer, store):
+        """
+        Initializes a LEffectModule component. Inputs and outputs are bound to the class-level specifications on first
+        access.
+
+        Args:
+            name: The name of the component.
+            observer: The default observer of the component.
             store: The default store of the component.
         """
-        super(LEffectModel, self).__init__(name, observer, store)
-        self._module = base.Module(
-            "LEffectModel",
-            "20211111-1",
-            "module",
-            r"\module\doc\LEffectModel_Manual_20211111.pdf",
-            base.Module(
-                "Squeak",
-                "5.3",
-                "module",
-                "https://squeak.org/",
-                None,
-                True,
-                "module/release-notes/README"
+        super(LEffectModel, self).__init__(name, observer, store)
+        self._module = self.MODULE
+        self._default_store = store
+        self._input_container = None
+        self._output_container = None
+        self._concentration_fingerprints = {}
+        if self.default_observer:
+            self.default_observer.write_message(
+                3,
+                "The SimulationStart input will be removed in a future version of the CascadeToxswa component",
+                "The time offset will be retrieved from the metadata of the Concentrations input"
+            )
+
+    @property
+    def _inputs(self):
+        """The inputs of the component, bound to the input specifications on first access."""
+        if self._input_container is None:
+            self._input_container = base.InputContainer(self, [
+                base.Input(name, attributes, self.default_observer, description=description)
+                for name, attributes, description in self.INPUT_SPECIFICATIONS
+            ])
+        return self._input_container
+
+    @_inputs.setter
+    def _inputs(self, inputs):
+        self._input_container = inputs
+
+    @property
+    def _outputs(self):
+        """The outputs of the component, bound to the output specifications on first access."""
+        if self._output_container is None:
+            self._output_container = ModelOutputContainer(
+                self,
+                [
+                    output_type(
+                        name,
+                        self._default_store,
+                        self,
+                        dict(default_attributes),
+                        description,
+                        dict(extension_attributes)
+                    )
+                    for output_type, name, default_attributes, description, extension_attributes in
+                    self.OUTPUT_SPECIFICATIONS
+                ],
+                self.bind_model_output
+            )
+        return self._output_container
+
+    @_outputs.setter
+    def _outputs(self, outputs):
+        self._output_container = outputs
+
+    def bind_model_output(self, name, namespaced_name):
+        """
+        Binds an output of a model of a multi-model run to the specification of the output.
+
+        Args:
+            name: The name of the output as specified.
+            namespaced_name: The name of the output namespaced by the model.
+
+        Returns:
+            The bound output.
+        """
+        for output_type, output_name, default_attributes, description, extension_attributes in \
+                self.OUTPUT_SPECIFICATIONS:
+            if output_name == name:
+                return output_type(
+                    namespaced_name,
+                    self._default_store,
+                    self,
+                    dict(default_attributes),
+                    description,
+                    dict(extension_attributes)
+                )
+        raise KeyError(namespaced_name)
+
+    def run(self):
+        """
+        Runs the component.
+
+        Returns:
+            Nothing.
+        """
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """
+        Runs the component without blocking the event loop. The module is run as an asynchronous subprocess and the
+        preparation of module inputs and the ingestion of module outputs are run in worker threads, so that a host can
+        overlap the runs of many components in a single event loop.
+
+        Returns:
+            Nothing.
+        """
+        models = self._read_optional_input("Models", None)
+        if models:
+            await self.run_models_async(models)
+        else:
+            await self.run_model_async(
+                self.inputs["Model"].read().values, self.inputs["ProcessingPath"].read().values)
+
+    async def run_models_async(self, models):
+        """
+        Runs several models on the same exposure. Each model runs concurrently in a sub-directory of the
+        `ProcessingPath` named after the model and stores its outputs namespaced by the model. Reach lists,
+        concentrations and water temperatures are prepared once in a cache shared by the models, unless the
+        `ReachListCachePath` or `PreparedInputCachePath` inputs specify other caches.
+
+        Args:
+            models: The identifiers of the models.
+
+        Returns:
+            Nothing.
+        """
+        import copy
+        unknown_models = [model for model in models if model not in MODELS]
+        if unknown_models:
+            raise ValueError(f"Unexpected models: {', '.join(unknown_models)}")
+        if len(set(models)) < len(models):
+            raise ValueError("Models must not be listed more than once")
+        processing_path = self.inputs["ProcessingPath"].read().values
+        variants = []
+        for model in models:
+            variant = copy.copy(self)
+            variant._output_container = ModelOutputs(self._outputs, model)
+            variants.append(variant)
+        await asyncio.gather(
+            *(
+                variant.run_model_async(
+                    model, os.path.join(processing_path, model), os.path.join(processing_path, "shared_inputs"))
+                for model, variant in zip(models, variants)
+            )
+        )
+
+    async def run_model_async(self, model, processing_path, shared_cache_path=None):
+        """
+        Runs a single model without blocking the event loop.
+
+        Args:
+            model: The identifier of the model.
+            processing_path: The working directory of the module.
+            shared_cache_path: The directory of a cache of reach lists, concentrations and water temperatures shared
+                with other models, used if the `ReachListCachePath` or `PreparedInputCachePath` inputs are not set.
+
+        Returns:
+            Nothing.
+        """
+        multiplication_factors = self._inputs["MultiplicationFactors"].read().values
+        simulation_start = self.inputs["SimulationStart"].read().values
+        number_of_warm_up_years = self._inputs["NumberOfWarmUpYears"].read().values
+        recovery_period_years = self.inputs["RecoveryPeriodYears"].read().values
+        number_runs = self.inputs["NumberRuns"].read().values if model in ["LPopSD", "LPopIT"] else None
+        statistics = PhaseStatistics(self.default_observer)
+        with statistics.measure("prepare_runtime_environment"):
+            await asyncio.to_thread(
+                self.prepare_runtime_environment, processing_path, self.get_runtime_files(processing_path), model)
+        with statistics.measure("prepare_startup_statements"):
+            await asyncio.to_thread(
+                self.prepare_startup_statements,
+                os.path.join(processing_path, "startup.st"), model, multiplication_factors, number_runs)
+        with statistics.measure("prepare_coefficients"):
+            # noinspection SpellCheckingInspection
+            await asyncio.to_thread(
+                self.prepare_coefficients,
+                os.path.join(
+                    processing_path, "ETInput", f"{model}ModelSystem", "parameters", f"{model}ModelSystem_coefs.csv"),
+                model
+            )
+        time_slices = self.get_time_slices()
+        year_indices = self.get_years_of_interest(time_slices)
+        first_year = simulation_start.year + year_indices.start
+        reach_indices = self.get_reaches_of_interest(model)
+        if reach_indices is None:
+            number_reaches = self._inputs["Concentrations"].describe()["shape"][1]
+        else:
+            number_reaches = len(reach_indices)
+            self.store_simulated_reaches(reach_indices)
+        resume = self._read_optional_input("Resume", False)
+        manifest = ResumeManifest(
+            processing_path,
+            self.get_run_configuration(processing_path, model, time_slices, reach_indices, year_indices)
+        ) if resume else None
+        if self._read_optional_input("ArchiveModuleOutputs", False):
+            if resume:
+                raise ValueError(
+                    "ArchiveModuleOutputs and Resume are mutually exclusive, as archived module outputs are removed")
+            archiver = ModuleOutputArchiver(
+                os.path.join(processing_path, ModuleOutputArchive.FILE_NAME), processing_path)
+        else:
+            archiver = None
+        try:
+            number_reach_partitions = self._read_optional_input("NumberReachPartitions", 1)
+            if number_reach_partitions > 1 and model not in ["CatchmentGUTSSD", "CatchmentGUTSIT"]:
+                raise ValueError("Reach partitions are only supported for LGUTS models")
+            if number_reach_partitions <= 1:
+                await asyncio.to_thread(
+                    self.prepare_exposure,
+                    processing_path,
+                    model,
+                    time_slices,
+                    statistics,
+                    manifest,
+                    resume,
+                    reach_indices,
+                    year_indices,
+                    shared_cache_path
+                )
+            if model in ["LPopSD", "LPopIT"]:
+                with statistics.measure("prepare_control"):
+                    await asyncio.to_thread(
+                        self.prepare_control_population_model,
+                        os.path.join(
+                            processing_path,
+                            "ETInput",
+                            f"{model}ModelSystem",
+                            "parameters",
+                            f"{model}ModelSystem_control.csv"
+                        ),
+                        simulation_start if year_indices.start == 0 else datetime.date(first_year, 1, 1),
+                        number_of_warm_up_years,
+                        recovery_period_years,
+                        len(year_indices)
+                    )
+                if self.inputs["UseTemperatureInput"].read().values:
+                    with statistics.measure("prepare_water_temperatures"):
+                        await asyncio.to_thread(
+                            self.prepare_water_temperatures,
+                            os.path.join(
+                                processing_path,
+                                "ETInput",
+                                "CatchmentModelSystem",
+                                "data",
+                                "water_temperature_101096_1979-2020.csv"
+                            ),
+                            first_year - number_of_warm_up_years,
+                            first_year + len(year_indices) + recovery_period_years,
+                            shared_cache_path
+                        )
+                with statistics.measure("run_module"):
+                    await self.run_population_module(
+                        processing_path,
+                        model,
+                        multiplication_factors,
+                        number_runs,
+                        (
+                                datetime.date(first_year + len(year_indices) + recovery_period_years, 1, 1) -
+                                datetime.date(first_year - number_of_warm_up_years, 1, 1)
+                        ).days,
+                        manifest,
+                        resume,
+                        reach_indices,
+                        archiver
+                    )
+                defer_population_outputs = self._read_optional_input("DeferPopulationOutputs", False)
+                number_workers = self._read_optional_input("NumberWorkers", 1)
+                with statistics.measure("store_results"):
+                    # noinspection SpellCheckingInspection
+                    await asyncio.to_thread(
+                        self.store_results_per_day,
+                        os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS", "x1", "x1s{}"),
+                        {
+                            "x1s{}r{}_adultMetapop.txt": "AdultMetaPopulation",
+                            "x1s{}r{}_embryoMetapop.txt": "EmbryoMetaPopulation",
+                            "x1s{}r{}_extantLocalPopsMetapop.txt": "ExtantLocalPopulationsMetaPopulation",
+                            "x1s{}r{}_juvAndAdultMetapop.txt": "JuvenileAndAdultMetaPopulation",
+                            "x1s{}r{}_juvenileMetapop.txt": "JuvenileMetaPopulation"
+                        },
+                        first_year,
+                        len(year_indices),
+                        number_of_warm_up_years,
+                        recovery_period_years,
+                        len(multiplication_factors),
+                        number_runs,
+                        defer_population_outputs,
+                        number_workers
+                    )
+                # noinspection SpellCheckingInspection
+                population_by_reach_result_set = {
+                    "x1s{}r{}_adultPopByReach.txt": "AdultPopulationByReach",
+                    "x1s{}r{}_embryoPopByReach.txt": "EmbryoPopulationByReach",
+                    "x1s{}r{}_juvAndAdultPopByReach.txt": "JuvenileAndAdultPopulationByReach",
+                    "x1s{}r{}_juvenilePopByReach.txt": "JuvenilePopulationByReach"
+                }
+                population_output_mode = self._read_optional_input("PopulationOutputMode", "full")
+                if population_output_mode == "full":
+                    with statistics.measure("store_results"):
+                        # noinspection SpellCheckingInspection
+                        await asyncio.to_thread(
+                            self.store_results_per_day_and_reach,
+                            os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS", "x1", "x1s{}"),
+                            population_by_reach_result_set,
+                            first_year,
+                            len(year_indices),
+                            number_of_warm_up_years,
+                            recovery_period_years,
+                            number_reaches,
+                            len(multiplication_factors),
+                            number_runs,
+                            defer_population_outputs,
+                            number_workers,
+                            processing_path if self._read_optional_input("MemoryMappedIngestion", False) else None,
+                            reach_indices=reach_indices
+                        )
+                elif population_output_mode == "statistics":
+                    with statistics.measure("store_results"):
+                        # noinspection SpellCheckingInspection
+                        await asyncio.to_thread(
+                            self.store_statistics_per_day_and_reach,
+                            os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS", "x1", "x1s{}"),
+                            population_by_reach_result_set,
+                            first_year,
+                            len(year_indices),
+                            number_of_warm_up_years,
+                            recovery_period_years,
+                            number_reaches,
+                            len(multiplication_factors),
+                            number_runs,
+                            self._read_optional_input("PopulationStatisticsQuantiles", [.05, .5, .95]),
+                            number_workers,
+                            reach_indices
+                        )
+                elif population_output_mode == "sparse":
+                    with statistics.measure("store_results"):
+                        # noinspection SpellCheckingInspection
+                        await asyncio.to_thread(
+                            self.store_sparse_results_per_day_and_reach,
+                            os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS", "x1", "x1s{}"),
+                            population_by_reach_result_set,
+                            first_year,
+                            len(year_indices),
+                            number_of_warm_up_years,
+                            recovery_period_years,
+                            number_reaches,
+                            len(multiplication_factors),
+                            number_runs,
+                            processing_path,
+                            number_workers,
+                            reach_indices
+                        )
+                else:
+                    raise ValueError(f"Unexpected population output mode: {population_output_mode}")
+            elif model in ["CatchmentGUTSSD", "CatchmentGUTSIT"]:
+                if number_reach_partitions > 1:
+                    reach_partitions = self.partition_reaches(number_reach_partitions, reach_indices)
+                    partition_paths = [
+                        os.path.join(processing_path, f"partition_{k}") for k in range(len(reach_partitions))]
+                    partition_manifests = [
+                        await asyncio.to_thread(
+                            self.prepare_partition,
+                            processing_path,
+                            partition_path,
+                            model,
+                            time_slices,
+                            statistics,
+                            resume,
+                            partition_indices,
+                            year_indices,
+                            shared_cache_path
+                        )
+                        for partition_path, partition_indices in zip(partition_paths, reach_partitions)
+                    ]
+                    await asyncio.gather(
+                        *(
+                            self.run_individual_model(
+                                partition_path,
+                                model,
+                                simulation_start,
+                                year_indices,
+                                statistics,
+                                partition_manifest,
+                                resume,
+                                archiver
+                            )
+                            for partition_path, partition_manifest in zip(partition_paths, partition_manifests)
+                        )
+                    )
+                    if reach_indices is not None:
+                        reach_partitions = [
+                            np.searchsorted(reach_indices, partition_indices) for partition_indices in reach_partitions]
+                    # noinspection SpellCheckingInspection
+                    reach_partitions = [
+                        (os.path.join(partition_path, "ecotalk", model + "ModelSystem_MoS_{}", "x1"), partition_indices)
+                        for partition_path, partition_indices in zip(partition_paths, reach_partitions)
+                    ]
+                else:
+                    await self.run_individual_model(
+                        processing_path, model, simulation_start, year_indices, statistics, manifest, resume, archiver)
+                    reach_partitions = None
+                with statistics.measure("store_results"):
+                    # noinspection SpellCheckingInspection
+                    survival = await asyncio.to_thread(
+                        self.store_results_per_year_and_reach,
+                        os.path.join(processing_path, "ecotalk", model + "ModelSystem_MoS_{}", "x1"),
+                        {"guts_survival_reaches.txt_mfactors.txt": "GutsSurvivalReaches"},
+                        len(year_indices),
+                        number_reaches,
+                        len(multiplication_factors),
+                        first_year,
+                        self._read_optional_input("NumberWorkers", 1),
+                        reach_partitions,
+                        reach_indices,
+                        year_indices.start
+                    )
+                    await asyncio.to_thread(
+                        self.store_dose_response,
+                        survival["GutsSurvivalReaches"],
+                        multiplication_factors,
+                        first_year,
+                        reach_indices
+                    )
+                if self._inputs["Verbosity"].read().values == 1:
+                    with statistics.measure("store_results"):
+                        # noinspection SpellCheckingInspection
+                        await asyncio.to_thread(
+                            self.store_daily_survival_per_reach,
+                            os.path.join(processing_path, "ecotalk", model + "ModelSystem_MoS_{}", "x1"),
+                            "x1s{}r1_guts_survival_reaches.txt",
+                            "GutsSurvivalReachesPerDay",
+                            len(year_indices),
+                            number_reaches,
+                            len(multiplication_factors),
+                            first_year,
+                            self._read_optional_input("NumberWorkers", 1),
+                            reach_partitions,
+                            reach_indices,
+                            year_indices.start
+                        )
+            else:
+                raise ValueError("Unexpected model: " + model)
+        except BaseException:
+            if archiver:
+                archiver.close(False, True)
+            raise
+        if archiver:
+            with statistics.measure("archive_module_outputs"):
+                await asyncio.to_thread(
+                    archiver.close,
+                    model not in ["LPopSD", "LPopIT"] or not self._read_optional_input("DeferPopulationOutputs", False)
+                )
+        self.store_runtime_statistics(statistics)
+
+    def store_runtime_statistics(self, statistics):
+        """
+        Stores the resource usage of the phases of the component run along with the names of phases and metrics.
+
+        Args:
+            statistics: The statistics recording the resource usage of the phases.
+
+        Returns:
+            Nothing.
+        """
+        for output_name, names, scale in (
+                ("RuntimeStatisticsPhases", PhaseStatistics.PHASES, "other/phase"),
+                ("RuntimeStatisticsMetrics", PhaseStatistics.METRICS, "other/metric")
+        ):
+            self._outputs[output_name].set_values(
+                list(names), scales=scale, element_names=(self._outputs[output_name],))
+        self._outputs["RuntimeStatistics"].set_values(
+            statistics.values,
+            element_names=(self._outputs["RuntimeStatisticsPhases"], self._outputs["RuntimeStatisticsMetrics"])
+        )
+
+    async def run_individual_model(
+            self, processing_path, model, simulation_start, year_indices, statistics, manifest, resume, archiver=None):
+        """
+        Runs the individual model year by year, renaming the module outputs of each year. File operations are run in
+        worker threads, so that the event loop is not blocked.
+
+        Args:
+            processing_path: The working directory of the module.
+            model: The identifier of the model used.
+            simulation_start: The first day of the simulation.
+            year_indices: The indices of the years to simulate.
+            statistics: The statistics recording the resource usage of the phases.
+            manifest: The manifest of completed stages, or `None` if the run is not resumable.
+            resume: Specifies whether years completed by a previous run are skipped.
+            archiver: An optional archiver to which the module outputs of each year are added once completed.
+
+        Returns:
+            Nothing.
+        """
+        for y in year_indices:
+            # noinspection SpellCheckingInspection
+            survival_file = os.path.join(
+                processing_path,
+                "ecotalk",
+                f"{model}ModelSystem_MoS_{y}",
+                "x1",
+                "guts_survival_reaches.txt_mfactors.txt"
+            )
+            if resume and manifest.is_complete(f"survival_year_{y}"):
+                if self.default_observer:
+                    self.default_observer.write_message(5, f"Resumed with previous module run of year {y}")
+                if archiver:
+                    self.archive_individual_model_year(processing_path, model, y, archiver)
+                continue
+            # noinspection SpellCheckingInspection
+            for stale_file in (
+                    f"{model}ModelSystem_MoS",
+                    f"{model}ModelSystem_MoS.modelscript",
+                    f"{model}ModelSystem_MoS.modelscript.{y}",
+                    f"{model}ModelSystem_MoS_{y}"
+            ):
+                await asyncio.to_thread(remove_path, os.path.join(processing_path, "ecotalk", stale_file))
+            with statistics.measure("prepare_control"):
+                await asyncio.to_thread(
+                    self.prepare_control_individual_model,
+                    os.path.join(
+                        processing_path,
+                        "ETInput",
+                        f"{model}ModelSystem",
+                        "parameters",
+                        f"{model}ModelSystem_control.csv"
+                    ),
+                    simulation_start,
+                    y
+                )
+            with statistics.measure("run_module"):
+                # noinspection SpellCheckingInspection
+                await self.run_module_async(
+                    processing_path,
+                    (
+                        os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS"),
+                        os.path.join(
+                            processing_path,
+                            "ecotalk",
+                            f"{model}ModelSystem_MoS",
+                            "x1",
+                            "guts_survival_reaches.txt_mfactors.txt"
+                        ),
+                        1,
+                        (
+                                datetime.date(simulation_start.year + y + 1, 1, 1) -
+                                datetime.date(simulation_start.year + y, 1, 1)
+                        ).days
+                    )
+                )
+            with statistics.measure("rename_module_outputs"):
+                # noinspection SpellCheckingInspection
+                await asyncio.to_thread(
+                    retry_rename,
+                    os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS.modelscript"),
+                    os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS.modelscript.{y}")
+                )
+                # noinspection SpellCheckingInspection
+                await asyncio.to_thread(
+                    retry_rename,
+                    os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS"),
+                    os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS_{y}")
+                )
+            if manifest:
+                await asyncio.to_thread(manifest.complete, f"survival_year_{y}", [survival_file])
+            if archiver:
+                self.archive_individual_model_year(processing_path, model, y, archiver)
+
+    @staticmethod
+    def archive_individual_model_year(processing_path, model, year_index, archiver):
+        """
+        Adds the renamed module outputs of a year of the individual model to an archive.
+
+        Args:
+            processing_path: The working directory of the module.
+            model: The identifier of the model used.
+            year_index: The index of the year.
+            archiver: The archiver.
+
+        Returns:
+            Nothing.
+        """
+        # noinspection SpellCheckingInspection
+        for file_name in (f"{model}ModelSystem_MoS.modelscript.{year_index}", f"{model}ModelSystem_MoS_{year_index}"):
+            file_path = os.path.join(processing_path, "ecotalk", file_name)
+            if os.path.exists(file_path):
+                archiver.add(file_path)
+
+    def get_run_configuration(self, processing_path, model, time_slices, reach_indices=None, year_indices=None):
+        """
+        Describes the configuration of a run to decide whether completed stages of a previous run can be reused. The
+        content of the inputs determining the prepared module inputs and the module outputs is represented by
+        fingerprints, so that a run with changed input values does not reuse stages of a previous run.
+
+        Args:
+            processing_path: The working directory of the module.
+            model: The identifier of the model used.
+            time_slices: The indices by which input concentrations are sliced.
+            reach_indices: The indices of the simulated reaches if not all reaches are simulated.
+            year_indices: The indices of the simulated years if not all years are simulated.
+
+        Returns:
+            A dictionary describing the configuration.
+        """
+        with open(os.path.join(processing_path, "startup.st"), "rb") as f:
+            statements = hashlib.sha256(f.read()).hexdigest()
+        # noinspection SpellCheckingInspection
+        with open(os.path.join(
+                processing_path, "ETInput", f"{model}ModelSystem", "parameters", f"{model}ModelSystem_coefs.csv"
+        ), "rb") as f:
+            coefficients = hashlib.sha256(f.read()).hexdigest()
+        simulation_start = self.inputs["SimulationStart"].read().values
+        if year_indices is None:
+            year_indices = range(len(time_slices))
+        hour_range = range(
+            0 if year_indices.start == 0 else time_slices[year_indices.start - 1], time_slices[year_indices.stop - 1])
+        configuration = {
+            "model": model,
+            "statements": statements,
+            "coefficients": coefficients,
+            "simulation_start": simulation_start.isoformat(),
+            "time_slices": [int(time_slice) for time_slice in time_slices],
+            "concentrations_shape": [int(x) for x in self._inputs["Concentrations"].describe()["shape"]],
+            "concentrations": self.fingerprint_concentrations(simulation_start, reach_indices, hour_range),
+            "steps_within_hour": int(self._inputs["NumberOfStepsWithinOneHour"].read().values)
+        }
+        if model in ["LPopSD", "LPopIT"]:
+            number_of_warm_up_years = int(self._inputs["NumberOfWarmUpYears"].read().values)
+            recovery_period_years = int(self.inputs["RecoveryPeriodYears"].read().values)
+            configuration["warm_up_years"] = number_of_warm_up_years
+            configuration["recovery_period_years"] = recovery_period_years
+            configuration["use_temperature_input"] = bool(self.inputs["UseTemperatureInput"].read().values)
+            if configuration["use_temperature_input"]:
+                first_year = simulation_start.year + year_indices.start
+                water_temperatures = self.inputs["WaterTemperature"].read(select={"time/day": {
+                    "from": datetime.date(first_year - number_of_warm_up_years, 1, 1),
+                    "to": datetime.date(first_year + len(year_indices) + recovery_period_years + 1, 1, 1)
+                }}).values
+                configuration["water_temperatures"] = hashlib.sha256(
+                    np.ascontiguousarray(water_temperatures, np.float64).tobytes()).hexdigest()
+            configuration["population_engine"] = self._read_optional_input("PopulationEngine", "module")
+            if configuration["population_engine"] == "native":
+                for input_name, key, data_type in (
+                        ("DownstreamReaches", "downstream_reaches", np.int64),
+                        ("HabitatAreas", "habitat_areas", np.float64)
+                ):
+                    values = self._read_optional_input(input_name, None)
+                    configuration[key] = None if values is None else hashlib.sha256(
+                        np.ascontiguousarray(values, data_type).tobytes()).hexdigest()
+                configuration["random_seed"] = self._read_optional_input("RandomSeed", None)
+                deb_parameters = self._read_optional_input("DebParameters", None)
+                configuration["deb_parameters"] = None if deb_parameters is None else {
+                    name: float(value) for name, value in deb_parameters.items()}
+        else:
+            configuration["verbosity"] = int(self._inputs["Verbosity"].read().values)
+        if reach_indices is not None:
+            configuration["reach_indices"] = [int(i) for i in reach_indices]
+        configuration["year_indices"] = [year_indices.start, year_indices.stop]
+        return configuration
+
+    def prepare_exposure(
+            self,
+            processing_path,
+            model,
+            time_slices,
+            statistics,
+            manifest,
+            resume,
+            reach_indices=None,
+            year_indices=None,
+            shared_cache_path=None
+    ):
+        """
+        Prepares the reach list and the input concentrations of a module run.
+
+        Args:
+            processing_path: The working directory of the module.
+            model: The identifier of the model used.
+            time_slices: The indices by which input concentrations are sliced.
+            statistics: The statistics recording the resource usage of the phases.
+            manifest: The manifest of completed stages, or `None` if the run is not resumable.
+            resume: Specifies whether concentrations prepared by a previous run are reused.
+            reach_indices: The indices of the reaches to prepare. All reaches are prepared if not specified.
+            year_indices: The indices of the years to prepare. All years are prepared if not specified.
+            shared_cache_path: The directory of a cache shared with other models, used if the `ReachListCachePath`
+                or `PreparedInputCachePath` inputs are not set.
+
+        Returns:
+            Nothing.
+        """
+        simulation_start = self.inputs["SimulationStart"].read().values
+        if year_indices is None:
+            year_indices = range(len(time_slices))
+        with statistics.measure("prepare_reach_list"):
+            # noinspection SpellCheckingInspection
+            self.prepare_reach_list(
+                os.path.join(
+                    processing_path,
+                    "ETInput",
+                    f"{model}ModelSystem",
+                    "maps",
+                    "shapes",
+                    "reachlist_shp",
+                    "Reachlist_shp.shp"
+                ),
+                reach_indices,
+                shared_cache_path
             )
+        # noinspection SpellCheckingInspection
+        concentration_files = [
+            os.path.join(processing_path, "ETInput", "CatchmentModelSystem", "data", f"rummen_{year}.msgpack")
+            for year in range(simulation_start.year + year_indices.start, simulation_start.year + year_indices.stop)
+        ]
+        if resume and manifest.is_complete("concentrations"):
+            if self.default_observer:
+                self.default_observer.write_message(5, "Resumed with previously prepared concentrations")
+        else:
+            with statistics.measure("prepare_concentrations"):
+                self.prepare_concentrations(
+                    os.path.join(processing_path, "ETInput", "CatchmentModelSystem", "data"),
+                    time_slices,
+                    simulation_start,
+                    reach_indices,
+                    year_indices,
+                    shared_cache_path
+                )
+            if manifest:
+                manifest.complete("concentrations", concentration_files)
+
+    def prepare_partition(
+            self,
+            processing_path,
+            partition_path,
+            model,
+            time_slices,
+            statistics,
+            resume,
+            reach_indices,
+            year_indices=None,
+            shared_cache_path=None
+    ):
+        """
+        Prepares the working directory of a module instance simulating a partition of reaches. The statements and
+        coefficients are taken from the main working directory.
+
+        Args:
+            processing_path: The main working directory of the module.
+            partition_path: The working directory of the partition.
+            model: The identifier of the model used.
+            time_slices: The indices by which input concentrations are sliced.
+            statistics: The statistics recording the resource usage of the phases.
+            resume: Specifies whether stages completed by a previous run are reused.
+            reach_indices: The indices of the reaches of the partition.
+            year_indices: The indices of the simulated years. All years are simulated if not specified.
+            shared_cache_path: The directory of a cache shared with other models, used if the `ReachListCachePath`
+                or `PreparedInputCachePath` inputs are not set.
+
+        Returns:
+            The manifest of completed stages of the partition, or `None` if the run is not resumable.
+        """
+        with statistics.measure("prepare_runtime_environment"):
+            self.prepare_runtime_environment(partition_path, self.get_runtime_files(partition_path), model)
+        # noinspection SpellCheckingInspection
+        for file_name in (
+                "startup.st",
+                os.path.join("ETInput", f"{model}ModelSystem", "parameters", f"{model}ModelSystem_coefs.csv")
+        ):
+            shutil.copyfile(os.path.join(processing_path, file_name), os.path.join(partition_path, file_name))
+        manifest = ResumeManifest(
+            partition_path,
+            self.get_run_configuration(partition_path, model, time_slices, reach_indices, year_indices)
+        ) if resume else None
+        self.prepare_exposure(
+            partition_path,
+            model,
+            time_slices,
+            statistics,
+            manifest,
+            resume,
+            reach_indices,
+            year_indices,
+            shared_cache_path
         )
-        self._inputs = base.InputContainer(self, [
-            base.Input(
-                "ProcessingPath",
-                (attrib.Class(str), attrib.Unit(None), attrib.Scales("global")),
-                self.default_observer,
-                description="The working directory for the module. It is used for all files prepared as module inputs "
-                            " or generated as (temporary) module outputs."
-            ),
-            base.Input(
-                "Model",
+        return manifest
+
+    def partition_reaches(self, number_partitions, reach_indices=None, block_size=8784):
+        """
+        Splits the reaches into partitions of balanced workload. The workload of a reach is estimated as the number
+        of hours with a non-zero concentration plus the number of days, as the module passes quickly through
+        unexposed periods. Reaches are assigned in order of decreasing workload to the partition with the least
+        workload so far.
+
+        Args:
+            number_partitions: The number of partitions.
+            reach_indices: The indices of the reaches to partition. All reaches are partitioned if not specified.
+            block_size: The number of hours read at once.
+
+        Returns:
+            A list of arrays of reach indices, each in the original order of the `Concentrations` input. Empty
+            partitions are omitted.
+        """
+        number_hours, number_reaches = self.inputs["Concentrations"].describe()["shape"][:2]
+        if reach_indices is None:
+            reach_indices = np.arange(number_reaches)
+        workload = np.full(len(reach_indices), number_hours / 24)
+        for i in range(0, number_hours, block_size):
+            values = self.inputs["Concentrations"].read(
+                slices=(slice(i, min(i + block_size, number_hours)), slice(number_reaches))).values
+            workload += np.count_nonzero(values[:, reach_indices], 0)
+        partition_workload = np.zeros(number_partitions)
+        assignment = np.zeros(len(reach_indices), int)
+        for reach_index in np.argsort(-workload, kind="stable"):
+            partition = int(np.argmin(partition_workload))
+            assignment[reach_index] = partition
+            partition_workload[partition] += workload[reach_index]
+        if self.default_observer:
+            self.default_observer.write_message(
+                5,
+                f"Partitioned {len(reach_indices)} reaches with a workload imbalance of "
+                f"{partition_workload.max() / max(partition_workload.mean(), 1e-9):.3f}"
+            )
+        return [
+            reach_indices[assignment == partition]
+            for partition in range(number_partitions)
+            if np.any(assignment == partition)
+        ]
+
+    def record_population_factor(self, model_system_path, multiplication_factor, number_runs, manifest):
+        """
+        Records the outputs of a multiplication factor of a population model run in the manifest if they are complete,
+        i.e., if all output files of all runs exist and end with a complete line.
+
+        Args:
+            model_system_path: The output directory of the population model.
+            multiplication_factor: The index of the multiplication factor, starting at 1.
+            number_runs: The number of runs of the population model.
+            manifest: The manifest of completed stages.
+
+        Returns:
+            A boolean indicating whether the outputs of the multiplication factor are complete.
+        """
+        stage = f"population_factor_{multiplication_factor}"
+        if manifest.is_complete(stage):
+            return True
+        file_paths = population_factor_files(model_system_path, multiplication_factor, number_runs)
+        if file_paths is None:
+            return False
+        manifest.complete(stage, file_paths)
+        return True
+
+    async def run_population_module(
+            self,
+            processing_path,
+            model,
+            multiplication_factors,
+            number_runs,
+            number_days,
+            manifest,
+            resume,
+            reach_indices=None,
+            archiver=None
+    ):
+        """
+        Runs the population model, either by the module or by the native population engine. When resuming, only
+        multiplication factors whose outputs are incomplete are simulated and their outputs are merged with the
+        outputs retained from the previous run. File operations are run in worker threads, so that the event loop is
+        not blocked. If the module runs with an archiver, the outputs of each multiplication factor are added to the
+        archiver as soon as they are complete.
+
+        Args:
+            processing_path: The working directory of the module.
+            model: The identifier of the model used.
+            multiplication_factors: A list of multiplication factors for margin-of-safety analyses.
+            number_runs: The number of runs of the population model.
+            number_days: The number of simulated days.
+            manifest: The manifest of completed stages, or `None` if the run is not resumable.
+            resume: Specifies whether outputs of a previous run are reused.
+            reach_indices: The indices of the simulated reaches if not all reaches are simulated.
+            archiver: An optional archiver to which the outputs of each multiplication factor are added once
+                completed.
+
+        Returns:
+            Nothing.
+        """
+        # noinspection SpellCheckingInspection
+        model_system_path = os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS")
+        archived_factors = set()
+        missing_factors = await asyncio.to_thread(
+            self.prepare_population_module_outputs,
+            processing_path,
+            model_system_path,
+            model,
+            multiplication_factors,
+            number_runs,
+            manifest,
+            resume
+        )
+        if len(missing_factors) == 0:
+            return
+        population_engine = self._read_optional_input("PopulationEngine", "module")
+        if population_engine == "native":
+            if self.default_observer:
+                self.default_observer.write_message(
+                    3,
+                    "The native PopulationEngine is experimental",
+                    "Its outputs are not validated against the LPop model of the module"
+                )
+            await asyncio.to_thread(
+                self.run_population_engine,
+                processing_path,
+                model_system_path,
+                model,
+                multiplication_factors,
+                missing_factors,
+                number_runs,
+                reach_indices
+            )
+        elif population_engine == "module":
+            # noinspection SpellCheckingInspection
+            await self.run_module_async(
+                processing_path,
                 (
-                    attrib.Class(str),
-                    attrib.Unit(None),
-                    attrib.Scales("global"),
-                    attrib.InList(("CatchmentGUTSSD", "CatchmentGUTSIT", "LPopSD", "LPopIT"))
+                    model_system_path,
+                    os.path.join(model_system_path, "x1", "x1s*", "x1s*r*_adultPopByReach.txt"),
+                    len(missing_factors) * number_runs,
+                    number_days
                 ),
-                self.default_observer,
-                description="Specifies the model that is applied to the input data. This can either be an individual "
-                            "based GUTS model (choices starting with `CatchmentGUTS`) or a population based effect "
-                            "model (choices starting with `LPop`). The choice of model also determines whether a"
-                            "stochastic death version (choices ending with `SD`) or an individual tolerance version "
-                            "(choices ending with `IT`) is used."
-            ),
-            base.Input(
-                "MinimumClutchSize",
-                (attrib.Class(int), attrib.Unit("1"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by population models."
-            ),
-            base.Input(
-                "BackgroundMortalityRate",
-                (attrib.Class(float), attrib.Unit("1/d"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by population models."
-            ),
-            base.Input(
-                "DensityDependentMortalityRate",
-                (attrib.Class(float), attrib.Unit("m²/d"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by population models."
-            ),
-            base.Input(
-                "DominantRateConstant",
-                (attrib.Class(float), attrib.Unit("1/d"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by all models."
-            ),
-            base.Input(
-                "BackgroundHazardRate",
-                (attrib.Class(float), attrib.Unit("1/d"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by all models."
-            ),
-            base.Input(
-                "ParameterZOfSDModel",
-                (attrib.Class(float), attrib.Unit("ng/l"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by stochastic death models."
-            ),
-            base.Input(
-                "ParameterBOfSDModel",
-                (attrib.Class(float), attrib.Unit("l/(ng*d)"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by stochastic death models."
-            ),
-            base.Input(
-                "ThresholdOfITModel",
-                (attrib.Class(float), attrib.Unit("ng/l"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by individual tolerance models."
-            ),
-            base.Input(
-                "BetaOfITModel",
-                (attrib.Class(float), attrib.Unit("1"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by individual tolerance models."
-            ),
-            base.Input(
-                "AverageTemperatureParameterOfForcingFunction",
-                (attrib.Class(float), attrib.Unit("°C"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by population models."
-            ),
-            base.Input(
-                "AmplitudeTemperatureFluctuationsParameter",
-                (attrib.Class(float), attrib.Unit("°C"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by population models."
-            ),
-            base.Input(
-                "ShiftForwardOfDayNumberWithLowestTemperature",
-                (attrib.Class(int), attrib.Unit("d"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by population models."
-            ),
-            base.Input(
-                "PerIndividualProbabilityOfMigration",
-                (attrib.Class(float), attrib.Unit("1/d"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by population models."
-            ),
-            base.Input(
-                "ProbabilityOfAMigratingIndividualToMoveDownstream",
-                (attrib.Class(float), attrib.Unit("1"), attrib.Scales("global")),
-                self.default_observer,
-                description="Used by population models."
-            ),
-            base.Input(
-                "SimulationStart",
-                (attrib.Class(datetime.date), attrib.Unit(None), attrib.Scales("global")),
-                self.default_observer,
-                description="The first time step for which concentration input data is provided. This input also "
-                            "defines the base year for LEffectModel simulations. Actual simulation starts "
-                            "`NumberOfWarmUpYears` earlier and ends `RecoveryPeriodYears` later. This input will be "
-                            "removed in a future version of the `LEffectModule` component."
-            ),
-            base.Input(
-                "Concentrations",
-                (attrib.Class(np.ndarray), attrib.Unit("ng/l"), attrib.Scales("time/hour, space/reach")),
-                self.default_observer
-            ),
-            base.Input(
-                "NumberOfWarmUpYears",
-                (attrib.Class(int), attrib.Unit("y"), attrib.Scales("global")),
-                self.default_observer
-            ),
-            base.Input(
-                "RecoveryPeriodYears",
-                (attrib.Class(int), attrib.Unit("y"), attrib.Scales("global")),
-                self.default_observer
-            ),
-            base.Input(
-                "NumberOfStepsWithinOneHour",
-                (attrib.Class(int), attrib.Unit("1"), attrib.Scales("global")),
-                self.default_observer
-            ),
-            base.Input(
-                "MultiplicationFactors",
-                (attrib.Class(list[float]), attrib.Unit("1"), attrib.Scales("other/factor")),
-                self.default_observer,
-                description="To determine LP50 values, the concentration multiplication factor leading to a 50% "
-                            "reduction of final survival in the GUTS model, simulations for all reaches are run "
-                            "applying a series of multiplication factors to the hourly concentration time series. "
-                            "Ideally, the full range from 0 to 100% effect (reduction of survival) should be covered, "
-                            "to ensure a reliable LP50 estimation by fitting a dose-response relationship. As a kind "
-                            "of brute-force approach, multiplication factors could be set according to a power "
-                            "function, e.g., ranging from 2^-10 to 2^15 (1/512 to 16384)."
-            ),
-            base.Input(
-                "Verbosity",
-                (attrib.Class(int), attrib.Scales("global"), attrib.Unit(None), attrib.InList((0, 1))),
-                self.default_observer,
-                description="If set to `1`, survival is reported per day, else only at the end of each simulated year. "
-                            "This affects only the output of the module, but not of the component. Vhanging this input "
-                            "is therefore mainly useful for debugging."
-            ),
-            base.Input(
-                "NumberRuns",
-                (attrib.Class(int), attrib.Scales("global"), attrib.Unit("1")),
-                self.default_observer
-            ),
-            base.Input(
-                "UseTemperatureInput",
-                (attrib.Class(bool), attrib.Scales("global"), attrib.Unit(None)),
-                self._defaultObserver,
-                description="Specifies, whether the empirical water temperature data from the `WaterTemperature` input "
-                            "is used or whether this data is ignored and a forcing function is applied, instead."
-            ),
-            base.Input(
-                "WaterTemperature",
-                (attrib.Class(np.ndarray), attrib.Scales("time/day"), attrib.Unit("°C")),
-                self._defaultObserver
+                (
+                    lambda: self.archive_population_factors(
+                        model_system_path, len(multiplication_factors), number_runs, archiver, archived_factors)
+                ) if archiver else None
             )
-        ])
-        self._outputs = base.OutputContainer(self, [
-            base.Output(
-                "AdultMetaPopulation",
-                store,
-                self,
-                {"data_type": np.int, "scales": "time/day, other/factor, other/runs", "unit": "1"},
-                "The total number of all adults.",
-                {
-                    "type": np.ndarray,
-                    "shape": (
-                        """the total number of days in the years at least partly covered by the 
-                        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
-                        the recovery period""",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
-                        "the `NumberRuns`"
-                    ),
-                    "chunks": "for fast retrieval of time series",
-                    "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
-                    "offset": ("the year of the `SimulationStart` input", None, None)
-                }
-            ),
-            base.Output(
-                "AdultPopulationByReach",
-                store,
-                self,
-                {"data_type": np.int, "scales": "time/day, space/reach, other/factor, other/runs", "unit": "1"},
-                "The number of adults.",
-                {
-                    "type": np.ndarray,
-                    "shape": (
-                        """the total number of days in the years at least partly covered by the 
-                        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
-                        the recovery period""",
-                        "the number of reaches reported by the [Concentrations](#Concentrations) input",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
-                        "the `NumberRuns`"
-                    ),
-                    "chunks": "for fast retrieval of time series",
-                    "element_names": (
-                        None,
-                        "as specified by the `Concentrations` input",
-                        "as specified by the `MultiplicationFactors` input",
-                        None
-                    ),
-                    "offset": ("the year of the `SimulationStart` input", None, None, None),
-                    "geometries": (None, "as specified by the `Concentrations` input", None, None)
-                }
-            ),
-            base.Output(
-                "EmbryoMetaPopulation",
-                store,
-                self,
-                {"data_type": np.int, "scales": "time/day, other/factor, other/runs", "unit": "1"},
-                "The total number of all embryos.",
-                {
-                    "type": np.ndarray,
-                    "shape": (
-                        """the total number of days in the years at least partly covered by the 
-                        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
-                        the recovery period""",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
-                        "the `NumberRuns`"
-                    ),
-                    "chunks": "for fast retrieval of time series",
-                    "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
-                    "offset": ("the year of the `SimulationStart` input", None, None)
-                }
-            ),
-            base.Output(
-                "EmbryoPopulationByReach",
-                store,
-                self,
-                {"data_type": np.int, "scales": "time/day, space/reach, other/factor, other/runs", "unit": "1"},
-                "The number of embryos.",
-                {
-                    "type": np.ndarray,
-                    "shape": (
-                        """the total number of days in the years at least partly covered by the 
-                        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
-                        the recovery period""",
-                        "the number of reaches reported by the [Concentrations](#Concentrations) input",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
-                        "the `NumberRuns`"
-                    ),
-                    "chunks": "for fast retrieval of time series",
-                    "element_names": (
-                        None,
-                        "as specified by the `Concentrations` input",
-                        "as specified by the `MultiplicationFactors` input",
-                        None
-                    ),
-                    "offset": ("the year of the `SimulationStart` input", None, None, None),
-                    "geometries": (None, "as specified by the `Concentrations` input", None, None)
-                }
-            ),
-            base.Output(
-                "ExtantLocalPopulationsMetaPopulation",
-                store,
-                self,
-                {"data_type": np.int, "scales": "time/day, other/factor, other/runs", "unit": "1"},
-                "The total number of populations that went extant.",
-                {
-                    "type": np.ndarray,
-                    "shape": (
-                        """the total number of days in the years at least partly covered by the 
-                        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
-                        the recovery period""",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
-                        "the `NumberRuns`"
-                    ),
-                    "chunks": "for fast retrieval of time series",
-                    "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
-                    "offset": ("the year of the `SimulationStart` input", None, None)
-                }
-            ),
-            base.Output(
-                "JuvenileAndAdultMetaPopulation",
-                store,
-                self,
-                {"data_type": np.int, "scales": "time/day, other/factor, other/runs", "unit": "1"},
-                "The total number of all adults and juveniles combined.",
-                {
-                    "type": np.ndarray,
-                    "shape": (
-                        """the total number of days in the years at least partly covered by the 
-                        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
-                        the recovery period""",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
-                        "the `NumberRuns`"
-                    ),
-                    "chunks": "for fast retrieval of time series",
-                    "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
-                    "offset": ("the year of the `SimulationStart` input", None, None)
-                }
-            ),
-            base.Output(
-                "JuvenileAndAdultPopulationByReach",
-                store,
-                self,
-                {"data_type": np.int, "scales": "time/day, space/reach, other/factor, other/runs", "unit": "1"},
-                "The number of juveniles and adults combined.",
-                {
-                    "type": np.ndarray,
-                    "shape": (
-                        """the total number of days in the years at least partly covered by the 
-                        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
-                        the recovery period""",
-                        "the number of reaches reported by the [Concentrations](#Concentrations) input",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
-                        "the `NumberRuns`"
-                    ),
-                    "chunks": "for fast retrieval of time series",
-                    "element_names": (
-                        None,
-                        "as specified by the `Concentrations` input",
-                        "as specified by the `MultiplicationFactors` input",
-                        None
-                    ),
-                    "offset": ("the year of the `SimulationStart` input", None, None, None),
-                    "geometries": (None, "as specified by the `Concentrations` input", None, None)
-                }
-            ),
-            base.Output(
-                "JuvenileMetaPopulation",
-                store,
-                self,
-                {"data_type": np.int, "scales": "time/day, other/factor, other/runs", "unit": "1"},
-                "The total number of all juveniles.",
-                {
-                    "type": np.ndarray,
-                    "shape": (
-                        """the total number of days in the years at least partly covered by the 
-                        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
-                        the recovery period""",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
-                        "the `NumberRuns`"
-                    ),
-                    "chunks": "for fast retrieval of time series",
-                    "element_names": (None, "as specified by the `MultiplicationFactors` input", None),
-                    "offset": ("the year of the `SimulationStart` input", None, None)
-                }
-            ),
-            base.Output(
-                "JuvenilePopulationByReach",
-                store,
-                self,
-                {"data_type": np.int, "scales": "time/day, space/reach, other/factor, other/runs", "unit": "1"},
-                "The number of juveniles.",
-                {
-                    "type": np.ndarray,
-                    "shape": (
-                        """the total number of days in the years at least partly covered by the 
-                        [Concentrations](#Concentrations) input plus the years of the warm-up period plus the years of 
-                        the recovery period""",
-                        "the number of reaches reported by the [Concentrations](#Concentrations) input",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input",
-                        "the `NumberRuns`"
-                    ),
-                    "chunks": "for fast retrieval of time series",
-                    "element_names": (
-                        None,
-                        "as specified by the `Concentrations` input",
-                        "as specified by the `MultiplicationFactors` input",
-                        None
-                    ),
-                    "offset": ("the year of the `SimulationStart` input", None, None, None),
-                    "geometries": (None, "as specified by the `Concentrations` input", None, None)
-                }
-            ),
-            base.Output(
-                "GutsSurvivalReaches",
-                store,
-                self,
-                {"scales": "time/year, space/reach, other/factor", "unit": "1"},
-                "The probability of an individual to survive.",
-                {
-                    "type": np.ndarray,
-                    "data_type": np.float,
-                    "shape": (
-                        """the number of years at least partly covered by the [Concentrations](#Concentrations) input 
-                        plus the number of years of the warm-up period plus the number of years of the recovery 
-                        period""",
-                        "the number of reaches reported by the [Concentrations](#Concentrations) input",
-                        "the number of items in the [MultiplicationFactors](#MultiplicationFactors) input"
-                    ),
-                    "chunks": "for allowing compression (only one chunk used)",
-                    "element_names": (
-                        None,
-                        "as specified by the `Concentrations` input",
-                        "as specified by the `MultiplicationFactors` input",
-                    ),
-                    "offset": ("the year of the `SimulationStart` input", None, None),
-                    "geometries": (None, "as specified by the `Concentrations` input", None)
-                }
+        else:
+            raise ValueError(f"Unexpected population engine: {population_engine}")
+        await asyncio.to_thread(
+            self.merge_population_module_outputs,
+            model_system_path,
+            missing_factors,
+            len(multiplication_factors),
+            number_runs,
+            manifest
+        )
+        if archiver:
+            await asyncio.to_thread(
+                self.archive_population_factors,
+                model_system_path,
+                len(multiplication_factors),
+                number_runs,
+                archiver,
+                archived_factors,
+                False
+            )
+
+    @staticmethod
+    def archive_population_factors(
+            model_system_path, number_multiplication_factors, number_runs, archiver, archived_factors, complete=True):
+        """
+        Adds the output directories of multiplication factors of a population model run to an archive.
+
+        Args:
+            model_system_path: The directory of the module outputs.
+            number_multiplication_factors: The number of multiplication factors.
+            number_runs: The number of runs of the population model.
+            archiver: The archiver.
+            archived_factors: The set of indices of multiplication factors already archived, which is updated.
+            complete: Specifies whether only multiplication factors are archived whose output files are complete.
+
+        Returns:
+            Nothing.
+        """
+        for multiplication_factor in range(1, number_multiplication_factors + 1):
+            if multiplication_factor in archived_factors or (
+                    complete and not population_factor_files(model_system_path, multiplication_factor, number_runs)):
+                continue
+            archived_factors.add(multiplication_factor)
+            # noinspection SpellCheckingInspection
+            archiver.add(os.path.join(model_system_path, "x1", f"x1s{multiplication_factor}"))
+
+    def run_population_engine(
+            self,
+            processing_path,
+            model_system_path,
+            model,
+            multiplication_factors,
+            missing_factors,
+            number_runs,
+            reach_indices=None
+    ):
+        """
+        Runs the native population engine, writing the outputs of the missing multiplication factors like a module
+        run restricted to them. Monte Carlo runs are distributed across a pool of worker processes.
+
+        Args:
+            processing_path: The working directory of the module.
+            model_system_path: The directory of the module outputs.
+            model: The identifier of the model used.
+            multiplication_factors: A list of multiplication factors for margin-of-safety analyses.
+            missing_factors: The one-based indices of the multiplication factors to simulate.
+            number_runs: The number of runs of the population model.
+            reach_indices: The indices of the simulated reaches if not all reaches are simulated.
+
+        Returns:
+            Nothing.
+        """
+        import concurrent.futures
+        downstream_reaches = self._read_optional_input("DownstreamReaches", None)
+        if downstream_reaches is None:
+            raise ValueError("The DownstreamReaches input is required for the native population engine")
+        deb_parameters = self._read_optional_input("DebParameters", None)
+        if deb_parameters is None:
+            raise ValueError("The DebParameters input is required for the native population engine")
+        reaches = np.array(self.inputs["Concentrations"].describe()["element_names"][1].get_values(), np.int64)
+        habitat_areas = self._read_optional_input("HabitatAreas", None)
+        if habitat_areas is None:
+            raise ValueError("The HabitatAreas input is required for the native population engine")
+        habitat_areas = np.asarray(habitat_areas, np.float64)
+        if reach_indices is None:
+            reach_indices = np.arange(reaches.size)
+        simulated_reaches = reaches[reach_indices]
+        downstream_reaches = np.asarray(downstream_reaches, np.int64)[reach_indices]
+        order = np.argsort(simulated_reaches)
+        position = np.minimum(
+            np.searchsorted(simulated_reaches, downstream_reaches, sorter=order), simulated_reaches.size - 1)
+        downstream_indices = np.where(
+            simulated_reaches[order[position]] == downstream_reaches, order[position], -1)
+        engine = PopulationEngine.from_processing_path(
+            processing_path, model, downstream_indices, habitat_areas[reach_indices], deb_parameters)
+        random_seed = self._read_optional_input("RandomSeed", None)
+        entropy = np.random.SeedSequence(random_seed).entropy
+        tasks = [
+            (
+                engine,
+                os.path.join(model_system_path, "x1", f"x1s{i}"),
+                i,
+                run,
+                multiplication_factors[multiplication_factor - 1],
+                np.random.SeedSequence(entropy, spawn_key=(multiplication_factor, run))
             )
-        ])
+            for i, multiplication_factor in enumerate(missing_factors, 1)
+            for run in range(1, number_runs + 1)
+        ]
+        number_workers = self._read_optional_input("NumberWorkers", 1)
         if self.default_observer:
             self.default_observer.write_message(
-                3,
-                "The SimulationStart input will be removed in a future version of the CascadeToxswa component",
-                "The time offset will be retrieved from the metadata of the Concentrations input"
+                5, f"Simulating {len(tasks)} population runs of {reach_indices.size} reaches natively")
+        if number_workers < 2 or len(tasks) < 2:
+            for task in tasks:
+                write_population_engine_outputs(*task)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(min(number_workers, len(tasks))) as executor:
+                for future in [executor.submit(write_population_engine_outputs, *task) for task in tasks]:
+                    future.result()
+
+    def prepare_population_module_outputs(
+            self, processing_path, model_system_path, model, multiplication_factors, number_runs, manifest, resume):
+        """
+        Prepares the module output directory of the population model. Outputs of a previous run are retained for
+        multiplication factors that are complete when resuming, and the startup statements are restricted to the
+        remaining multiplication factors.
+
+        Args:
+            processing_path: The working directory of the module.
+            model_system_path: The directory of the module outputs.
+            model: The identifier of the model used.
+            multiplication_factors: A list of multiplication factors for margin-of-safety analyses.
+            number_runs: The number of runs of the population model.
+            manifest: The manifest of completed stages, or `None` if the run is not resumable.
+            resume: Specifies whether outputs of a previous run are reused.
+
+        Returns:
+            The one-based indices of the multiplication factors to simulate.
+        """
+        retained_path = f"{model_system_path}.retained"
+        if os.path.isdir(retained_path):
+            remove_path(model_system_path)
+            os.rename(retained_path, model_system_path)
+        missing_factors = list(range(1, len(multiplication_factors) + 1))
+        if resume:
+            missing_factors = [
+                multiplication_factor
+                for multiplication_factor in missing_factors
+                if not self.record_population_factor(model_system_path, multiplication_factor, number_runs, manifest)
+            ]
+            if self.default_observer:
+                self.default_observer.write_message(
+                    5,
+                    f"Resumed with {len(multiplication_factors) - len(missing_factors)} of "
+                    f"{len(multiplication_factors)} multiplication factors from previous module run"
+                )
+            if len(missing_factors) == 0:
+                return missing_factors
+        if len(missing_factors) < len(multiplication_factors):
+            os.rename(model_system_path, retained_path)
+            self.prepare_startup_statements(
+                os.path.join(processing_path, "startup.st"),
+                model,
+                [multiplication_factors[multiplication_factor - 1] for multiplication_factor in missing_factors],
+                number_runs
             )
+        else:
+            remove_path(model_system_path)
+        return missing_factors
 
-    def run(self):
+    def merge_population_module_outputs(
+            self, model_system_path, missing_factors, number_multiplication_factors, number_runs, manifest):
         """
-        Runs the component.
+        Merges the outputs of simulated multiplication factors with the retained outputs of a previous run and records
+        the completed multiplication factors in the manifest.
+
+        Args:
+            model_system_path: The directory of the module outputs.
+            missing_factors: The one-based indices of the simulated multiplication factors.
+            number_multiplication_factors: The total number of multiplication factors.
+            number_runs: The number of runs of the population model.
+            manifest: The manifest of completed stages, or `None` if the run is not resumable.
 
         Returns:
             Nothing.
         """
+        retained_path = f"{model_system_path}.retained"
+        if len(missing_factors) < number_multiplication_factors:
+            for i, multiplication_factor in enumerate(missing_factors, 1):
+                factor_path = os.path.join(retained_path, "x1", f"x1s{multiplication_factor}")
+                remove_path(factor_path)
+                os.makedirs(factor_path)
+                simulated_path = os.path.join(model_system_path, "x1", f"x1s{i}")
+                for file_name in os.listdir(simulated_path):
+                    os.rename(
+                        os.path.join(simulated_path, file_name),
+                        os.path.join(factor_path, file_name.replace(f"x1s{i}r", f"x1s{multiplication_factor}r", 1))
+                    )
+            remove_path(model_system_path)
+            os.rename(retained_path, model_system_path)
+        if manifest:
+            for multiplication_factor in missing_factors:
+                self.record_population_factor(model_system_path, multiplication_factor, number_runs, manifest)
+
+    def run_parameter_sweep(self, parameter_sets):
+        """
+        Runs the LGUTS model for a table of GUTS parameter sets against the same exposure. The runtime environment,
+        reach list and concentrations are prepared once and all parameter sets and years are simulated within a single
+        module session.
+
+        Args:
+            parameter_sets: A sequence of dictionaries, each holding values of the GUTS parameters `kd`, `hb` and either
+                `z` and `b` (`CatchmentGUTSSD`) or `m` and `beta` (`CatchmentGUTSIT`). Parameters missing in a set are
+                taken from the corresponding inputs.
+
+        Returns:
+            An array of survival probabilities with the dimensions parameter set, year, reach and multiplication
+            factor, i.e., the `GutsSurvivalReaches` of each parameter set.
+        """
         processing_path = self.inputs["ProcessingPath"].read().values
         model = self.inputs["Model"].read().values
+        if model == "CatchmentGUTSSD":
+            parameter_names = {"kd", "hb", "z", "b"}
+        elif model == "CatchmentGUTSIT":
+            parameter_names = {"kd", "hb", "m", "beta"}
+        else:
+            raise ValueError("Parameter sweeps are only supported for LGUTS models, not " + model)
+        if len(parameter_sets) == 0:
+            raise ValueError("At least one parameter set is required for a parameter sweep")
+        for parameter_set in parameter_sets:
+            unexpected_parameters = set(parameter_set) - parameter_names
+            if unexpected_parameters:
+                raise ValueError(f"Unexpected parameters for {model}: {', '.join(sorted(unexpected_parameters))}")
         multiplication_factors = self._inputs["MultiplicationFactors"].read().values
         simulation_start = self.inputs["SimulationStart"].read().values
-        number_of_warm_up_years = self._inputs["NumberOfWarmUpYears"].read().values
-        recovery_period_years = self.inputs["RecoveryPeriodYears"].read().values
-        number_runs = self.inputs["NumberRuns"].read().values if model in ["LPopSD", "LPopIT"] else None
-        self.prepare_runtime_environment(
-            processing_path,
-            (
-                (
-                    os.path.join(os.path.dirname(__file__), "module", "LEffectModel.image"),
-                    os.path.join(processing_path, "LEffectModel.image")
-                ),
-                (
-                    os.path.join(os.path.dirname(__file__), "module", "LEffectModel.changes"),
-                    os.path.join(processing_path, "LEffectModel.changes")
-                )
-            ),
-            model
-        )
-        self.prepare_startup_statements(
-            os.path.join(processing_path, "startup.st"), model, multiplication_factors, number_runs)
-        # noinspection SpellCheckingInspection
-        self.prepare_coefficients(
-            os.path.join(
-                processing_path, "ETInput", f"{model}ModelSystem", "parameters", f"{model}ModelSystem_coefs.csv"),
-            model
-        )
+        parameters_path = os.path.join(processing_path, "ETInput", f"{model}ModelSystem", "parameters")
+        self.prepare_runtime_environment(processing_path, self.get_runtime_files(processing_path), model)
+        for p, parameter_set in enumerate(parameter_sets):
+            self.prepare_coefficients(
+                os.path.join(parameters_path, f"{model}ModelSystem_coefs.{p}.csv"), model, parameter_set)
         # noinspection SpellCheckingInspection
         self.prepare_reach_list(os.path.join(
-            processing_path, "ETInput", f"{model}ModelSystem", "maps", "shapes", "reachlist_shp", "Reachlist_shp.shp"
+            processing_path,
+            "ETInput",
+            f"{model}ModelSystem",
+            "maps",
+            "shapes",
+            "reachlist_shp",
+            "Reachlist_shp.shp"
         ))
         time_slices = self.get_time_slices()
         self.prepare_concentrations(
-            os.path.join(processing_path, "ETInput", "CatchmentModelSystem", "data"), time_slices, simulation_start)
-        if model in ["LPopSD", "LPopIT"]:
-            self.prepare_control_population_model(
-                os.path.join(
-                    processing_path, "ETInput", f"{model}ModelSystem", "parameters", f"{model}ModelSystem_control.csv"),
-                simulation_start,
-                number_of_warm_up_years,
-                recovery_period_years
-            )
-            if self.inputs["UseTemperatureInput"].read().values:
-                self.prepare_water_temperatures(
-                    os.path.join(
-                        processing_path,
-                        "ETInput",
-                        "CatchmentModelSystem",
-                        "data",
-                        "water_temperature_101096_1979-2020.csv"
-                    ),
-                    simulation_start.year - number_of_warm_up_years,
-                    simulation_start.year + len(time_slices) + recovery_period_years
-                )
-            self.run_module(processing_path)
-            # noinspection SpellCheckingInspection
-            self.store_results_per_day(
-                os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS", "x1", "x1s{}"),
-                {
-                    "x1s{}r{}_adultMetapop.txt": "AdultMetaPopulation",
-                    "x1s{}r{}_embryoMetapop.txt": "EmbryoMetaPopulation",
-                    "x1s{}r{}_extantLocalPopsMetapop.txt": "ExtantLocalPopulationsMetaPopulation",
-                    "x1s{}r{}_juvAndAdultMetapop.txt": "JuvenileAndAdultMetaPopulation",
-                    "x1s{}r{}_juvenileMetapop.txt": "JuvenileMetaPopulation"
-                },
-                simulation_start.year,
-                len(time_slices),
-                number_of_warm_up_years,
-                recovery_period_years,
-                len(multiplication_factors),
-                number_runs
-            )
-            # noinspection SpellCheckingInspection
-            self.store_results_per_day_and_reach(
-                os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_Mos", "x1", "x1s{}"),
-                {
-                    "x1s{}r{}_adultPopByReach.txt": "AdultPopulationByReach",
-                    "x1s{}r{}_embryoPopByReach.txt": "EmbryoPopulationByReach",
-                    "x1s{}r{}_juvAndAdultPopByReach.txt": "JuvenileAndAdultPopulationByReach",
-                    "x1s{}r{}_juvenilePopByReach.txt": "JuvenilePopulationByReach"
-                },
-                simulation_start.year,
-                len(time_slices),
-                number_of_warm_up_years,
-                recovery_period_years,
-                self._inputs["Concentrations"].describe()["shape"][1],
-                len(multiplication_factors),
-                number_runs
+            os.path.join(processing_path, "ETInput", "CatchmentModelSystem", "data"),
+            time_slices,
+            simulation_start
+        )
+        for y in range(len(time_slices)):
+            self.prepare_control_individual_model(
+                os.path.join(parameters_path, f"{model}ModelSystem_control.{y}.csv"), simulation_start, y)
+        self.prepare_sweep_startup_statements(
+            os.path.join(processing_path, "startup.st"),
+            model,
+            multiplication_factors,
+            len(parameter_sets),
+            len(time_slices)
+        )
+        # noinspection SpellCheckingInspection
+        self.run_module(
+            processing_path,
+            (
+                os.path.join(processing_path, "ecotalk"),
+                os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS_*_*"),
+                len(parameter_sets) * len(time_slices),
+                365
             )
-        elif model in ["CatchmentGUTSSD", "CatchmentGUTSIT"]:
-            for y in range(len(time_slices)):
-                self.prepare_control_individual_model(
-                    os.path.join(
-                        processing_path,
-                        "ETInput",
-                        f"{model}ModelSystem",
-                        "parameters",
-                        f"{model}ModelSystem_control.csv"
-                    ),
-                    simulation_start,
-                    y
-                )
-                self.run_module(processing_path)
-                # noinspection SpellCheckingInspection
-                retry_rename(
-                    os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS.modelscript"),
-                    os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS.modelscript.{y}")
-                )
-                # noinspection SpellCheckingInspection
-                retry_rename(
-                    os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS"),
-                    os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS_{y}")
+        )
+        number_reaches = self._inputs["Concentrations"].describe()["shape"][1]
+        # noinspection SpellCheckingInspection
+        values = read_tables(
+            [
+                os.path.join(
+                    processing_path,
+                    "ecotalk",
+                    f"{model}ModelSystem_MoS_{p}_{y}",
+                    "x1",
+                    "guts_survival_reaches.txt_mfactors.txt"
                 )
-            # noinspection SpellCheckingInspection
-            self.store_results_per_year_and_reach(
-                os.path.join(processing_path, "ecotalk", model + "ModelSystem_MoS_{}", "x1"),
-                {"guts_survival_reaches.txt_mfactors.txt": "GutsSurvivalReaches"},
-                len(time_slices),
-                self._inputs["Concentrations"].describe()["shape"][1],
-                len(multiplication_factors),
-                simulation_start.year
+                for p in range(len(parameter_sets))
+                for y in range(len(time_slices))
+            ],
+            (len(parameter_sets) * len(time_slices), number_reaches, len(multiplication_factors)),
+            self._read_optional_input("SurvivalDataType", "float64"),
+            self._read_optional_input("NumberWorkers", 1)
+        )
+        return values.reshape((len(parameter_sets), len(time_slices), number_reaches, len(multiplication_factors)))
+
+    def _read_optional_input(self, name, default):
+        """
+        Reads the value of an input that may be left unconnected in the model composition.
+
+        Args:
+            name: The name of the input.
+            default: The value used if the input is not connected.
+
+        Returns:
+            The value of the input or the default value.
+        """
+        if self.inputs[name].provider is None:
+            return default
+        return self.inputs[name].read().values
+
+    def get_runtime_files(self, processing_path):
+        """
+        Gets the files required for the runtime environment of the module, provided by the runtime template if
+        configured.
+
+        Args:
+            processing_path: The working directory of the module.
+
+        Returns:
+            The files required for the runtime environment as tuples of source, destination and whether the
+            destination needs to be writable.
+        """
+        runtime_files = (
+            (
+                os.path.join(os.path.dirname(__file__), "module", "LEffectModel.image"),
+                os.path.join(processing_path, "LEffectModel.image"),
+                False
+            ),
+            (
+                os.path.join(os.path.dirname(__file__), "module", "LEffectModel.changes"),
+                os.path.join(processing_path, "LEffectModel.changes"),
+                True
             )
-        else:
-            raise ValueError("Unexpected model: " + model)
+        )
+        runtime_template_path = self._read_optional_input("RuntimeTemplatePath", None)
+        if runtime_template_path:
+            runtime_files = self.prepare_runtime_template(runtime_template_path, runtime_files)
+        return runtime_files
 
     @staticmethod
-    def prepare_runtime_environment(processing_path, files, model):
+    def prepare_runtime_template(template_path, files):
+        """
+        Prepares a shared template of the runtime files that processing directories link to.
+
+        Args:
+            template_path: The directory of the template.
+            files: The files required for the runtime environment as tuples of source, destination and whether the
+                destination needs to be writable.
+
+        Returns:
+            The files required for the runtime environment with their sources redirected to the template.
+        """
+        os.makedirs(template_path, exist_ok=True)
+        result = []
+        for source, destination, writable in files:
+            template_file = os.path.join(template_path, os.path.basename(source))
+            source_info = os.stat(source)
+            if not os.path.exists(template_file) or os.stat(template_file).st_size != source_info.st_size or \
+                    os.stat(template_file).st_mtime < source_info.st_mtime:
+                staging_file = f"{template_file}.{os.getpid()}.tmp"
+                shutil.copy2(source, staging_file)
+                os.replace(staging_file, template_file)
+            result.append((template_file, destination, writable))
+        return result
+
+    def prepare_runtime_environment(self, processing_path, files, model):
         """
         Prepares the runtime environment of the module.
 
         Args:
             processing_path: The working directory of the module.
-            files: The files required for the runtime environment to work properly.
+            files: The files required for the runtime environment to work properly as tuples of source, destination
+                and whether the destination needs to be writable.
             model: The identifier of the model used.
 
         Returns:
             Nothing.
         """
         # noinspection SpellCheckingInspection
-        os.makedirs(os.path.join(processing_path, "ecotalk"))
-        os.makedirs(os.path.join(processing_path, "ETInput", f"{model}ModelSystem", "parameters"))
+        os.makedirs(os.path.join(processing_path, "ecotalk"), exist_ok=True)
+        os.makedirs(os.path.join(processing_path, "ETInput", f"{model}ModelSystem", "parameters"), exist_ok=True)
         # noinspection SpellCheckingInspection
-        os.makedirs(os.path.join(processing_path, "ETInput", f"{model}ModelSystem", "maps", "shapes", "reachlist_shp"))
-        os.makedirs(os.path.join(processing_path, "ETInput", "CatchmentModelSystem", "data"))
-        for file in files:
-            shutil.copyfile(file[0], file[1])
+        os.makedirs(
+            os.path.join(processing_path, "ETInput", f"{model}ModelSystem", "maps", "shapes", "reachlist_shp"),
+            exist_ok=True
+        )
+        os.makedirs(os.path.join(processing_path, "ETInput", "CatchmentModelSystem", "data"), exist_ok=True)
+        for source, destination, writable in files:
+            remove_path(destination)
+            method = link_file(source, destination, writable)
+            if self.default_observer:
+                self.default_observer.write_message(5, f"Provided {os.path.basename(destination)} by {method}")
 
     @staticmethod
     def prepare_startup_statements(statements_file, model, multiplication_factors, number_runs):
@@ -823,17 +4585,86 @@ class LEffectModel(base.Component):
             f.write("(ModelProject fromScriptFile: scriptFile) runModelProjectForeground.\n")
             f.write("Smalltalk quitPrimitive\n")
 
-    def prepare_coefficients(self, coefficient_file, model):
+    @staticmethod
+    def prepare_sweep_startup_statements(
+            statements_file, model, multiplication_factors, number_parameter_sets, number_years):
+        """
+        Prepares a SmallTalk statement file that runs all parameter sets and years of a parameter sweep in a single
+        module session. Before each run, the coefficient file of the parameter set and the control file of the year
+        are copied into place. After each run, the module outputs are renamed to include the indices of the parameter
+        set and the year.
+
+        Args:
+            statements_file: The path for the statement file.
+            model: The identifier of the model used.
+            multiplication_factors: A list of multiplication factors for margin-of-safety analyses.
+            number_parameter_sets: The number of parameter sets.
+            number_years: The number of years simulated per parameter set.
+
+        Returns:
+            Nothing.
+        """
+        if model == "CatchmentGUTSSD":
+            # noinspection SpellCheckingInspection
+            project_name = "GUTSSD"
+        elif model == "CatchmentGUTSIT":
+            # noinspection SpellCheckingInspection
+            project_name = "GUTSIT"
+        else:
+            raise ValueError("Parameter sweeps are only supported for LGUTS models, not " + model)
+        parameters_path = os.path.join("ETInput", f"{model}ModelSystem", "parameters")
+        # noinspection SpellCheckingInspection
+        model_system_path = os.path.join("ecotalk", f"{model}ModelSystem_MoS")
+        with open(statements_file, "w") as f:
+            # noinspection SpellCheckingInspection
+            f.write("| mfs scriptFile directory |\n")
+            f.write("ModelIO invalidateRootDirectories.\n")
+            # noinspection SpellCheckingInspection
+            f.write("CatchmentConcDataBase removeAllDataBases.\n")
+            f.write("RInterface rDirectory: nil. \"\"\n")
+            f.write(f"mfs := #({' '.join([str(x) for x in multiplication_factors])}).\n")
+            f.write("directory := FileDirectory default.\n")
+
+            def write_copy_statements(file_name, index):
+                target_file = os.path.join(parameters_path, f"{model}ModelSystem_{file_name}.csv")
+                source_file = os.path.join(parameters_path, f"{model}ModelSystem_{file_name}.{index}.csv")
+                f.write(f"directory deleteFileNamed: '{target_file}'.\n")
+                f.write(f"directory copyFileNamed: '{source_file}' toFileNamed: '{target_file}'.\n")
+
+            for p in range(number_parameter_sets):
+                # noinspection SpellCheckingInspection
+                write_copy_statements("coefs", p)
+                for y in range(number_years):
+                    write_copy_statements("control", y)
+                    # noinspection SpellCheckingInspection
+                    f.write(f"scriptFile := LGUTSProject scriptMoSAnalysis{project_name}MultiplicationFactors: mfs.\n")
+                    f.write("(ModelProject fromScriptFile: scriptFile) runModelProjectForeground.\n")
+                    # noinspection SpellCheckingInspection
+                    f.write(
+                        f"directory rename: '{model_system_path}.modelscript' "
+                        f"toBe: '{model_system_path}.modelscript.{p}.{y}'.\n"
+                    )
+                    f.write(f"directory rename: '{model_system_path}' toBe: '{model_system_path}_{p}_{y}'.\n")
+            f.write("Smalltalk quitPrimitive\n")
+
+    def prepare_coefficients(self, coefficient_file, model, parameters=None):
         """
         Prepares the coefficients used by the module.
 
         Args:
             coefficient_file: The file path for the coefficient file.
             model: The model name.
+            parameters: An optional dictionary of GUTS parameters (`kd`, `hb`, `z`, `b`, `m` or `beta`) that replace
+                the values of the corresponding inputs.
 
         Returns:
             Nothing.
         """
+        parameters = parameters or {}
+
+        def parameter(name, input_name):
+            return parameters[name] if name in parameters else self._inputs[input_name].read().values
+
         with open(coefficient_file, "w") as f:
             f.write("Component,model-dependent,inhabitantClass\n")
             if model in ["LPopSD", "LPopIT"]:
@@ -850,14 +4681,32 @@ class LEffectModel(base.Component):
                 pass
             else:
                 raise ValueError("Unexpected model: " + model)
-            f.write(f"kd:,{self._inputs['DominantRateConstant'].read().values},dominant rate constant [1/d]\n")
-            f.write(f"hb:,{self._inputs['BackgroundHazardRate'].read().values},background hazard rate [1/d]\n")
+            f.write(
+                f"kd:,{parameter('kd', 'DominantRateConstant')},"
+                "dominant rate constant [1/d]\n"
+            )
+            f.write(
+                f"hb:,{parameter('hb', 'BackgroundHazardRate')},"
+                "background hazard rate [1/d]\n"
+            )
             if model in ["LPopSD", "CatchmentGUTSSD"]:
-                f.write(f"z:,{self._inputs['ParameterZOfSDModel'].read().values},threshold concentration [ng/L]\n")
-                f.write(f"b:,{self._inputs['ParameterBOfSDModel'].read().values},killing rate [L/(ng*d)]\n")
+                f.write(
+                    f"z:,{parameter('z', 'ParameterZOfSDModel')},"
+                    "threshold concentration [ng/L]\n"
+                )
+                f.write(
+                    f"b:,{parameter('b', 'ParameterBOfSDModel')},"
+                    "killing rate [L/(ng*d)]\n"
+                )
             elif model in ["LPopIT", "CatchmentGUTSIT"]:
-                f.write(f"m:,{self._inputs['ThresholdOfITModel'].read().values},threshold distribution [ng/L]\n")
-                f.write(f"beta:,{self._inputs['BetaOfITModel'].read().values},width of distribution []\n")
+                f.write(
+                    f"m:,{parameter('m', 'ThresholdOfITModel')},"
+                    "threshold distribution [ng/L]\n"
+                )
+                f.write(
+                    f"beta:,{parameter('beta', 'BetaOfITModel')},"
+                    "width of distribution []\n"
+                )
             else:
                 raise ValueError("Unexpected model: " + model)
             f.write("Component,model-dependent,landscapeClass\n")
@@ -896,99 +4745,415 @@ class LEffectModel(base.Component):
             else:
                 raise ValueError("Unexpected model: " + model)
 
-    def prepare_reach_list(self, reaches_file):
+    def prepare_reach_list(self, reaches_file, reach_indices=None, shared_cache_path=None):
+        """
+        Prepares the reach list.
+
+        Args:
+            reaches_file: The file path for the reach list.
+            reach_indices: The indices of the reaches to list, in the order of the `Concentrations` input. All reaches
+                are listed if not specified.
+            shared_cache_path: The directory of a cache shared with other models, used if the `ReachListCachePath`
+                input is not set.
+
+        Returns:
+            Nothing.
+        """
+        reaches = [int(reach) for reach in self.inputs["Concentrations"].describe()["element_names"][1].get_values()]
+        if reach_indices is not None:
+            reaches = [reaches[i] for i in reach_indices]
+        cache_path = self._read_optional_input("ReachListCachePath", shared_cache_path)
+        if cache_path:
+            self.prepare_cached_files(
+                cache_path,
+                f"reaches_{hashlib.sha256(np.array(reaches, np.int64).tobytes()).hexdigest()}",
+                os.path.dirname(reaches_file),
+                lambda staging_path: self.write_reach_list(
+                    os.path.join(staging_path, os.path.basename(reaches_file)), reaches)
+            )
+        else:
+            for extension in (".shp", ".shx", ".dbf", ".prj"):
+                remove_path(os.path.splitext(reaches_file)[0] + extension)
+            self.write_reach_list(reaches_file, reaches)
+
+    def prepare_cached_files(self, cache_path, cache_key, target_path, build):
+        """
+        Links the files of a cache entry into a directory, building the entry first if it does not exist. Entries are
+        built in a staging directory and renamed into place, so that concurrent runs never see an incomplete entry.
+        Concurrent runs within a process wait for an entry being built instead of building it again.
+
+        Args:
+            cache_path: The directory of the cache.
+            cache_key: The name of the cache entry.
+            target_path: The directory receiving the files.
+            build: A function writing the files of the entry into the directory passed to it.
+
+        Returns:
+            Nothing.
+        """
+        cached_path = os.path.join(cache_path, cache_key)
+        with CACHE_ENTRY_LOCKS_LOCK:
+            entry_lock = CACHE_ENTRY_LOCKS.setdefault(os.path.abspath(cached_path), threading.Lock())
+        with entry_lock:
+            if not os.path.isdir(cached_path):
+                staging_path = f"{cached_path}.{os.getpid()}.tmp"
+                os.makedirs(staging_path, exist_ok=True)
+                build(staging_path)
+                try:
+                    os.rename(staging_path, cached_path)
+                except OSError:
+                    if not os.path.isdir(cached_path):
+                        raise
+                    shutil.rmtree(staging_path)
+                if self.default_observer:
+                    self.default_observer.write_message(5, f"Cached {cache_key}")
+        os.makedirs(target_path, exist_ok=True)
+        for file_name in os.listdir(cached_path):
+            destination = os.path.join(target_path, file_name)
+            if os.path.exists(destination):
+                os.remove(destination)
+            link_file(os.path.join(cached_path, file_name), destination)
+
+    @staticmethod
+    def write_reach_list(reaches_file, reaches):
+        """
+        Writes a reach list shapefile with dummy point geometries.
+
+        Args:
+            reaches_file: The file path for the reach list.
+            reaches: The reach identifiers.
+
+        Returns:
+            Nothing.
+        """
+        from osgeo import ogr
+        driver = ogr.GetDriverByName("ESRI Shapefile")
+        reach_list_data_source = driver.CreateDataSource(reaches_file)
+        reach_list_layer = reach_list_data_source.CreateLayer("reaches", None, ogr.wkbPoint)
+        reach_list_layer.CreateField(ogr.FieldDefn("key", ogr.OFTInteger))
+        reach_list_layer_definition = reach_list_layer.GetLayerDefn()
+        first_point = ogr.Geometry(ogr.wkbPoint)
+        first_point.AddPoint(0, 0, 0)
+        reach_list_layer.StartTransaction()
+        for feature in reaches:
+            reach = ogr.Feature(reach_list_layer_definition)
+            reach.SetGeometry(first_point)
+            reach.SetField("key", feature)
+            reach_list_layer.CreateFeature(reach)
+        reach_list_layer.CommitTransaction()
+        reach_list_data_source.FlushCache()
+        del reach_list_data_source
+
+    def get_time_slices(self):
+        """
+        Slices the simulation time span into individual years for module inputs and outputs.
+
+        Returns:
+            A list of indices indicating the hours when slicing should be done.
+        """
+        simulation_start = self.inputs["SimulationStart"].read().values
+        concentrations_info = self.inputs["Concentrations"].describe()
+        number_hours = int(concentrations_info["shape"][0])
+        result = []
+        current_year = simulation_start.year
+        i = None
+        for i in range(number_hours):
+            current_date = simulation_start + datetime.timedelta(hours=i)
+            if current_date.year != current_year:
+                result.append(i)
+                current_year = current_date.year
+        if len(result) == 0 or result[-1] != i:
+            result.append(i + 1)
+        return result
+
+    def get_years_of_interest(self, time_slices):
+        """
+        Gets the years for which effects are simulated.
+
+        Args:
+            time_slices: The indices by which input concentrations are sliced.
+
+        Returns:
+            A range of indices into the time slices.
+        """
+        first_year = self.inputs["SimulationStart"].read().values.year
+        first_year_of_interest = self._read_optional_input("FirstYearOfInterest", first_year)
+        last_year_of_interest = self._read_optional_input("LastYearOfInterest", first_year + len(time_slices) - 1)
+        if not first_year <= first_year_of_interest <= last_year_of_interest < first_year + len(time_slices):
+            raise ValueError(
+                f"Years of interest {first_year_of_interest} to {last_year_of_interest} are not within the years "
+                f"{first_year} to {first_year + len(time_slices) - 1} covered by the concentrations"
+            )
+        return range(first_year_of_interest - first_year, last_year_of_interest - first_year + 1)
+
+    def get_reaches_of_interest(self, model):
+        """
+        Gets the reaches for which effects are simulated. For LPop models, reaches upstream of the reaches of interest
+        are added.
+
+        Args:
+            model: The identifier of the model used.
+
+        Returns:
+            An array of indices of the simulated reaches in the order of the `Concentrations` input or `None` if all
+            reaches are simulated.
+        """
+        reaches_of_interest = self._read_optional_input("ReachesOfInterest", None)
+        if reaches_of_interest is None:
+            return None
+        reaches = np.array(self.inputs["Concentrations"].describe()["element_names"][1].get_values(), np.int64)
+        unknown_reaches = np.setdiff1d(reaches_of_interest, reaches)
+        if unknown_reaches.size > 0:
+            raise ValueError(f"Reaches of interest not reported by the concentrations: {unknown_reaches.tolist()}")
+        selected = np.isin(reaches, reaches_of_interest)
+        if model in ["LPopSD", "LPopIT"]:
+            downstream_reaches = self._read_optional_input("DownstreamReaches", None)
+            if downstream_reaches is None:
+                raise ValueError("The DownstreamReaches input is required for selecting reaches of interest with LPop")
+            order = np.argsort(reaches)
+            position = np.minimum(np.searchsorted(reaches, downstream_reaches, sorter=order), reaches.size - 1)
+            downstream_indices = np.where(
+                reaches[order[position]] == downstream_reaches, order[position], reaches.size)
+            while True:
+                upstream = ~selected & np.append(selected, False)[downstream_indices]
+                if not upstream.any():
+                    break
+                selected |= upstream
+        if self.default_observer:
+            self.default_observer.write_message(
+                5, f"Simulating {np.count_nonzero(selected)} of {reaches.size} reaches for the reaches of interest")
+        return np.flatnonzero(selected)
+
+    def store_simulated_reaches(self, reach_indices):
+        """
+        Stores the identifiers and geometries of the simulated reaches if only reaches of interest are simulated.
+
+        Args:
+            reach_indices: The indices of the simulated reaches in the order of the `Concentrations` input.
+
+        Returns:
+            Nothing.
+        """
+        concentrations_info = self.inputs["Concentrations"].describe()
+        reaches = concentrations_info["element_names"][1].get_values()
+        geometries = concentrations_info["geometries"][1].get_values()
+        self._outputs["SimulatedReaches"].set_values(
+            np.array([reaches[i] for i in reach_indices], np.int64),
+            scales="space/reach",
+            element_names=(self._outputs["SimulatedReaches"],),
+            geometries=(self._outputs["SimulatedReachGeometries"],)
+        )
+        self._outputs["SimulatedReachGeometries"].set_values(
+            [geometries[i] for i in reach_indices],
+            scales="space/reach",
+            element_names=(self._outputs["SimulatedReaches"],)
+        )
+
+    def get_reach_metadata(self, reach_indices=None):
         """
-        Prepares the reach list.
+        Gets the element names and geometries of the reach dimension of outputs.
 
         Args:
-            reaches_file: The file path for the reach list.
+            reach_indices: The indices of the simulated reaches if only reaches of interest are simulated.
+
+        Returns:
+            A tuple of the element names and the geometries.
+        """
+        if reach_indices is None:
+            concentrations_info = self.inputs["Concentrations"].describe()
+            return concentrations_info["element_names"][1], concentrations_info["geometries"][1]
+        return self._outputs["SimulatedReaches"], self._outputs["SimulatedReachGeometries"]
+
+    def prepare_concentrations(
+            self,
+            time_slice_path,
+            time_slices,
+            simulation_start,
+            reach_indices=None,
+            year_indices=None,
+            shared_cache_path=None
+    ):
+        """
+        Prepares input concentrations for individual module runs.
+
+        Args:
+            time_slice_path: The path for the prepared input files.
+            time_slices: The indices by which input concentrations are sliced.
+            simulation_start: The first day of the simulation.
+            reach_indices: The indices of the reaches to prepare, in the order of the `Concentrations` input. All
+                reaches are prepared if not specified.
+            year_indices: The indices of the years to prepare. All years are prepared if not specified.
+            shared_cache_path: The directory of a cache shared with other models, used if the
+                `PreparedInputCachePath` input is not set.
 
         Returns:
             Nothing.
         """
-        reaches = self.inputs["Concentrations"].describe()["element_names"][1].get_values()
-        driver = ogr.GetDriverByName("ESRI Shapefile")
-        reach_list_data_source = driver.CreateDataSource(reaches_file)
-        reach_list_layer = reach_list_data_source.CreateLayer("reaches", None, ogr.wkbPoint)
-        reach_list_layer.CreateField(ogr.FieldDefn("key", ogr.OFTInteger))
-        reach_list_layer_definition = reach_list_layer.GetLayerDefn()
-        for i, feature in enumerate(reaches):
-            reach = ogr.Feature(reach_list_layer_definition)
-            first_point = ogr.Geometry(ogr.wkbPoint)
-            first_point.AddPoint(0, 0, 0)
-            reach.SetGeometry(first_point)
-            reach.SetField("key", int(feature))
-            reach_list_layer.CreateFeature(reach)
+        if year_indices is None:
+            year_indices = range(len(time_slices))
+        cache_path = self._read_optional_input("PreparedInputCachePath", shared_cache_path)
+        if cache_path:
+            hour_range = range(
+                0 if year_indices.start == 0 else time_slices[year_indices.start - 1],
+                time_slices[year_indices.stop - 1]
+            )
+            self.prepare_cached_files(
+                cache_path,
+                f"concentrations_{self.fingerprint_concentrations(simulation_start, reach_indices, hour_range)}",
+                time_slice_path,
+                lambda staging_path: self.write_concentrations(
+                    staging_path, time_slices, simulation_start, reach_indices, year_indices)
+            )
+        else:
+            self.write_concentrations(time_slice_path, time_slices, simulation_start, reach_indices, year_indices)
 
-    def get_time_slices(self):
+    def fingerprint_concentrations(self, simulation_start, reach_indices=None, hour_range=None, block_size=8784):
         """
-        Slices the simulation time span into individual years for module inputs and outputs.
+        Calculates a fingerprint of the content of the `Concentrations` input and the simulation start. Fingerprints
+        are kept by the component, so that the input is read only once for the run configuration and the key of the
+        prepared input cache.
+
+        Args:
+            simulation_start: The first day of the simulation.
+            reach_indices: The indices of the reaches to consider. All reaches are considered if not specified.
+            hour_range: The range of hours to consider. All hours are considered if not specified.
+            block_size: The number of hours read at once.
 
         Returns:
-            A list of indices indicating the hours when slicing should be done.
+            A hexadecimal SHA-256 digest.
         """
-        simulation_start = self.inputs["SimulationStart"].read().values
         concentrations_info = self.inputs["Concentrations"].describe()
-        number_hours = int(concentrations_info["shape"][0])
-        result = []
-        current_year = simulation_start.year
-        i = None
-        for i in range(number_hours):
-            current_date = simulation_start + datetime.timedelta(hours=i)
-            if current_date.year != current_year:
-                result.append(i)
-                current_year = current_date.year
-        if len(result) == 0 or result[-1] != i:
-            result.append(i + 1)
-        return result
+        number_hours, number_reaches = concentrations_info["shape"][:2]
+        reaches = [int(reach) for reach in concentrations_info["element_names"][1].get_values()]
+        if reach_indices is not None:
+            reaches = [reaches[i] for i in reach_indices]
+        if hour_range is None:
+            hour_range = range(number_hours)
+        fingerprint_key = (
+            simulation_start, None if reach_indices is None else tuple(int(i) for i in reach_indices), hour_range)
+        if fingerprint_key in self._concentration_fingerprints:
+            return self._concentration_fingerprints[fingerprint_key]
+        fingerprint = hashlib.sha256(repr((
+            simulation_start.isoformat(),
+            tuple(int(x) for x in concentrations_info["shape"]),
+            reaches,
+            (hour_range.start, hour_range.stop)
+        )).encode())
+        for i in range(hour_range.start, hour_range.stop, block_size):
+            values = self.inputs["Concentrations"].read(
+                slices=(slice(i, min(i + block_size, hour_range.stop)), slice(number_reaches))).values
+            if reach_indices is not None:
+                values = values[:, reach_indices]
+            fingerprint.update(np.ascontiguousarray(values, np.float64).tobytes())
+        self._concentration_fingerprints[fingerprint_key] = fingerprint.hexdigest()
+        return self._concentration_fingerprints[fingerprint_key]
 
-    def prepare_concentrations(self, time_slice_path, time_slices, simulation_start):
+    def write_concentrations(
+            self, time_slice_path, time_slices, simulation_start, reach_indices=None, year_indices=None):
         """
-        Prepares input concentrations for individual module runs.
+        Writes the input concentrations for individual module runs.
 
         Args:
             time_slice_path: The path for the prepared input files.
             time_slices: The indices by which input concentrations are sliced.
             simulation_start: The first day of the simulation.
+            reach_indices: The indices of the reaches to write. All reaches are written if not specified.
+            year_indices: The indices of the years to write. All years are written if not specified.
 
         Returns:
             Nothing.
         """
         reaches = self.inputs["Concentrations"].describe()["element_names"][1].get_values()
+        if reach_indices is None:
+            reach_indices = range(len(reaches))
         start_day_of_year = simulation_start.timetuple().tm_yday
-        concentrations = [[]] * len(reaches)
-        for y in range(len(time_slices)):
+        if year_indices is None:
+            year_indices = range(len(time_slices))
+        concentrations = [[]] * len(reach_indices)
+        for y in year_indices:
             time_slice_from = 0 if y == 0 else time_slices[y - 1]
-            for i, reach in enumerate(reaches):
+            for i, reach_index in enumerate(reach_indices):
+                reach = reaches[reach_index]
                 reported_concentrations = self.inputs["Concentrations"].read(
-                    slices=(slice(time_slice_from, time_slices[y]), i)).values
+                    slices=(slice(time_slice_from, time_slices[y]), reach_index)).values
                 concentrations[i] = [0.] * 8786
                 concentrations[i][0] = float(reach)
                 start_index = (start_day_of_year - 1) * 24 + 1 if y == 0 else 1
                 concentrations[i][start_index:(start_index + reported_concentrations.shape[0])] = \
                     reported_concentrations.tolist()
             # noinspection SpellCheckingInspection
-            with open(
-                    os.path.join(time_slice_path, f"rummen_{simulation_start.year + y}.msgpack"),
-                    "wb"
-            ) as f:
+            time_slice_file = os.path.join(time_slice_path, f"rummen_{simulation_start.year + y}.msgpack")
+            remove_path(time_slice_file)
+            with open(time_slice_file, "wb") as f:
                 msgpack.pack(concentrations, f)
 
-    def run_module(self, processing_path):
+    def run_module(self, processing_path, progress=None):
         """
         Runs the module.
 
         Args:
             processing_path: The path used for processing.
+            progress: An optional tuple of the directory of module outputs, a glob pattern of files marking completed
+                units of work, the total number of units and the number of simulated days per unit. Used for
+                reporting progress if the module run is monitored.
+
+        Returns:
+            Nothing.
+        """
+        launcher = self.get_module_launcher()
+        if self._read_optional_input("ProgressInterval", 0) or self._read_optional_input("StallTimeout", 0) or \
+                launcher.adjusts_processes:
+            asyncio.run(self.run_module_async(processing_path, progress))
+        else:
+            base.run_process(
+                launcher.command("LEffectModel.image", "startup.st"), processing_path, self.default_observer)
+
+    async def run_module_async(self, processing_path, progress=None, poll=None):
+        """
+        Runs the module as an asynchronous subprocess, forwarding its console output to the observer.
+
+        Args:
+            processing_path: The path used for processing.
+            progress: An optional tuple of the directory of module outputs, a glob pattern of files marking completed
+                units of work, the total number of units and the number of simulated days per unit. Used for
+                reporting progress if the module run is monitored.
+            poll: An optional function called periodically in a worker thread while the module runs.
 
         Returns:
             Nothing.
         """
-        squeak = os.path.join(os.path.dirname(__file__), "module", "squeak.exe")
-        base.run_process((squeak, "LPop.image", "startup.st"), processing_path, self.default_observer)
+        launcher = self.get_module_launcher()
+        progress_interval = self._read_optional_input("ProgressInterval", 0)
+        stall_timeout = self._read_optional_input("StallTimeout", 0)
+        output_path, completion_pattern, number_units, days_per_unit = progress or (processing_path, "", 1, 0)
+        monitor = ProgressMonitor(
+            self.default_observer,
+            output_path,
+            completion_pattern,
+            number_units,
+            days_per_unit,
+            progress_interval or (60 if stall_timeout else 0),
+            stall_timeout,
+            poll
+        )
+        await monitor.run(launcher.command("LEffectModel.image", "startup.st"), processing_path, launcher)
+
+    def get_module_launcher(self):
+        """
+        Gets the launcher of the virtual machine running the module, as configured by the inputs.
+
+        Returns:
+            A ModuleLauncher.
+        """
+        return ModuleLauncher(
+            os.path.join(os.path.dirname(__file__), "module"),
+            self._read_optional_input("VirtualMachine", None),
+            self._read_optional_input("ProcessorAffinity", None),
+            self._read_optional_input("ProcessNiceness", 0)
+        )
 
     def prepare_control_population_model(
-            self, control_file, simulation_start, number_of_warm_up_years, recovery_period_year):
+            self, control_file, simulation_start, number_of_warm_up_years, recovery_period_year, number_years=None):
         """
         Prepares the control file.
 
@@ -997,23 +5162,22 @@ class LEffectModel(base.Component):
             simulation_start: The first day of the simulation.
             number_of_warm_up_years: The number of years used to warm up the module.
             recovery_period_year: The number of years added as recovery period to the simulation.
+            number_years: The number of years of pesticide application. Defaults to the years covered by the
+                `Concentrations` input.
 
         Returns:
             Nothing.
         """
-        number_hours = self.inputs["Concentrations"].describe()["shape"][0]
+        if number_years is None:
+            number_hours = self.inputs["Concentrations"].describe()["shape"][0]
+            last_year = (simulation_start + datetime.timedelta(number_hours / 24 - 1)).year
+        else:
+            last_year = simulation_start.year + number_years - 1
         with open(control_file, "w") as f:
             f.write(f"startYear:,{simulation_start.year - number_of_warm_up_years},start year of the simulation\n")
-            f.write(
-                "endYear:,"
-                f"{(simulation_start + datetime.timedelta(number_hours / 24 - 1)).year + recovery_period_year},"
-                "last year of the simulation\n"
-            )
+            f.write(f"endYear:,{last_year + recovery_period_year},last year of the simulation\n")
             f.write(f"startApplicationYear:,{simulation_start.year},start year of pesticide application\n")
-            f.write(
-                f"endApplicationYear:,{(simulation_start + datetime.timedelta(number_hours / 24 - 1)).year},"
-                "last year of pesticide application\n"
-            )
+            f.write(f"endApplicationYear:,{last_year},last year of pesticide application\n")
             f.write("useCSV:,0,use the slow csv input format (1) or much faster msgpack format(0)\n")
             f.write(
                 f"stepsInHr:,{self._inputs['NumberOfStepsWithinOneHour'].read().values},"
@@ -1048,6 +5212,22 @@ class LEffectModel(base.Component):
                 "the number of steps within 1 hourly time step for GUTS simulation"
             )
 
+    def resolve_population_data_type(self, deferred=False):
+        """
+        Determines the data type used to store a population output as specified by the `PopulationDataType` input.
+
+        Args:
+            deferred: Specifies whether the files are read later on, so the data type cannot be determined from the
+                values.
+
+        Returns:
+            The NumPy data type for the output, or `None` if it is determined from the values during ingestion.
+        """
+        data_type = self._read_optional_input("PopulationDataType", "auto")
+        if data_type != "auto":
+            return np.dtype(data_type)
+        return np.dtype(np.uint32) if deferred else None
+
     def store_results_per_day(
             self,
             time_slice_path,
@@ -1057,7 +5237,9 @@ class LEffectModel(base.Component):
             number_warm_up_years,
             recovery_period_years,
             number_multiplication_factors,
-            number_runs
+            number_runs,
+            deferred=False,
+            number_workers=1
     ):
         """
         Reads the results into the Landscape Model.
@@ -1071,6 +5253,8 @@ class LEffectModel(base.Component):
             recovery_period_years: The number of years added as recovery period to the simulation.
             number_multiplication_factors: The number of multiplication factors used for the module run.
             number_runs: The number of runs of the population model.
+            deferred: Specifies whether module output files are only read when the output values are requested.
+            number_workers: The number of worker processes used to read module output files.
 
         Returns:
             Nothing.
@@ -1080,25 +5264,32 @@ class LEffectModel(base.Component):
                 datetime.date(first_year - number_warm_up_years, 1, 1)
         ).days
         for file_name, output_name in result_set.items():
-            self._outputs[output_name].set_values(
-                np.ndarray,
-                shape=(number_days, number_multiplication_factors, number_runs),
-                chunks=(number_days, 1, 1),
-                element_names=(None, self.inputs["MultiplicationFactors"].describe()["element_names"][0], None),
-                offset=(first_year, None, None)
-            )
-            for multiplication_factor in range(1, number_multiplication_factors + 1):
-                for run in range(1, number_runs + 1):
-                    values = np.zeros((number_days, 1, 1), np.int)
-                    with open(os.path.join(
-                            time_slice_path.format(multiplication_factor),
-                            file_name.format(multiplication_factor, run)
-                    )) as f:
-                        for line in f:
-                            record = line[:-1].split("\t")
-                            values[int(record[0]) - 1, 0, 0] = int(record[2])
-                    self._outputs[output_name].set_values(
-                        values,
+            file_paths = {
+                (multiplication_factor, run): os.path.join(
+                    time_slice_path.format(multiplication_factor), file_name.format(multiplication_factor, run))
+                for multiplication_factor in range(1, number_multiplication_factors + 1)
+                for run in range(1, number_runs + 1)
+            }
+            data_type = self.resolve_population_data_type(deferred)
+            if data_type is None:
+                staging = stage_population_files(file_paths, number_days, 1, number_workers=number_workers)
+            else:
+                staging = contextlib.nullcontext()
+            with staging as staged:
+                if staged is not None:
+                    data_type = staged.dtype
+                self._outputs[output_name].set_values(
+                    np.ndarray,
+                    shape=(number_days, number_multiplication_factors, number_runs),
+                    data_type=data_type,
+                    chunks=(number_days, 1, 1),
+                    element_names=(None, self.inputs["MultiplicationFactors"].describe()["element_names"][0], None),
+                    offset=(first_year, None, None)
+                )
+
+                def store_file(multiplication_factor, run, values, output=output_name):
+                    self._outputs[output].set_values(
+                        values.reshape((number_days, 1, 1)),
                         slices=(
                             slice(number_days),
                             slice(multiplication_factor - 1, multiplication_factor),
@@ -1107,6 +5298,25 @@ class LEffectModel(base.Component):
                         create=False
                     )
 
+                if deferred:
+                    self._outputs[output_name].defer(
+                        lambda multiplication_factor, run, file_path, store=store_file, output_data_type=data_type:
+                        store(
+                            multiplication_factor,
+                            run,
+                            read_population_values(file_path, number_days, 1, output_data_type)
+                        ),
+                        file_paths,
+                        1
+                    )
+                elif staged is not None:
+                    for i, (multiplication_factor, run) in enumerate(file_paths):
+                        store_file(multiplication_factor, run, staged[i])
+                else:
+                    for (multiplication_factor, run), values in iterate_population_files(
+                            file_paths, number_days, 1, data_type, number_workers):
+                        store_file(multiplication_factor, run, values)
+
     def store_results_per_day_and_reach(
             self,
             time_slice_path,
@@ -1117,7 +5327,12 @@ class LEffectModel(base.Component):
             recovery_period_years,
             number_reaches,
             number_multiplication_factors,
-            number_runs
+            number_runs,
+            deferred=False,
+            number_workers=1,
+            buffer_path=None,
+            write_block_size=2 ** 28,
+            reach_indices=None
     ):
         """
         Reads the results into the Landscape Model.
@@ -1132,40 +5347,61 @@ class LEffectModel(base.Component):
             number_reaches: The number of reaches simulated.
             number_multiplication_factors: The number of multiplication factors used for the module run.
             number_runs: The number of runs of the population model.
+            deferred: Specifies whether module output files are only read when the output values are requested.
+            number_workers: The number of worker processes used to read module output files.
+            buffer_path: A directory for a temporary memory-mapped buffer. If given, all values of an output are
+                first collected in the buffer and then written to the store in large blocks of complete chunks.
+            write_block_size: The approximate size in bytes of a block written from the buffer to the store.
+            reach_indices: The indices of the simulated reaches if only reaches of interest are simulated.
 
         Returns:
             Nothing.
         """
+        reach_names, reach_geometries = self.get_reach_metadata(reach_indices)
         number_days = (
                 datetime.date(first_year + number_years + recovery_period_years, 1, 1) -
                 datetime.date(first_year - number_warm_up_years, 1, 1)
         ).days
         for file_name, output_name in result_set.items():
-            self._outputs[output_name].set_values(
-                np.ndarray,
-                shape=(number_days, number_reaches, number_multiplication_factors, number_runs),
-                chunks=(number_days, 1, 1, 1),
-                element_names=(
-                    None,
-                    self.inputs["Concentrations"].describe()["element_names"][1],
-                    self.inputs["MultiplicationFactors"].describe()["element_names"][0],
-                    None
-                ),
-                offset=(first_year, None, None, None),
-                geometries=(None, self.inputs["Concentrations"].describe()["geometries"][1], None, None)
-            )
-            for multiplication_factor in range(1, number_multiplication_factors + 1):
-                for run in range(1, number_runs + 1):
-                    values = np.zeros((number_days, number_reaches, 1, 1), np.int)
-                    with open(os.path.join(
-                            time_slice_path.format(multiplication_factor),
-                            file_name.format(multiplication_factor, run)
-                    )) as f:
-                        for i, line in enumerate(f):
-                            record = line[:-1].split("\t")
-                            values[(int(record[0]) - 1), slice(number_reaches), 0, 0] = [int(x) for x in record[2:]]
-                    self._outputs[output_name].set_values(
-                        values,
+            file_paths = {
+                (multiplication_factor, run): os.path.join(
+                    time_slice_path.format(multiplication_factor), file_name.format(multiplication_factor, run))
+                for multiplication_factor in range(1, number_multiplication_factors + 1)
+                for run in range(1, number_runs + 1)
+            }
+            data_type = self.resolve_population_data_type(deferred)
+            if not deferred and (buffer_path or data_type is None):
+                staging = stage_population_files(
+                    file_paths,
+                    number_days,
+                    number_reaches,
+                    data_type,
+                    number_workers,
+                    os.path.join(buffer_path, f"{output_name}.buffer") if buffer_path else None
+                )
+            else:
+                staging = contextlib.nullcontext()
+            with staging as staged:
+                if staged is not None:
+                    data_type = staged.dtype
+                self._outputs[output_name].set_values(
+                    np.ndarray,
+                    shape=(number_days, number_reaches, number_multiplication_factors, number_runs),
+                    data_type=data_type,
+                    chunks=(number_days, 1, 1, 1),
+                    element_names=(
+                        None,
+                        reach_names,
+                        self.inputs["MultiplicationFactors"].describe()["element_names"][0],
+                        None
+                    ),
+                    offset=(first_year, None, None, None),
+                    geometries=(None, reach_geometries, None, None)
+                )
+
+                def store_file(multiplication_factor, run, values, output=output_name):
+                    self._outputs[output].set_values(
+                        values.reshape((number_days, number_reaches, 1, 1)),
                         slices=(
                             slice(number_days),
                             slice(number_reaches),
@@ -1175,43 +5411,469 @@ class LEffectModel(base.Component):
                         create=False
                     )
 
-    def store_results_per_year_and_reach(
-            self, time_slice_path, result_set, number_years, number_reaches, number_multiplication_factors, first_year):
+                if deferred:
+                    self._outputs[output_name].defer(
+                        lambda multiplication_factor, run, file_path, store=store_file, output_data_type=data_type:
+                        store(
+                            multiplication_factor,
+                            run,
+                            read_population_values(file_path, number_days, number_reaches, output_data_type)
+                        ),
+                        file_paths,
+                        2
+                    )
+                elif buffer_path:
+                    runs_per_block = int(max(1, min(
+                        number_runs, write_block_size // max(number_reaches * number_days * data_type.itemsize, 1))))
+                    for multiplication_factor in range(number_multiplication_factors):
+                        for first_run in range(0, number_runs, runs_per_block):
+                            last_run = min(first_run + runs_per_block, number_runs)
+                            self._outputs[output_name].set_values(
+                                np.ascontiguousarray(
+                                    staged[
+                                        multiplication_factor * number_runs + first_run:
+                                        multiplication_factor * number_runs + last_run
+                                    ].transpose((1, 2, 0))
+                                ).reshape((number_days, number_reaches, 1, last_run - first_run)),
+                                slices=(
+                                    slice(number_days),
+                                    slice(number_reaches),
+                                    slice(multiplication_factor, multiplication_factor + 1),
+                                    slice(first_run, last_run)
+                                ),
+                                create=False
+                            )
+                elif staged is not None:
+                    for i, (multiplication_factor, run) in enumerate(file_paths):
+                        store_file(multiplication_factor, run, staged[i])
+                else:
+                    for (multiplication_factor, run), values in iterate_population_files(
+                            file_paths, number_days, number_reaches, data_type, number_workers):
+                        store_file(multiplication_factor, run, values)
+
+    def store_statistics_per_day_and_reach(
+            self,
+            time_slice_path,
+            result_set,
+            first_year,
+            number_years,
+            number_warm_up_years,
+            recovery_period_years,
+            number_reaches,
+            number_multiplication_factors,
+            number_runs,
+            quantiles,
+            number_workers=1,
+            reach_indices=None
+    ):
         """
-        Reads the results into the Landscape Model.
+        Reads the results into the Landscape Model as summary statistics across Monte Carlo runs. Runs are streamed
+        one at a time, so the full array of all runs is never held in memory.
 
         Args:
             time_slice_path: The file path of the sliced module output files.
             result_set: A dictionary that maps file names to component outputs.
+            first_year: The first year of the simulation as an integer number.
             number_years: The number of years simulated.
+            number_warm_up_years: The number of years used to warm up the module.
+            recovery_period_years: The number of years added as recovery period to the simulation.
             number_reaches: The number of reaches simulated.
             number_multiplication_factors: The number of multiplication factors used for the module run.
+            number_runs: The number of runs of the population model.
+            quantiles: The quantiles to report.
+            number_workers: The number of worker processes used to read module output files.
+            reach_indices: The indices of the simulated reaches if only reaches of interest are simulated.
+
+        Returns:
+            Nothing.
+        """
+        reach_names, reach_geometries = self.get_reach_metadata(reach_indices)
+        years = range(first_year - number_warm_up_years, first_year + number_years + recovery_period_years)
+        year_starts = [(datetime.date(year, 1, 1) - datetime.date(years[0], 1, 1)).days for year in years]
+        number_days = (datetime.date(years[-1] + 1, 1, 1) - datetime.date(years[0], 1, 1)).days
+        element_names = (
+            None,
+            reach_names,
+            self.inputs["MultiplicationFactors"].describe()["element_names"][0]
+        )
+        geometries = (None, reach_geometries, None)
+        self._outputs["PopulationQuantiles"].set_values(
+            [float(quantile) for quantile in quantiles],
+            scales="other/quantile",
+            element_names=(self._outputs["PopulationQuantiles"],)
+        )
+        for file_name, output_name in result_set.items():
+            file_paths = {
+                (multiplication_factor, run): os.path.join(
+                    time_slice_path.format(multiplication_factor), file_name.format(multiplication_factor, run))
+                for multiplication_factor in range(1, number_multiplication_factors + 1)
+                for run in range(1, number_runs + 1)
+            }
+            data_type = self.resolve_population_data_type()
+            self._outputs[f"{output_name}Mean"].set_values(
+                np.ndarray,
+                shape=(number_days, number_reaches, number_multiplication_factors),
+                data_type=np.float32,
+                chunks=(number_days, 1, 1),
+                element_names=element_names,
+                offset=(first_year, None, None),
+                geometries=geometries
+            )
+            self._outputs[f"{output_name}Quantiles"].set_values(
+                np.ndarray,
+                shape=(number_days, number_reaches, number_multiplication_factors, len(quantiles)),
+                data_type=np.float32,
+                chunks=(number_days, 1, 1, len(quantiles)),
+                element_names=element_names + (self._outputs["PopulationQuantiles"],),
+                offset=(first_year, None, None, None),
+                geometries=geometries + (None,)
+            )
+            annual_minimum = np.full(
+                (len(years), number_reaches, number_multiplication_factors), np.iinfo(np.int64).max, np.int64)
+            annual_maximum = np.full(
+                (len(years), number_reaches, number_multiplication_factors), np.iinfo(np.int64).min, np.int64)
+            for multiplication_factor in range(1, number_multiplication_factors + 1):
+                total = np.zeros((number_days, number_reaches), np.float64)
+                sketch = P2QuantileSketch((number_days, number_reaches), quantiles)
+                for _, values in iterate_population_files(
+                        {key: path for key, path in file_paths.items() if key[0] == multiplication_factor},
+                        number_days,
+                        number_reaches,
+                        data_type or np.int64,
+                        number_workers
+                ):
+                    total += values
+                    sketch.add(values)
+                    np.minimum(
+                        annual_minimum[..., multiplication_factor - 1],
+                        np.minimum.reduceat(values, year_starts, 0),
+                        out=annual_minimum[..., multiplication_factor - 1]
+                    )
+                    np.maximum(
+                        annual_maximum[..., multiplication_factor - 1],
+                        np.maximum.reduceat(values, year_starts, 0),
+                        out=annual_maximum[..., multiplication_factor - 1]
+                    )
+                self._outputs[f"{output_name}Mean"].set_values(
+                    (total / number_runs).astype(np.float32).reshape((number_days, number_reaches, 1)),
+                    slices=(
+                        slice(number_days),
+                        slice(number_reaches),
+                        slice(multiplication_factor - 1, multiplication_factor)
+                    ),
+                    create=False
+                )
+                self._outputs[f"{output_name}Quantiles"].set_values(
+                    sketch.estimate().reshape((number_days, number_reaches, 1, len(quantiles))),
+                    slices=(
+                        slice(number_days),
+                        slice(number_reaches),
+                        slice(multiplication_factor - 1, multiplication_factor),
+                        slice(len(quantiles))
+                    ),
+                    create=False
+                )
+            if data_type is None:
+                data_type = smallest_integer_type(int(annual_minimum.min()), int(annual_maximum.max()))
+            for statistic, values in (("AnnualMinimum", annual_minimum), ("AnnualMaximum", annual_maximum)):
+                self._outputs[f"{output_name}{statistic}"].set_values(
+                    values.astype(data_type),
+                    chunks=(len(years), number_reaches, 1),
+                    element_names=element_names,
+                    offset=(first_year, None, None),
+                    geometries=geometries
+                )
+
+    def store_sparse_results_per_day_and_reach(
+            self,
+            time_slice_path,
+            result_set,
+            first_year,
+            number_years,
+            number_warm_up_years,
+            recovery_period_years,
+            number_reaches,
+            number_multiplication_factors,
+            number_runs,
+            processing_path,
+            number_workers=1,
+            reach_indices=None
+    ):
+        """
+        Reads the results into the Landscape Model using a sparse encoding. Values within spans are collected in a
+        temporary file while reading the module outputs and written to the store once their total number is known.
+
+        Args:
+            time_slice_path: The file path of the sliced module output files.
+            result_set: A dictionary that maps file names to component outputs.
             first_year: The first year of the simulation as an integer number.
+            number_years: The number of years simulated.
+            number_warm_up_years: The number of years used to warm up the module.
+            recovery_period_years: The number of years added as recovery period to the simulation.
+            number_reaches: The number of reaches simulated.
+            number_multiplication_factors: The number of multiplication factors used for the module run.
+            number_runs: The number of runs of the population model.
+            processing_path: The working directory of the module, used for temporary files.
+            number_workers: The number of worker processes used to read module output files.
+            reach_indices: The indices of the simulated reaches if only reaches of interest are simulated.
 
         Returns:
             Nothing.
         """
+        reach_names, reach_geometries = self.get_reach_metadata(reach_indices)
+        number_days = (
+                datetime.date(first_year + number_years + recovery_period_years, 1, 1) -
+                datetime.date(first_year - number_warm_up_years, 1, 1)
+        ).days
+        for file_name, output_name in result_set.items():
+            file_paths = {
+                (multiplication_factor, run): os.path.join(
+                    time_slice_path.format(multiplication_factor), file_name.format(multiplication_factor, run))
+                for multiplication_factor in range(1, number_multiplication_factors + 1)
+                for run in range(1, number_runs + 1)
+            }
+            data_type = self.resolve_population_data_type()
+            read_data_type = data_type or np.dtype(np.int64)
+            minimum = maximum = 0
+            spans = np.zeros((number_reaches, number_multiplication_factors, number_runs, 3), np.int64)
+            number_values = 0
+            values_file = os.path.join(processing_path, f"{output_name}Values.tmp")
+            try:
+                with open(values_file, "wb") as f:
+                    for (multiplication_factor, run), values in iterate_population_files(
+                            file_paths, number_days, number_reaches, read_data_type, number_workers):
+                        first_day, length, span_values = encode_population_spans(values)
+                        if span_values.size > 0:
+                            minimum = min(minimum, int(span_values.min()))
+                            maximum = max(maximum, int(span_values.max()))
+                        spans[:, multiplication_factor - 1, run - 1, 0] = first_day
+                        spans[:, multiplication_factor - 1, run - 1, 1] = length
+                        spans[:, multiplication_factor - 1, run - 1, 2] = number_values + np.cumsum(length) - length
+                        span_values.tofile(f)
+                        number_values += span_values.size
+                self._outputs[f"{output_name}Spans"].set_values(
+                    spans,
+                    chunks=spans.shape,
+                    element_names=(
+                        reach_names,
+                        self.inputs["MultiplicationFactors"].describe()["element_names"][0],
+                        None,
+                        None
+                    ),
+                    geometries=(reach_geometries, None, None, None)
+                )
+                if data_type is None:
+                    data_type = smallest_integer_type(minimum, maximum)
+                chunk_size = min(max(number_values, 1), 2 ** 22)
+                self._outputs[f"{output_name}Values"].set_values(
+                    np.ndarray, shape=(number_values,), data_type=data_type, chunks=(chunk_size,))
+                if number_values > 0:
+                    stored_values = np.memmap(values_file, read_data_type, "r", shape=(number_values,))
+                    try:
+                        for i in range(0, number_values, chunk_size):
+                            self._outputs[f"{output_name}Values"].set_values(
+                                stored_values[i:i + chunk_size].astype(data_type),
+                                slices=(slice(i, min(i + chunk_size, number_values)),),
+                                create=False
+                            )
+                    finally:
+                        del stored_values
+            finally:
+                remove_path(values_file)
+
+    def store_results_per_year_and_reach(
+            self,
+            time_slice_path,
+            result_set,
+            number_years,
+            number_reaches,
+            number_multiplication_factors,
+            first_year,
+            number_workers=1,
+            reach_partitions=None,
+            reach_indices=None,
+            first_year_index=0
+    ):
+        """
+        Reads the results into the Landscape Model.
+
+        Args:
+            time_slice_path: The file path of the sliced module output files.
+            result_set: A dictionary that maps file names to component outputs.
+            number_years: The number of years simulated.
+            number_reaches: The number of reaches simulated.
+            number_multiplication_factors: The number of multiplication factors used for the module run.
+            first_year: The first simulated year as an integer number.
+            number_workers: The number of worker processes used to read the yearly module output files.
+            reach_partitions: An optional list of tuples of the file path of the sliced module output files of a
+                partition and the indices of its reaches. If specified, results are read from the partitions and
+                stitched together in the original order of reaches instead of being read from the `time_slice_path`.
+                Indices refer to the simulated reaches.
+            reach_indices: The indices of the simulated reaches if only reaches of interest are simulated.
+            first_year_index: The index of the first simulated year by which the yearly module output files are
+                numbered.
+
+        Returns:
+            A dictionary of the stored values by output name.
+        """
+        reach_names, reach_geometries = self.get_reach_metadata(reach_indices)
+        data_type = np.dtype(self._read_optional_input("SurvivalDataType", "float64"))
+        if reach_partitions is None:
+            reach_partitions = [(time_slice_path, range(number_reaches))]
+        stored_values = {}
         for file_name, output_name in result_set.items():
-            values = np.zeros((number_years, number_reaches, number_multiplication_factors), np.float)
-            for y in range(number_years):
-                with open(os.path.join(time_slice_path.format(y), file_name)) as f:
-                    for i, line in enumerate(f):
-                        record = line.replace("\n", "").split("\t")
-                        values[y, i, slice(number_multiplication_factors)] = [float(x) for x in record]
+            values = np.zeros((number_years, number_reaches, number_multiplication_factors), data_type)
+            for partition_path, partition_indices in reach_partitions:
+                values[:, partition_indices] = read_tables(
+                    [
+                        os.path.join(partition_path.format(first_year_index + y), file_name)
+                        for y in range(number_years)
+                    ],
+                    (number_years, len(partition_indices), number_multiplication_factors),
+                    data_type,
+                    number_workers
+                )
             self._outputs[output_name].set_values(
                 values,
                 chunks=(number_years, number_reaches, number_multiplication_factors),
                 element_names=(
                     None,
-                    self.inputs["Concentrations"].describe()["element_names"][1],
+                    reach_names,
                     self.inputs["MultiplicationFactors"].describe()["element_names"][0]
                 ),
                 offset=(first_year, None, None),
-                geometries=(None, self.inputs["Concentrations"].describe()["geometries"][1], None)
+                geometries=(None, reach_geometries, None)
+            )
+            stored_values[output_name] = values
+        return stored_values
+
+    def store_dose_response(self, survival, multiplication_factors, first_year, reach_indices=None):
+        """
+        Fits log-logistic dose-response curves to the annual survival of all years and reaches at once and stores the
+        multiplication factors of 10% and 50% effect. Effect levels not reached by any multiplication factor are
+        right-censored and, like the results of fits that did not converge, stored as not-a-number, since the
+        extrapolated curve of a survival that barely responds to the multiplication factors is not meaningful.
+        Multiplication factors that are not positive are not considered by the fit. The fit is skipped with a warning
+        if fewer than three positive multiplication factors are used.
+
+        Args:
+            survival: The survival per year, reach and multiplication factor.
+            multiplication_factors: The multiplication factors used for the module run.
+            first_year: The first simulated year as an integer number.
+            reach_indices: The indices of the simulated reaches if only reaches of interest are simulated.
+
+        Returns:
+            Nothing.
+        """
+        multiplication_factors = np.asarray(multiplication_factors, np.float64)
+        positive = multiplication_factors > 0
+        if np.unique(multiplication_factors[positive]).size < 3:
+            if self.default_observer:
+                self.default_observer.write_message(
+                    3, "Dose-response curves not fitted, at least three positive multiplication factors required")
+            return
+        order = np.argsort(multiplication_factors[positive])
+        responses = np.asarray(survival, np.float64)[..., np.flatnonzero(positive)[order]]
+        upper, slope, log_lp50, converged = fit_log_logistic(multiplication_factors[positive][order], responses)
+        reach_names, reach_geometries = self.get_reach_metadata(reach_indices)
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+            maximum_effect = 1 - responses.min(-1) / upper
+            lp10 = np.where(converged & (maximum_effect >= .1), np.exp(log_lp50 - np.log(9) / slope), np.nan)
+            lp50 = np.where(converged & (maximum_effect >= .5), np.exp(log_lp50), np.nan)
+        for output_name, values in (("LP10", lp10), ("LP50", lp50), ("DoseResponseConverged", converged)):
+            self._outputs[output_name].set_values(
+                values,
+                chunks=values.shape,
+                element_names=(None, reach_names),
+                offset=(first_year, None),
+                geometries=(None, reach_geometries)
+            )
+
+    def store_daily_survival_per_reach(
+            self,
+            time_slice_path,
+            file_name,
+            output_name,
+            number_years,
+            number_reaches,
+            number_multiplication_factors,
+            first_year,
+            number_workers=1,
+            reach_partitions=None,
+            reach_indices=None,
+            first_year_index=0
+    ):
+        """
+        Reads the daily survival reported by the module if the `Verbosity` is `1` into the Landscape Model. The files
+        of all years of a multiplication factor are parsed in bulk, optionally by a pool of worker processes, and the
+        values of a multiplication factor are stored at once, so that every time series chunk is written only once.
+
+        Args:
+            time_slice_path: The file path of the sliced module output files.
+            file_name: The name of the daily survival file within the directory of a multiplication factor.
+            output_name: The name of the component output.
+            number_years: The number of years simulated.
+            number_reaches: The number of reaches simulated.
+            number_multiplication_factors: The number of multiplication factors used for the module run.
+            first_year: The first simulated year as an integer number.
+            number_workers: The number of worker processes used to read the module output files.
+            reach_partitions: An optional list of tuples of the file path of the sliced module output files of a
+                partition and the indices of its reaches. Indices refer to the simulated reaches.
+            reach_indices: The indices of the simulated reaches if only reaches of interest are simulated.
+            first_year_index: The index of the first simulated year by which the yearly module output files are
+                numbered.
+
+        Returns:
+            Nothing.
+        """
+        reach_names, reach_geometries = self.get_reach_metadata(reach_indices)
+        year_starts = [datetime.date(first_year + y, 1, 1) for y in range(number_years + 1)]
+        days_per_year = [(year_starts[y + 1] - year_starts[y]).days for y in range(number_years)]
+        day_indices = np.concatenate([np.arange(y * 366, y * 366 + days) for y, days in enumerate(days_per_year)])
+        if reach_partitions is None:
+            reach_partitions = [(time_slice_path, range(number_reaches))]
+        self._outputs[output_name].set_values(
+            np.ndarray,
+            shape=(len(day_indices), number_reaches, number_multiplication_factors),
+            data_type=np.float32,
+            chunks=(len(day_indices), 1, 1),
+            element_names=(
+                None,
+                reach_names,
+                self.inputs["MultiplicationFactors"].describe()["element_names"][0]
+            ),
+            offset=(first_year, None, None),
+            geometries=(None, reach_geometries, None)
+        )
+        for multiplication_factor in range(1, number_multiplication_factors + 1):
+            values = np.zeros((len(day_indices), number_reaches), np.float32)
+            for partition_path, partition_indices in reach_partitions:
+                values[:, partition_indices] = read_tables(
+                    [
+                        os.path.join(
+                            partition_path.format(first_year_index + y),
+                            f"x1s{multiplication_factor}",
+                            file_name.format(multiplication_factor)
+                        )
+                        for y in range(number_years)
+                    ],
+                    (number_years, 366, len(partition_indices)),
+                    np.float32,
+                    number_workers,
+                    read_daily_table_into
+                ).reshape((-1, len(partition_indices)))[day_indices]
+            self._outputs[output_name].set_values(
+                values.reshape((len(day_indices), number_reaches, 1)),
+                slices=(
+                    slice(len(day_indices)),
+                    slice(number_reaches),
+                    slice(multiplication_factor - 1, multiplication_factor)
+                ),
+                create=False
             )
 
     def prepare_water_temperatures(
-            self, temperature_file, from_year, to_year):
+            self, temperature_file, from_year, to_year, shared_cache_path=None):
         """
         Prepares a CSV-file containing daily water temperatures.
 
@@ -1219,14 +5881,47 @@ class LEffectModel(base.Component):
             temperature_file: The file path for the temperature file.
             from_year: The first year for which temperature data is needed.
             to_year: The last year for which temperature data is needed.
+            shared_cache_path: The directory of a cache shared with other models, used if the
+                `PreparedInputCachePath` input is not set.
 
         Returns:
             Nothing.
         """
         water_temperatures = self.inputs["WaterTemperature"].read(
             select={"time/day": {"from": datetime.date(from_year, 1, 1), "to": datetime.date(to_year + 1, 1, 1)}})
+        cache_path = self._read_optional_input("PreparedInputCachePath", shared_cache_path)
+        if cache_path:
+            fingerprint = hashlib.sha256(str(from_year).encode())
+            fingerprint.update(np.ascontiguousarray(water_temperatures.values, np.float64).tobytes())
+            self.prepare_cached_files(
+                cache_path,
+                f"temperatures_{fingerprint.hexdigest()}",
+                os.path.dirname(temperature_file),
+                lambda staging_path: self.write_water_temperatures(
+                    os.path.join(staging_path, os.path.basename(temperature_file)),
+                    water_temperatures.values,
+                    from_year
+                )
+            )
+        else:
+            self.write_water_temperatures(temperature_file, water_temperatures.values, from_year)
+
+    @staticmethod
+    def write_water_temperatures(temperature_file, water_temperatures, from_year):
+        """
+        Writes a CSV-file containing daily water temperatures.
+
+        Args:
+            temperature_file: The file path for the temperature file.
+            water_temperatures: The daily water temperatures.
+            from_year: The year of the first water temperature.
+
+        Returns:
+            Nothing.
+        """
         day = datetime.date(from_year, 1, 1)
+        remove_path(temperature_file)
         with open(temperature_file, "w") as f:
-            for value in water_temperatures.values:
+            for value in water_temperatures:
                 f.write(f"{day.strftime('%Y%m%d')},{round(float(value), 2)}\n")
                 day += datetime.timedelta(1)
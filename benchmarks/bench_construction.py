@@ -0,0 +1,42 @@
+"""
+Benchmark scenarios of importing the component module and constructing component instances.
+
+Experiments that create many component instances pay the construction cost for every instance, so it is measured
+separately from the binding of inputs and outputs, which happens on first access:
+
+    python -m pytest benchmarks/bench_construction.py
+"""
+import os
+import subprocess
+import sys
+import pytest
+import synthetic  # noqa: F401 (makes the component module importable)
+from LEffectModule import LEffectModel
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_import_module(benchmark):
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    benchmark.pedantic(
+        subprocess.run,
+        ([sys.executable, "-c", "import LEffectModule"],),
+        {"env": environment, "check": True},
+        rounds=5,
+        iterations=1
+    )
+
+
+def test_construct_component(benchmark):
+    component = benchmark(LEffectModel, "LEffectModel", None, None)
+    assert component.MODULE is LEffectModel.MODULE
+
+
+def test_construct_and_bind_component(benchmark):
+    def construct_and_bind():
+        component = LEffectModel("LEffectModel", None, None)
+        return component.inputs, component.outputs
+
+    inputs, outputs = benchmark(construct_and_bind)
+    assert len(inputs) == len(LEffectModel.INPUT_SPECIFICATIONS)
+    assert len(outputs) == len(LEffectModel.OUTPUT_SPECIFICATIONS)
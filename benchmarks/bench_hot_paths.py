@@ -0,0 +1,309 @@
+"""
+Benchmark scenarios of the preparation of module inputs and the ingestion of module outputs.
+
+The scenarios use synthetic stores and module outputs written by the stub module, so they run on any machine with
+`pytest-benchmark` installed:
+
+    python -m pytest benchmarks/bench_hot_paths.py
+
+Use `--compare-baselines` to compare median times relative to the reference scenario of `conftest.py` with
+`baselines.json`, and `--record-baselines` to record new baselines.
+"""
+import datetime
+import os
+import numpy as np
+import pytest
+import stub_module
+import synthetic
+from LEffectModule import ModuleOutputArchive, ModuleOutputArchiver
+
+pytest.importorskip("pytest_benchmark")
+
+SIMULATION_START = datetime.date(2000, 1, 1)
+# noinspection SpellCheckingInspection
+POPULATION_BY_REACH_RESULT_SET = {
+    "x1s{}r{}_adultPopByReach.txt": "AdultPopulationByReach",
+    "x1s{}r{}_embryoPopByReach.txt": "EmbryoPopulationByReach",
+    "x1s{}r{}_juvAndAdultPopByReach.txt": "JuvenileAndAdultPopulationByReach",
+    "x1s{}r{}_juvenilePopByReach.txt": "JuvenilePopulationByReach"
+}
+# noinspection SpellCheckingInspection
+METAPOPULATION_RESULT_SET = {
+    "x1s{}r{}_adultMetapop.txt": "AdultMetaPopulation",
+    "x1s{}r{}_embryoMetapop.txt": "EmbryoMetaPopulation",
+    "x1s{}r{}_extantLocalPopsMetapop.txt": "ExtantLocalPopulationsMetaPopulation",
+    "x1s{}r{}_juvAndAdultMetapop.txt": "JuvenileAndAdultMetaPopulation",
+    "x1s{}r{}_juvenileMetapop.txt": "JuvenileMetaPopulation"
+}
+POPULATION_SCENARIO = {"number_years": 2, "number_reaches": 200, "number_multiplication_factors": 2, "number_runs": 4}
+SURVIVAL_SCENARIO = {"number_years": 10, "number_reaches": 2000, "number_multiplication_factors": 5}
+DAILY_SURVIVAL_SCENARIO = {"number_years": 2, "number_reaches": 500, "number_multiplication_factors": 3}
+DOSE_RESPONSE_SCENARIO = {"number_years": 20, "number_reaches": 5000, "number_multiplication_factors": 8}
+
+
+def hours(number_years):
+    return (datetime.date(SIMULATION_START.year + number_years, 1, 1) - SIMULATION_START).days * 24
+
+
+@pytest.fixture(scope="module")
+def population_outputs(tmp_path_factory):
+    processing_path = str(tmp_path_factory.mktemp("LPopSD"))
+    stub_module.write_module_outputs(processing_path, "LPopSD", SIMULATION_START.year, **POPULATION_SCENARIO)
+    return processing_path
+
+
+@pytest.fixture(scope="module")
+def survival_outputs(tmp_path_factory):
+    processing_path = str(tmp_path_factory.mktemp("CatchmentGUTSSD"))
+    stub_module.write_module_outputs(
+        processing_path, "CatchmentGUTSSD", SIMULATION_START.year, **SURVIVAL_SCENARIO)
+    return processing_path
+
+
+@pytest.fixture(scope="module")
+def daily_survival_outputs(tmp_path_factory):
+    processing_path = str(tmp_path_factory.mktemp("CatchmentGUTSSD"))
+    stub_module.write_module_outputs(
+        processing_path, "CatchmentGUTSSD", SIMULATION_START.year, daily_survival=True, **DAILY_SURVIVAL_SCENARIO)
+    return processing_path
+
+
+def population_component(options=None):
+    return synthetic.BenchmarkComponent(
+        synthetic.synthetic_store(
+            POPULATION_SCENARIO["number_reaches"],
+            hours(POPULATION_SCENARIO["number_years"]),
+            POPULATION_SCENARIO["number_multiplication_factors"],
+            POPULATION_SCENARIO["number_runs"]
+        ),
+        options
+    )
+
+
+@pytest.mark.parametrize("number_years", [1, 10, 30])
+def test_get_time_slices(benchmark, number_years):
+    component = synthetic.BenchmarkComponent(synthetic.synthetic_store(1, hours(number_years)))
+    time_slices = benchmark(component.get_time_slices)
+    assert len(time_slices) == number_years
+
+
+@pytest.mark.parametrize("number_reaches", [100, 1000])
+def test_prepare_concentrations(benchmark, tmp_path, number_reaches):
+    component = synthetic.BenchmarkComponent(synthetic.synthetic_store(number_reaches, hours(2)))
+    time_slices = component.get_time_slices()
+    benchmark.pedantic(
+        component.prepare_concentrations, (str(tmp_path), time_slices, SIMULATION_START), rounds=3, iterations=1)
+    assert len(os.listdir(tmp_path)) == 2
+
+
+@pytest.mark.parametrize("number_years", [10, 40])
+def test_prepare_water_temperatures(benchmark, tmp_path, number_years):
+    component = synthetic.BenchmarkComponent(synthetic.synthetic_store(1, hours(number_years), number_warm_up_years=5))
+    temperature_file = str(tmp_path / "water_temperature.csv")
+    benchmark(
+        component.prepare_water_temperatures,
+        temperature_file,
+        SIMULATION_START.year - 5,
+        SIMULATION_START.year + number_years
+    )
+    assert os.path.getsize(temperature_file) > 0
+
+
+@pytest.mark.parametrize("number_workers", [1, 4])
+def test_store_results_per_day(benchmark, population_outputs, number_workers):
+    component = population_component()
+    # noinspection SpellCheckingInspection
+    benchmark.pedantic(
+        component.store_results_per_day,
+        (
+            os.path.join(population_outputs, "ecotalk", "LPopSDModelSystem_MoS", "x1", "x1s{}"),
+            METAPOPULATION_RESULT_SET,
+            SIMULATION_START.year,
+            POPULATION_SCENARIO["number_years"],
+            0,
+            0,
+            POPULATION_SCENARIO["number_multiplication_factors"],
+            POPULATION_SCENARIO["number_runs"],
+            False,
+            number_workers
+        ),
+        rounds=3,
+        iterations=1
+    )
+    assert component.outputs["AdultMetaPopulation"].values.any()
+
+
+@pytest.mark.parametrize("number_workers,memory_mapped", [(1, False), (4, False), (1, True)])
+def test_store_results_per_day_and_reach(benchmark, population_outputs, number_workers, memory_mapped):
+    component = population_component()
+    # noinspection SpellCheckingInspection
+    benchmark.pedantic(
+        component.store_results_per_day_and_reach,
+        (
+            os.path.join(population_outputs, "ecotalk", "LPopSDModelSystem_MoS", "x1", "x1s{}"),
+            POPULATION_BY_REACH_RESULT_SET,
+            SIMULATION_START.year,
+            POPULATION_SCENARIO["number_years"],
+            0,
+            0,
+            POPULATION_SCENARIO["number_reaches"],
+            POPULATION_SCENARIO["number_multiplication_factors"],
+            POPULATION_SCENARIO["number_runs"],
+            False,
+            number_workers,
+            population_outputs if memory_mapped else None
+        ),
+        rounds=3,
+        iterations=1
+    )
+    assert component.outputs["AdultPopulationByReach"].values.any()
+
+
+def test_store_statistics_per_day_and_reach(benchmark, population_outputs):
+    component = population_component()
+    # noinspection SpellCheckingInspection
+    benchmark.pedantic(
+        component.store_statistics_per_day_and_reach,
+        (
+            os.path.join(population_outputs, "ecotalk", "LPopSDModelSystem_MoS", "x1", "x1s{}"),
+            POPULATION_BY_REACH_RESULT_SET,
+            SIMULATION_START.year,
+            POPULATION_SCENARIO["number_years"],
+            0,
+            0,
+            POPULATION_SCENARIO["number_reaches"],
+            POPULATION_SCENARIO["number_multiplication_factors"],
+            POPULATION_SCENARIO["number_runs"],
+            [.05, .5, .95]
+        ),
+        rounds=3,
+        iterations=1
+    )
+    assert component.outputs["AdultPopulationByReachMean"].values.any()
+
+
+def test_store_sparse_results_per_day_and_reach(benchmark, population_outputs):
+    component = population_component()
+    # noinspection SpellCheckingInspection
+    benchmark.pedantic(
+        component.store_sparse_results_per_day_and_reach,
+        (
+            os.path.join(population_outputs, "ecotalk", "LPopSDModelSystem_MoS", "x1", "x1s{}"),
+            POPULATION_BY_REACH_RESULT_SET,
+            SIMULATION_START.year,
+            POPULATION_SCENARIO["number_years"],
+            0,
+            0,
+            POPULATION_SCENARIO["number_reaches"],
+            POPULATION_SCENARIO["number_multiplication_factors"],
+            POPULATION_SCENARIO["number_runs"],
+            population_outputs
+        ),
+        rounds=3,
+        iterations=1
+    )
+    assert component.outputs["AdultPopulationByReachValues"].values.any()
+
+
+@pytest.mark.parametrize("number_workers", [1, 4])
+def test_store_results_per_year_and_reach(benchmark, survival_outputs, number_workers):
+    component = synthetic.BenchmarkComponent(
+        synthetic.synthetic_store(
+            SURVIVAL_SCENARIO["number_reaches"],
+            hours(SURVIVAL_SCENARIO["number_years"]),
+            SURVIVAL_SCENARIO["number_multiplication_factors"]
+        )
+    )
+    # noinspection SpellCheckingInspection
+    benchmark.pedantic(
+        component.store_results_per_year_and_reach,
+        (
+            os.path.join(survival_outputs, "ecotalk", "CatchmentGUTSSDModelSystem_MoS_{}", "x1"),
+            {"guts_survival_reaches.txt_mfactors.txt": "GutsSurvivalReaches"},
+            SURVIVAL_SCENARIO["number_years"],
+            SURVIVAL_SCENARIO["number_reaches"],
+            SURVIVAL_SCENARIO["number_multiplication_factors"],
+            SIMULATION_START.year,
+            number_workers
+        ),
+        rounds=3,
+        iterations=1
+    )
+    assert component.outputs["GutsSurvivalReaches"].values.shape == (
+        SURVIVAL_SCENARIO["number_years"],
+        SURVIVAL_SCENARIO["number_reaches"],
+        SURVIVAL_SCENARIO["number_multiplication_factors"]
+    )
+
+
+@pytest.mark.parametrize("number_workers", [1, 4])
+def test_store_daily_survival_per_reach(benchmark, daily_survival_outputs, number_workers):
+    component = synthetic.BenchmarkComponent(
+        synthetic.synthetic_store(
+            DAILY_SURVIVAL_SCENARIO["number_reaches"],
+            hours(DAILY_SURVIVAL_SCENARIO["number_years"]),
+            DAILY_SURVIVAL_SCENARIO["number_multiplication_factors"]
+        )
+    )
+    # noinspection SpellCheckingInspection
+    benchmark.pedantic(
+        component.store_daily_survival_per_reach,
+        (
+            os.path.join(daily_survival_outputs, "ecotalk", "CatchmentGUTSSDModelSystem_MoS_{}", "x1"),
+            "x1s{}r1_guts_survival_reaches.txt",
+            "GutsSurvivalReachesPerDay",
+            DAILY_SURVIVAL_SCENARIO["number_years"],
+            DAILY_SURVIVAL_SCENARIO["number_reaches"],
+            DAILY_SURVIVAL_SCENARIO["number_multiplication_factors"],
+            SIMULATION_START.year,
+            number_workers
+        ),
+        rounds=3,
+        iterations=1
+    )
+    assert component.outputs["GutsSurvivalReachesPerDay"].values.shape == (
+        hours(DAILY_SURVIVAL_SCENARIO["number_years"]) // 24,
+        DAILY_SURVIVAL_SCENARIO["number_reaches"],
+        DAILY_SURVIVAL_SCENARIO["number_multiplication_factors"]
+    )
+
+
+def test_store_dose_response(benchmark):
+    component = synthetic.BenchmarkComponent(
+        synthetic.synthetic_store(
+            DOSE_RESPONSE_SCENARIO["number_reaches"],
+            24,
+            DOSE_RESPONSE_SCENARIO["number_multiplication_factors"]
+        )
+    )
+    rng = np.random.default_rng(0)
+    shape = (DOSE_RESPONSE_SCENARIO["number_years"], DOSE_RESPONSE_SCENARIO["number_reaches"], 1)
+    multiplication_factors = np.arange(1., DOSE_RESPONSE_SCENARIO["number_multiplication_factors"] + 1)
+    survival = rng.uniform(.8, 1, shape) / (
+            1 + (multiplication_factors / rng.lognormal(1, .5, shape)) ** rng.uniform(.5, 4, shape))
+    survival = np.clip(survival + rng.normal(0, .01, survival.shape), 0, 1)
+    benchmark.pedantic(
+        component.store_dose_response,
+        (survival, multiplication_factors, SIMULATION_START.year),
+        rounds=3,
+        iterations=1
+    )
+    assert component.outputs["LP50"].values.shape == shape[:2]
+    assert component.outputs["DoseResponseConverged"].values.mean() > .9
+
+
+def test_archive_module_outputs(benchmark, population_outputs, tmp_path):
+    # noinspection SpellCheckingInspection
+    factor_path = os.path.join(population_outputs, "ecotalk", "LPopSDModelSystem_MoS", "x1", "x1s{}")
+    archive_path = str(tmp_path / ModuleOutputArchive.FILE_NAME)
+
+    def archive():
+        archiver = ModuleOutputArchiver(archive_path, population_outputs)
+        for multiplication_factor in range(1, POPULATION_SCENARIO["number_multiplication_factors"] + 1):
+            archiver.add(factor_path.format(multiplication_factor))
+        archiver.close(False)
+
+    benchmark.pedantic(archive, rounds=3, iterations=1)
+    with ModuleOutputArchive(archive_path) as archive:
+        assert len(archive.names("*PopByReach.txt")) == len(POPULATION_BY_REACH_RESULT_SET) * (
+                POPULATION_SCENARIO["number_multiplication_factors"] * POPULATION_SCENARIO["number_runs"])
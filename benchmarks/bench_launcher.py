@@ -0,0 +1,66 @@
+"""
+Benchmark scenarios of the startup cost of the virtual machine running the module.
+
+Each scenario launches the module image with statements that quit immediately, so that only the startup of the
+virtual machine and the loading of the image are measured. The headless launches of `ModuleLauncher` are compared with
+the previous launch of the GUI virtual machine. Scenarios are skipped if the module image or the virtual machine is
+not available. Set `SQUEAK_VM` to the path of a native virtual machine to include the native launch:
+
+    SQUEAK_VM=/usr/bin/squeak python -m pytest benchmarks/bench_launcher.py
+"""
+import os
+import shutil
+import subprocess
+import pytest
+import synthetic  # noqa: F401 (makes the component module importable)
+from LEffectModule import ModuleLauncher
+
+pytest.importorskip("pytest_benchmark")
+
+MODULE_PATH = os.path.join(os.path.dirname(__file__), "..", "module")
+
+
+@pytest.fixture(scope="module")
+def processing_path(tmp_path_factory):
+    if not os.path.exists(os.path.join(MODULE_PATH, "LEffectModel.image")):
+        pytest.skip("The module image is not available")
+    path = tmp_path_factory.mktemp("launcher")
+    for file_name in ("LEffectModel.image", "LEffectModel.changes"):
+        shutil.copyfile(os.path.join(MODULE_PATH, file_name), path / file_name)
+    (path / "quit.st").write_text("Smalltalk quitPrimitive\n")
+    return str(path)
+
+
+def gui_command():
+    command = (os.path.join(MODULE_PATH, "Squeak.exe"), "LEffectModel.image", "quit.st")
+    if os.name == "nt":
+        return command, {}
+    wine = shutil.which("wine")
+    if wine is None:
+        pytest.skip("Wine is not available")
+    return (wine,) + command, {}
+
+
+def launcher_command(launcher):
+    return launcher.command("LEffectModel.image", "quit.st"), launcher.subprocess_options
+
+
+@pytest.mark.parametrize("launch", ["gui", "console", "native"])
+def test_launch_module(benchmark, processing_path, launch):
+    if launch == "gui":
+        command, options = gui_command()
+    elif launch == "console":
+        if os.name != "nt" and shutil.which("wine") is None:
+            pytest.skip("Wine is not available")
+        command, options = launcher_command(ModuleLauncher(MODULE_PATH))
+    else:
+        if "SQUEAK_VM" not in os.environ:
+            pytest.skip("No native virtual machine configured by SQUEAK_VM")
+        command, options = launcher_command(ModuleLauncher(MODULE_PATH, os.environ["SQUEAK_VM"]))
+    benchmark.pedantic(
+        subprocess.run,
+        (command,),
+        dict(options, cwd=processing_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL),
+        rounds=5,
+        iterations=1
+    )
@@ -0,0 +1,110 @@
+"""
+Comparison of benchmark results with recorded baselines.
+
+Absolute times depend on the machine, so baselines are recorded relative to a reference scenario: a fixed workload of
+sorting, accumulating and parsing numbers that is timed once per session. Baselines are the median times of the
+benchmark scenarios divided by the time of the reference scenario, recorded with `--record-baselines` and kept in
+`baselines.json`. Comparisons are opt-in with `--compare-baselines`; a scenario then fails if its relative median
+time exceeds its baseline by more than the `--baseline-tolerance` factor.
+"""
+import io
+import json
+import os
+import time
+import numpy as np
+import pytest
+
+BASELINES_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+REFERENCE_ROUNDS = 5
+recorded_baselines = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("baselines")
+    group.addoption(
+        "--record-baselines",
+        action="store_true",
+        help="Record the median times of the benchmark scenarios relative to the reference scenario as new baselines."
+    )
+    group.addoption(
+        "--compare-baselines",
+        action="store_true",
+        help="Fail scenarios whose median times relative to the reference scenario exceed their baselines."
+    )
+    group.addoption(
+        "--baseline-tolerance",
+        type=float,
+        default=2.,
+        help="The factor by which a relative median time may exceed its baseline (default: 2)."
+    )
+
+
+def run_reference_scenario():
+    """
+    Runs the reference scenario against which the times of benchmark scenarios are recorded.
+
+    Returns:
+        Nothing.
+    """
+    values = np.random.default_rng(0).integers(0, 2 ** 16, 2 ** 20)
+    np.cumsum(np.sort(values))
+    np.loadtxt(io.StringIO("\n".join(f"{i}\t{value}" for i, value in enumerate(values[:2 ** 14]))), np.int64)
+
+
+@pytest.fixture(scope="session")
+def reference_time():
+    """
+    Times the reference scenario.
+
+    Returns:
+        The minimum time of the reference scenario in seconds.
+    """
+    times = []
+    for _ in range(REFERENCE_ROUNDS):
+        start = time.perf_counter()
+        run_reference_scenario()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.fixture(scope="session")
+def baselines():
+    if not os.path.exists(BASELINES_FILE):
+        return {}
+    with open(BASELINES_FILE) as f:
+        return json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def compare_with_baseline(request, baselines):
+    benchmark = request.getfixturevalue("benchmark") if "benchmark" in request.fixturenames else None
+    yield
+    if benchmark is None or benchmark.disabled or benchmark.stats is None:
+        return
+    record = request.config.getoption("record_baselines")
+    compare = request.config.getoption("compare_baselines")
+    if not record and not compare:
+        return
+    relative_median = benchmark.stats.stats.median / request.getfixturevalue("reference_time")
+    if record:
+        recorded_baselines[request.node.name] = relative_median
+    elif request.node.name in baselines:
+        tolerance = request.config.getoption("baseline_tolerance")
+        if relative_median > baselines[request.node.name] * tolerance:
+            pytest.fail(
+                f"Median time of {relative_median:.4f} times the reference scenario exceeds the baseline of "
+                f"{baselines[request.node.name]:.4f} by more than a factor of {tolerance}"
+            )
+
+
+def pytest_sessionfinish(session):
+    if recorded_baselines:
+        updated_baselines = {}
+        if os.path.exists(BASELINES_FILE):
+            with open(BASELINES_FILE) as f:
+                updated_baselines = json.load(f)
+        updated_baselines.update(
+            {name: float(f"{relative_median:.4g}") for name, relative_median in recorded_baselines.items()})
+        with open(BASELINES_FILE, "w") as f:
+            json.dump(dict(sorted(updated_baselines.items())), f, indent=4)
+            f.write("\n")
@@ -0,0 +1,98 @@
+"""
+Benchmark of the sparse encoding of population outputs by reach against dense storage.
+
+Synthetic catchments mimic LPop outputs: a share of reaches is never colonized, some local populations go extinct after
+exposure and the remaining populations fluctuate seasonally. The script reports the storage size of both
+representations and the time needed to encode them and to read them back as dense arrays.
+"""
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from LEffectModule import encode_population_spans, population_dense_view  # noqa: E402
+
+
+def synthetic_population(number_days, number_reaches, never_colonized, extinct, seed=0):
+    """
+    Creates a synthetic population time series by reach.
+
+    Args:
+        number_days: The number of simulated days.
+        number_reaches: The number of reaches.
+        never_colonized: The share of reaches that are never colonized.
+        extinct: The share of reaches whose local population goes extinct during the simulation.
+        seed: The seed of the random number generator.
+
+    Returns:
+        An array of daily individual counts per reach.
+    """
+    rng = np.random.default_rng(seed)
+    days = np.arange(number_days).reshape((-1, 1))
+    carrying_capacity = rng.uniform(20, 400, number_reaches)
+    expected = carrying_capacity * (1.2 + np.sin(2 * np.pi * days / 365.25)) / 2.2
+    values = rng.poisson(expected).astype(np.uint16)
+    reach_type = rng.random(number_reaches)
+    values[:, reach_type < never_colonized] = 0
+    is_extinct = (reach_type >= never_colonized) & (reach_type < never_colonized + extinct)
+    extinction_day = rng.integers(number_days // 4, number_days, number_reaches)
+    values[(days >= extinction_day) & is_extinct] = 0
+    return values
+
+
+def benchmark(number_days, number_reaches, never_colonized, extinct, repetitions=5):
+    """
+    Benchmarks the encoding of a synthetic catchment.
+
+    Args:
+        number_days: The number of simulated days.
+        number_reaches: The number of reaches.
+        never_colonized: The share of reaches that are never colonized.
+        extinct: The share of reaches whose local population goes extinct during the simulation.
+        repetitions: The number of repetitions of timed operations.
+
+    Returns:
+        A dictionary of benchmark results.
+    """
+    values = synthetic_population(number_days, number_reaches, never_colonized, extinct)
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        first_day, length, span_values = encode_population_spans(values)
+    encode_time = (time.perf_counter() - start) / repetitions
+    spans = np.stack((first_day, length, np.cumsum(length) - length), -1)
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        dense = population_dense_view(spans, span_values, number_days)
+    dense_view_time = (time.perf_counter() - start) / repetitions
+    assert (dense == values).all()
+    reach = int(np.argmax(length))
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        population_dense_view(spans[reach:reach + 1], span_values, number_days)
+    series_view_time = (time.perf_counter() - start) / repetitions
+    return {
+        "dense_bytes": values.nbytes,
+        "sparse_bytes": spans.nbytes + span_values.nbytes,
+        "encode_seconds": encode_time,
+        "dense_view_seconds": dense_view_time,
+        "series_view_seconds": series_view_time
+    }
+
+
+if __name__ == "__main__":
+    for scenario in (
+            (10957, 1000, .1, .1),
+            (10957, 1000, .5, .3),
+            (10957, 5000, .3, .2),
+            (10957, 5000, .7, .2)
+    ):
+        result = benchmark(*scenario)
+        print(
+            f"days={scenario[0]} reaches={scenario[1]} never_colonized={scenario[2]} extinct={scenario[3]}: "
+            f"dense {result['dense_bytes'] / 2 ** 20:.1f} MiB, sparse {result['sparse_bytes'] / 2 ** 20:.1f} MiB "
+            f"({result['sparse_bytes'] / result['dense_bytes']:.0%}), "
+            f"encode {result['encode_seconds'] * 1000:.1f} ms, "
+            f"dense view {result['dense_view_seconds'] * 1000:.1f} ms, "
+            f"single series view {result['series_view_seconds'] * 1000:.2f} ms"
+        )
@@ -0,0 +1,177 @@
+"""
+A stand-in for the LEffectModel module that writes correctly shaped `ecotalk` outputs.
+
+The stub reproduces the layout and the file formats of the module outputs read by the component: daily metapopulation
+and population-by-reach files of LPop for every multiplication factor and run, and the yearly GUTS survival tables of
+LGUTS. Values are random but plausible, so that the parsers of the component can be benchmarked on machines without
+the Squeak virtual machine.
+"""
+import datetime
+import os
+import numpy as np
+
+# noinspection SpellCheckingInspection
+METAPOPULATION_FILES = (
+    "x1s{}r{}_adultMetapop.txt",
+    "x1s{}r{}_embryoMetapop.txt",
+    "x1s{}r{}_extantLocalPopsMetapop.txt",
+    "x1s{}r{}_juvAndAdultMetapop.txt",
+    "x1s{}r{}_juvenileMetapop.txt"
+)
+# noinspection SpellCheckingInspection
+POPULATION_BY_REACH_FILES = (
+    "x1s{}r{}_adultPopByReach.txt",
+    "x1s{}r{}_embryoPopByReach.txt",
+    "x1s{}r{}_juvAndAdultPopByReach.txt",
+    "x1s{}r{}_juvenilePopByReach.txt"
+)
+
+
+def write_population_file(file_path, values, first_day):
+    """
+    Writes a population output file in the format of the module.
+
+    Args:
+        file_path: The path of the file.
+        values: A two-dimensional array of values per day and column.
+        first_day: The date of the first day.
+
+    Returns:
+        Nothing.
+    """
+    dates = np.arange(np.datetime64(first_day), np.datetime64(first_day) + values.shape[0])
+    records = np.column_stack((
+        np.arange(1, values.shape[0] + 1).astype(str),
+        np.datetime_as_string(dates),
+        values.astype(str)
+    ))
+    np.savetxt(file_path, records, "%s", "\t")
+
+
+def write_population_outputs(
+        processing_path, model, first_day, number_days, number_reaches, number_multiplication_factors, number_runs,
+        seed=0):
+    """
+    Writes the outputs of an LPop module run.
+
+    Args:
+        processing_path: The working directory of the module.
+        model: The name of the model, `LPopSD` or `LPopIT`.
+        first_day: The first simulated day including the warm-up period.
+        number_days: The number of simulated days.
+        number_reaches: The number of reaches.
+        number_multiplication_factors: The number of multiplication factors.
+        number_runs: The number of runs.
+        seed: The seed of the random number generator.
+
+    Returns:
+        Nothing.
+    """
+    rng = np.random.default_rng(seed)
+    # noinspection SpellCheckingInspection
+    model_system_path = os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS")
+    days = np.arange(number_days).reshape((-1, 1))
+    carrying_capacity = rng.uniform(20, 400, number_reaches)
+    colonized = rng.random(number_reaches) >= .3
+    for multiplication_factor in range(1, number_multiplication_factors + 1):
+        factor_path = os.path.join(model_system_path, "x1", f"x1s{multiplication_factor}")
+        os.makedirs(factor_path, exist_ok=True)
+        for run in range(1, number_runs + 1):
+            expected = carrying_capacity * (1.2 + np.sin(2 * np.pi * days / 365.25)) / 2.2
+            for file_name in POPULATION_BY_REACH_FILES:
+                values = rng.poisson(expected) * colonized
+                write_population_file(
+                    os.path.join(factor_path, file_name.format(multiplication_factor, run)), values, first_day)
+            for file_name in METAPOPULATION_FILES:
+                values = rng.poisson(expected.sum(1, keepdims=True))
+                write_population_file(
+                    os.path.join(factor_path, file_name.format(multiplication_factor, run)), values, first_day)
+
+
+def write_survival_outputs(
+        processing_path, model, number_years, number_reaches, number_multiplication_factors, first_year=None,
+        seed=0):
+    """
+    Writes the outputs of the yearly LGUTS module runs, as renamed by the component after each run.
+
+    Args:
+        processing_path: The working directory of the module.
+        model: The name of the model, `CatchmentGUTSSD` or `CatchmentGUTSIT`.
+        number_years: The number of simulated years.
+        number_reaches: The number of reaches.
+        number_multiplication_factors: The number of multiplication factors.
+        first_year: The first simulated year. If given, daily survival is written per multiplication factor as by
+            module runs with a `Verbosity` of `1`.
+        seed: The seed of the random number generator.
+
+    Returns:
+        Nothing.
+    """
+    rng = np.random.default_rng(seed)
+    for y in range(number_years):
+        # noinspection SpellCheckingInspection
+        year_path = os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS_{y}", "x1")
+        os.makedirs(year_path, exist_ok=True)
+        survival = rng.beta(20, .5, (number_reaches, 1)) ** np.arange(1, number_multiplication_factors + 1)
+        np.savetxt(os.path.join(year_path, "guts_survival_reaches.txt_mfactors.txt"), survival, "%.6f", "\t")
+        if first_year is not None:
+            first_day = datetime.date(first_year + y, 1, 1)
+            number_days = (datetime.date(first_year + y + 1, 1, 1) - first_day).days
+            progress = np.linspace(0, 1, number_days).reshape((-1, 1))
+            for multiplication_factor in range(1, number_multiplication_factors + 1):
+                factor_path = os.path.join(year_path, f"x1s{multiplication_factor}")
+                os.makedirs(factor_path, exist_ok=True)
+                write_population_file(
+                    os.path.join(factor_path, f"x1s{multiplication_factor}r1_guts_survival_reaches.txt"),
+                    np.round(survival[:, multiplication_factor - 1] ** progress, 6),
+                    first_day
+                )
+
+
+def write_module_outputs(
+        processing_path, model, first_year, number_years, number_reaches, number_multiplication_factors,
+        number_runs=1, number_warm_up_years=0, recovery_period_years=0, daily_survival=False, seed=0):
+    """
+    Writes the outputs of a complete module run.
+
+    Args:
+        processing_path: The working directory of the module.
+        model: The name of the model.
+        first_year: The first year covered by the concentrations.
+        number_years: The number of years covered by the concentrations.
+        number_reaches: The number of reaches.
+        number_multiplication_factors: The number of multiplication factors.
+        number_runs: The number of runs of the population model.
+        number_warm_up_years: The number of warm-up years of the population model.
+        recovery_period_years: The number of years of the recovery period of the population model.
+        daily_survival: Specifies whether LGUTS runs write daily survival.
+        seed: The seed of the random number generator.
+
+    Returns:
+        Nothing.
+    """
+    if model in ("LPopSD", "LPopIT"):
+        first_day = datetime.date(first_year - number_warm_up_years, 1, 1)
+        number_days = (datetime.date(first_year + number_years + recovery_period_years, 1, 1) - first_day).days
+        write_population_outputs(
+            processing_path,
+            model,
+            first_day,
+            number_days,
+            number_reaches,
+            number_multiplication_factors,
+            number_runs,
+            seed
+        )
+    elif model in ("CatchmentGUTSSD", "CatchmentGUTSIT"):
+        write_survival_outputs(
+            processing_path,
+            model,
+            number_years,
+            number_reaches,
+            number_multiplication_factors,
+            first_year if daily_survival else None,
+            seed
+        )
+    else:
+        raise ValueError("Unexpected model: " + model)
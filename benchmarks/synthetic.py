@@ -0,0 +1,226 @@
+"""
+Synthetic stores for benchmarking the component without a Landscape Model run.
+
+The generators create in-memory stand-ins for the component's inputs and outputs, parametrized by the number of
+reaches, hours, multiplication factors and runs. Inputs answer `describe` and `read` requests like inputs connected to
+a store, outputs keep the values set by the component in arrays, so that preparation and ingestion methods of the
+component can be timed in isolation.
+"""
+import datetime
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from LEffectModule import LEffectModel  # noqa: E402
+
+
+class SyntheticValues:
+    """The result of reading a synthetic input."""
+
+    def __init__(self, values):
+        """
+        Initializes SyntheticValues.
+
+        Args:
+            values: The values read.
+        """
+        self.values = values
+
+    def get_values(self):
+        """
+        Gets the values, as element names are retrieved from outputs holding them.
+
+        Returns:
+            The values.
+        """
+        return self.values
+
+
+class SyntheticInput:
+    """An input connected to synthetic values."""
+
+    def __init__(self, values, element_names=None, geometries=None, first_day=None):
+        """
+        Initializes a SyntheticInput.
+
+        Args:
+            values: The values of the input.
+            element_names: The element names per dimension.
+            geometries: The geometries per dimension.
+            first_day: The date of the first value if the values are a daily time series.
+        """
+        self._values = values
+        self._element_names = element_names
+        self._geometries = geometries
+        self._first_day = first_day
+
+    def describe(self):
+        """
+        Describes the values of the input.
+
+        Returns:
+            A dictionary of metadata.
+        """
+        return {
+            "shape": np.shape(self._values),
+            "element_names": self._element_names,
+            "geometries": self._geometries
+        }
+
+    def read(self, slices=None, select=None):
+        """
+        Reads the values of the input.
+
+        Args:
+            slices: The slices of an array input to read.
+            select: A selection of a daily time series by the dates `from` and `to` (exclusive).
+
+        Returns:
+            The values read.
+        """
+        if slices is not None:
+            return SyntheticValues(self._values[slices])
+        if select is not None:
+            time_span = select["time/day"]
+            return SyntheticValues(
+                self._values[(time_span["from"] - self._first_day).days:(time_span["to"] - self._first_day).days])
+        return SyntheticValues(self._values)
+
+
+class RecordingOutput:
+    """An output that keeps the values set by the component in memory."""
+
+    def __init__(self):
+        """Initializes a RecordingOutput."""
+        self.values = None
+        self.attributes = None
+        self.deferred = None
+
+    def set_values(self, values, slices=None, create=True, **keywords):
+        """
+        Sets the values of the output.
+
+        Args:
+            values: The values or `np.ndarray` to create an empty array.
+            slices: The slices of an existing array to set.
+            create: Specifies whether the output is newly created.
+            keywords: The attributes of the newly created output.
+
+        Returns:
+            Nothing.
+        """
+        if create:
+            self.attributes = keywords
+            if values is np.ndarray:
+                self.values = np.zeros(keywords["shape"], keywords.get("data_type", np.float64))
+            else:
+                self.values = np.asarray(values)
+        else:
+            self.values[slices] = values
+
+    def defer(self, loader, file_paths, factor_axis):
+        """
+        Records a deferred ingestion.
+
+        Args:
+            loader: The function that reads and stores the values of a file.
+            file_paths: The module output files by multiplication factor and run.
+            factor_axis: The axis of multiplication factors.
+
+        Returns:
+            Nothing.
+        """
+        self.deferred = (loader, file_paths, factor_axis)
+
+
+class RecordingOutputs(dict):
+    """The outputs of a benchmarked component, created on first access."""
+
+    def __missing__(self, key):
+        self[key] = RecordingOutput()
+        return self[key]
+
+
+class BenchmarkComponent(LEffectModel):
+    """An `LEffectModel` component bound to a synthetic store instead of a Landscape Model."""
+
+    # noinspection PyMissingConstructor
+    def __init__(self, inputs, options=None):
+        """
+        Initializes a BenchmarkComponent.
+
+        Args:
+            inputs: A dictionary of synthetic inputs.
+            options: Values of optional inputs, e.g., `NumberWorkers`.
+        """
+        self._inputs = inputs
+        self._outputs = RecordingOutputs()
+        self._options = options or {}
+        self._concentration_fingerprints = {}
+
+    @property
+    def inputs(self):
+        return self._inputs
+
+    @property
+    def outputs(self):
+        return self._outputs
+
+    @property
+    def default_observer(self):
+        return None
+
+    def _read_optional_input(self, name, default):
+        return self._options.get(name, default)
+
+
+def synthetic_store(
+        number_reaches,
+        number_hours,
+        number_multiplication_factors=1,
+        number_runs=1,
+        simulation_start=datetime.date(2000, 1, 1),
+        number_warm_up_years=0,
+        recovery_period_years=0,
+        seed=0
+):
+    """
+    Creates the inputs of a synthetic store.
+
+    Concentrations are sparse pulses on top of a zero background, as typical for drift and run-off exposure. Water
+    temperatures follow a seasonal cycle and cover the warm-up and recovery periods.
+
+    Args:
+        number_reaches: The number of reaches.
+        number_hours: The number of hours of the concentration time series.
+        number_multiplication_factors: The number of multiplication factors.
+        number_runs: The number of runs of the population model.
+        simulation_start: The first day of the simulation.
+        number_warm_up_years: The number of warm-up years.
+        recovery_period_years: The number of years of the recovery period.
+        seed: The seed of the random number generator.
+
+    Returns:
+        A dictionary of synthetic inputs.
+    """
+    rng = np.random.default_rng(seed)
+    concentrations = np.where(
+        rng.random((number_hours, number_reaches)) < .01, rng.lognormal(-2, 1, (number_hours, number_reaches)), 0.)
+    reaches = np.arange(1, number_reaches + 1)
+    first_year = simulation_start.year - number_warm_up_years
+    last_year = (simulation_start + datetime.timedelta(hours=number_hours)).year + recovery_period_years + 1
+    number_temperature_days = (datetime.date(last_year + 1, 1, 1) - datetime.date(first_year, 1, 1)).days
+    days = np.arange(number_temperature_days)
+    water_temperatures = 12 + 8 * np.sin(2 * np.pi * (days - 110) / 365.25) + rng.normal(0, 1, days.size)
+    return {
+        "Concentrations": SyntheticInput(
+            concentrations, (None, SyntheticValues(reaches)), (None, SyntheticValues([None] * number_reaches))),
+        "WaterTemperature": SyntheticInput(water_temperatures, first_day=datetime.date(first_year, 1, 1)),
+        "SimulationStart": SyntheticInput(simulation_start),
+        "MultiplicationFactors": SyntheticInput(
+            [float(i + 1) for i in range(number_multiplication_factors)], (SyntheticValues(None),)),
+        "NumberRuns": SyntheticInput(number_runs),
+        "NumberOfWarmUpYears": SyntheticInput(number_warm_up_years),
+        "RecoveryPeriodYears": SyntheticInput(recovery_period_years)
+    }
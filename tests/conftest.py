@@ -0,0 +1,175 @@
+"""
+Fixtures for testing the component without a Landscape Model run and without the Squeak module.
+
+Components are bound to the synthetic stores of the benchmarks. The module is replaced by a fake that writes outputs
+in the layout and format of the module, derived from the prepared module inputs, and reach list shapefiles are
+replaced by text files, so that tests need neither the module image nor GDAL:
+
+    python -m pytest tests
+"""
+import datetime
+import os
+import sys
+import msgpack
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+import stub_module  # noqa: E402
+import synthetic  # noqa: E402
+
+SIMULATION_START = datetime.date(2000, 1, 1)
+PARAMETERS = {
+    "DominantRateConstant": .5,
+    "BackgroundHazardRate": .01,
+    "ParameterZOfSDModel": .1,
+    "ParameterBOfSDModel": .2,
+    "ThresholdOfITModel": .1,
+    "BetaOfITModel": 2.,
+    "MinimumClutchSize": 5,
+    "BackgroundMortalityRate": .05,
+    "DensityDependentMortalityRate": .00001,
+    "AverageTemperatureParameterOfForcingFunction": 12.,
+    "AmplitudeTemperatureFluctuationsParameter": 8.,
+    "ShiftForwardOfDayNumberWithLowestTemperature": 20,
+    "PerIndividualProbabilityOfMigration": .1,
+    "ProbabilityOfAMigratingIndividualToMoveDownstream": .67
+}
+
+
+def hours(number_years):
+    return (datetime.date(SIMULATION_START.year + number_years, 1, 1) - SIMULATION_START).days * 24
+
+
+def write_reach_list(reaches_file, reaches):
+    with open(reaches_file, "w") as f:
+        f.write("\n".join(str(reach) for reach in reaches))
+
+
+class FakeModule:
+    """
+    A stand-in for module runs that derives module outputs from the prepared module inputs. The model is taken from
+    the prepared runtime environment, so that runs of several models can share the fake.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.runs = []
+
+    @staticmethod
+    def read_concentrations(processing_path, year):
+        # noinspection SpellCheckingInspection
+        with open(
+                os.path.join(processing_path, "ETInput", "CatchmentModelSystem", "data", f"rummen_{year}.msgpack"),
+                "rb"
+        ) as f:
+            return np.array(msgpack.unpack(f))
+
+    def get_model(self, processing_path):
+        models = [
+            name[:-len("ModelSystem")]
+            for name in os.listdir(os.path.join(processing_path, "ETInput"))
+            if name.endswith("ModelSystem") and name != "CatchmentModelSystem"
+        ]
+        return models[0] if len(models) == 1 else self.model
+
+    def read_control(self, processing_path, model):
+        with open(os.path.join(
+                processing_path,
+                "ETInput",
+                f"{model}ModelSystem",
+                "parameters",
+                f"{model}ModelSystem_control.csv"
+        )) as f:
+            return {line.split(",")[0].rstrip(":"): line.split(",")[1] for line in f if "," in line}
+
+    @staticmethod
+    def read_statements(processing_path):
+        # noinspection SpellCheckingInspection
+        with open(os.path.join(processing_path, "startup.st")) as f:
+            statements = f.read()
+        multiplication_factors = [float(x) for x in statements.split("mfs := #(")[1].split(")")[0].split()]
+        number_runs = int(statements.split(" runs: ")[1].split(".")[0]) if " runs: " in statements else None
+        return multiplication_factors, number_runs
+
+    async def __call__(self, processing_path, progress=None, poll=None):
+        model = self.get_model(processing_path)
+        control = self.read_control(processing_path, model)
+        multiplication_factors, number_runs = self.read_statements(processing_path)
+        # noinspection SpellCheckingInspection
+        model_system_path = os.path.join(processing_path, "ecotalk", f"{model}ModelSystem_MoS")
+        if number_runs is None:
+            year = int(control["applicationYear"])
+            self.runs.append((year, multiplication_factors))
+            concentrations = self.read_concentrations(processing_path, year)
+            survival = np.exp(-.1 * concentrations[:, 1:].sum(1, keepdims=True) * multiplication_factors)
+            os.makedirs(os.path.join(model_system_path, "x1"))
+            np.savetxt(
+                os.path.join(model_system_path, "x1", "guts_survival_reaches.txt_mfactors.txt"), survival, "%.8f", "\t")
+            # noinspection SpellCheckingInspection
+            with open(f"{model_system_path}.modelscript", "w") as f:
+                f.write(str(year))
+        else:
+            first_day = datetime.date(int(control["startYear"]), 1, 1)
+            self.runs.append((first_day.year, multiplication_factors))
+            number_reaches = len(self.read_concentrations(processing_path, int(control["startApplicationYear"])))
+            days = np.arange(progress[3]).reshape((-1, 1))
+            for i, multiplication_factor in enumerate(multiplication_factors, 1):
+                factor_path = os.path.join(model_system_path, "x1", f"x1s{i}")
+                os.makedirs(factor_path)
+                for run in range(1, number_runs + 1):
+                    rng = np.random.default_rng((int(multiplication_factor * 1000), run))
+                    expected = 100 * (1.2 + np.sin(2 * np.pi * days / 365.25)) / (1 + multiplication_factor)
+                    for file_name in stub_module.POPULATION_BY_REACH_FILES:
+                        stub_module.write_population_file(
+                            os.path.join(factor_path, file_name.format(i, run)),
+                            rng.poisson(np.repeat(expected, number_reaches, 1)),
+                            first_day
+                        )
+                    for file_name in stub_module.METAPOPULATION_FILES:
+                        stub_module.write_population_file(
+                            os.path.join(factor_path, file_name.format(i, run)),
+                            rng.poisson(expected * number_reaches),
+                            first_day
+                        )
+                if poll:
+                    poll()
+
+
+@pytest.fixture
+def make_component(tmp_path):
+    """
+    Creates components bound to synthetic stores whose module runs are faked.
+
+    Returns:
+        A function taking the model, a dictionary of optional inputs, the number of reaches and years, and optionally
+        the processing path and seed of the synthetic concentrations, returning the component. The fake module is
+        available as `run_module_async` of the component.
+    """
+    def make(
+            model,
+            options=None,
+            number_reaches=6,
+            number_years=3,
+            processing_path=None,
+            seed=0,
+            number_multiplication_factors=2,
+            number_runs=2,
+            **keywords
+    ):
+        store = synthetic.synthetic_store(
+            number_reaches, hours(number_years), number_multiplication_factors, number_runs, seed=seed, **keywords)
+        store["ProcessingPath"] = synthetic.SyntheticInput(processing_path or str(tmp_path / model))
+        store["Model"] = synthetic.SyntheticInput(model)
+        store["UseTemperatureInput"] = synthetic.SyntheticInput(False)
+        store["Verbosity"] = synthetic.SyntheticInput(0)
+        store["NumberOfStepsWithinOneHour"] = synthetic.SyntheticInput(1)
+        for name, value in PARAMETERS.items():
+            store[name] = synthetic.SyntheticInput(value)
+        component = synthetic.BenchmarkComponent(store, options)
+        component.get_runtime_files = lambda path: ()
+        component.write_reach_list = write_reach_list
+        component.run_module_async = FakeModule(model)
+        return component
+
+    return make
@@ -0,0 +1,67 @@
+"""Tests of archiving module output files."""
+import os
+import pytest
+import LEffectModule
+
+SURVIVAL_FILE = "ecotalk/CatchmentGUTSITModelSystem_MoS_{}/x1/guts_survival_reaches.txt_mfactors.txt"
+
+
+def test_module_outputs_are_archived(make_component, tmp_path):
+    processing_path = tmp_path / "run"
+    component = make_component(
+        "CatchmentGUTSIT", {"ArchiveModuleOutputs": True}, processing_path=str(processing_path))
+    component.run()
+    assert not os.path.exists(processing_path / "module_outputs.zip.partial")
+    assert not os.path.exists(processing_path / "ecotalk" / "CatchmentGUTSITModelSystem_MoS_0")
+    with LEffectModule.ModuleOutputArchive(str(processing_path)) as archive:
+        assert archive.names("*/guts_survival_reaches.txt_mfactors.txt") == [SURVIVAL_FILE.format(y) for y in range(3)]
+
+
+def test_archive_of_previous_run_is_kept_if_run_fails(make_component, tmp_path):
+    processing_path = tmp_path / "run"
+    options = {"ArchiveModuleOutputs": True}
+    make_component("CatchmentGUTSIT", options, processing_path=str(processing_path)).run()
+    with open(processing_path / "module_outputs.zip", "rb") as f:
+        previous_archive = f.read()
+    component = make_component("CatchmentGUTSIT", options, processing_path=str(processing_path), seed=1)
+    run_module_async = component.run_module_async
+
+    async def fail_in_second_year(path, progress=None, poll=None):
+        if run_module_async.runs:
+            raise ValueError("Module exited with code 1")
+        await run_module_async(path, progress, poll)
+
+    component.run_module_async = fail_in_second_year
+    with pytest.raises(ValueError, match="code 1"):
+        component.run()
+    assert not os.path.exists(processing_path / "module_outputs.zip.partial")
+    with open(processing_path / "module_outputs.zip", "rb") as f:
+        assert f.read() == previous_archive
+    assert os.path.isfile(processing_path / SURVIVAL_FILE.format(0))
+
+
+def test_population_factors_are_archived_once_complete(make_component, tmp_path, monkeypatch):
+    processing_path = tmp_path / "run"
+    # noinspection SpellCheckingInspection
+    factors_path = processing_path / "ecotalk" / "LPopSDModelSystem_MoS" / "x1"
+    added = []
+    add = LEffectModule.ModuleOutputArchiver.add
+
+    def record(archiver, path):
+        added.append((os.path.basename(path), sorted(os.listdir(factors_path))))
+        add(archiver, path)
+
+    monkeypatch.setattr(LEffectModule.ModuleOutputArchiver, "add", record)
+    component = make_component(
+        "LPopSD", {"ArchiveModuleOutputs": True}, processing_path=str(processing_path), number_years=1)
+    component.run()
+    assert added == [("x1s1", ["x1s1"]), ("x1s2", ["x1s1", "x1s2"])]
+    assert not os.path.exists(factors_path / "x1s1")
+    with LEffectModule.ModuleOutputArchive(str(processing_path)) as archive:
+        assert len(archive.names("*/x1s2r2_adultPopByReach.txt")) == 1
+
+
+def test_archive_and_resume_are_exclusive(make_component, tmp_path):
+    component = make_component("CatchmentGUTSIT", {"ArchiveModuleOutputs": True, "Resume": True})
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        component.run()
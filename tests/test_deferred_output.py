@@ -0,0 +1,52 @@
+"""Tests of the on-demand ingestion of module output files."""
+import gc
+import pytest
+import LEffectModule
+
+
+def deferred_output(number_multiplication_factors=3, number_runs=4):
+    output = LEffectModule.DeferredOutput("Values", None, None)
+    loaded = []
+    output.defer(
+        lambda multiplication_factor, run, file_path: loaded.append((multiplication_factor, run)),
+        {
+            (multiplication_factor, run): f"x1s{multiplication_factor}r{run}.txt"
+            for multiplication_factor in range(1, number_multiplication_factors + 1)
+            for run in range(1, number_runs + 1)
+        },
+        2
+    )
+    return output, loaded
+
+
+@pytest.mark.parametrize("factors, runs, expected", [
+    (slice(None), slice(None), {(f, r) for f in range(1, 4) for r in range(1, 5)}),
+    (-1, slice(None), {(3, r) for r in range(1, 5)}),
+    (slice(-2, None), -1, {(2, 4), (3, 4)}),
+    (slice(None, None, 2), slice(1, None, 2), {(1, 2), (1, 4), (3, 2), (3, 4)}),
+    (slice(None, None, -1), slice(0, -3), {(1, 1), (2, 1), (3, 1)}),
+    (slice(5, None), slice(None), set()),
+    ([0, -1], [1], {(1, 2), (3, 2)})
+])
+def test_materialize_selection(factors, runs, expected):
+    output, loaded = deferred_output()
+    output.materialize((slice(None), slice(None), factors, runs))
+    assert set(loaded) == expected
+    assert len(loaded) == len(expected)
+    assert output.complete == (len(expected) == 12)
+
+
+def test_materialize_loads_files_once():
+    output, loaded = deferred_output()
+    output.materialize((slice(None), slice(None), 0, slice(None)))
+    output.materialize((slice(None), slice(None), slice(0, 2), 0))
+    assert sorted(loaded) == [(1, 1), (1, 2), (1, 3), (1, 4), (2, 1)]
+
+
+def test_unread_files_stay_unparsed():
+    output, loaded = deferred_output()
+    output.materialize((slice(None), slice(None), 1, 1))
+    assert not output.complete
+    del output
+    gc.collect()
+    assert loaded == [(2, 2)]
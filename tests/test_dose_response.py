@@ -0,0 +1,38 @@
+"""Tests of the dose-response curves fitted to the annual GUTS survival."""
+import numpy as np
+import LEffectModule
+
+MULTIPLICATION_FACTORS = 2. ** np.arange(-5, 11)
+
+
+def log_logistic(upper, slope, lp50):
+    return upper / (1 + (MULTIPLICATION_FACTORS / lp50) ** slope)
+
+
+def test_fit_recovers_known_parameters():
+    responses = np.array([[log_logistic(.95, 2.5, 4.), log_logistic(.8, 1.2, 150.)]])
+    upper, slope, log_lp50, converged = LEffectModule.fit_log_logistic(MULTIPLICATION_FACTORS, responses)
+    assert converged.all()
+    np.testing.assert_allclose(upper, [[.95, .8]], rtol=1e-4)
+    np.testing.assert_allclose(slope, [[2.5, 1.2]], rtol=1e-4)
+    np.testing.assert_allclose(np.exp(log_lp50), [[4., 150.]], rtol=1e-4)
+
+
+def test_store_dose_response(make_component):
+    component = make_component("CatchmentGUTSIT", number_reaches=4)
+    survival = np.stack([
+        log_logistic(.95, 2.5, 4.),
+        np.ones(MULTIPLICATION_FACTORS.size),
+        log_logistic(.9, 2., 1500.),
+        log_logistic(.9, 2., 500.)
+    ]).reshape((1, 4, -1))
+    component.store_dose_response(survival, MULTIPLICATION_FACTORS, 2000)
+    lp10 = component.outputs["LP10"].values
+    lp50 = component.outputs["LP50"].values
+    np.testing.assert_allclose(lp50[0, 0], 4., rtol=1e-4)
+    np.testing.assert_allclose(lp10[0, 0], 4. / 9 ** (1 / 2.5), rtol=1e-4)
+    assert np.isnan(lp10[0, 1]) and np.isnan(lp50[0, 1])
+    np.testing.assert_allclose(lp10[0, 2], 1500. / 3, rtol=1e-4)
+    assert np.isnan(lp50[0, 2])
+    np.testing.assert_allclose(lp50[0, 3], 500., rtol=1e-4)
+    assert component.outputs["LP10"].attributes["offset"] == (2000, None)
@@ -0,0 +1,155 @@
+"""Tests of running the module and preparing and merging its outputs."""
+import asyncio
+import os
+import sys
+import time
+import numpy as np
+import pytest
+import LEffectModule
+
+
+def monitor(tmp_path, stall_timeout=0):
+    return LEffectModule.ProgressMonitor(None, str(tmp_path), "*.done", 1, 1, 0, stall_timeout)
+
+
+def sleeping_module(tmp_path, seconds=60):
+    return [
+        sys.executable,
+        "-c",
+        f"import os, time; open('pid', 'w').write(str(os.getpid())); time.sleep({seconds})"
+    ]
+
+
+async def read_pid(tmp_path):
+    while not os.path.isfile(tmp_path / "pid") or os.path.getsize(tmp_path / "pid") == 0:
+        await asyncio.sleep(.05)
+    return int((tmp_path / "pid").read_text())
+
+
+def assert_terminated(pid):
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+
+
+def test_cancelled_module_run_is_killed(tmp_path):
+    async def cancel():
+        run = asyncio.ensure_future(monitor(tmp_path).run(sleeping_module(tmp_path), str(tmp_path)))
+        pid = await read_pid(tmp_path)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        return pid
+
+    assert_terminated(asyncio.run(cancel()))
+
+
+def test_failing_sibling_kills_module_run(tmp_path):
+    async def fail():
+        await read_pid(tmp_path)
+        raise RuntimeError("Sibling failed")
+
+    async def gather():
+        await asyncio.gather(monitor(tmp_path).run(sleeping_module(tmp_path), str(tmp_path)), fail())
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(gather())
+    pid = int((tmp_path / "pid").read_text())
+    assert_terminated(pid)
+
+
+def test_stalled_module_run_is_killed(tmp_path):
+    with pytest.raises(TimeoutError):
+        asyncio.run(monitor(tmp_path, 1).run(sleeping_module(tmp_path), str(tmp_path)))
+    assert_terminated(int((tmp_path / "pid").read_text()))
+
+
+def test_module_exit_code_is_reported(tmp_path):
+    with pytest.raises(ValueError, match="code 3"):
+        asyncio.run(monitor(tmp_path).run([sys.executable, "-c", "raise SystemExit(3)"], str(tmp_path)))
+
+
+def test_module_run_is_polled(tmp_path, monkeypatch):
+    monkeypatch.setattr(LEffectModule.ProgressMonitor, "POLL_INTERVAL", .05)
+    polls = []
+    monitor_with_poll = LEffectModule.ProgressMonitor(
+        None, str(tmp_path), "*.done", 1, 1, 0, 0, lambda: polls.append(time.monotonic()))
+    asyncio.run(monitor_with_poll.run(sleeping_module(tmp_path, .5), str(tmp_path)))
+    assert len(polls) >= 2
+
+
+@pytest.mark.parametrize("model", ["CatchmentGUTSSD", "CatchmentGUTSIT"])
+def test_run_and_run_async_agree(make_component, model, tmp_path):
+    component = make_component(model, processing_path=str(tmp_path / "run"))
+    component.run()
+    concurrent = make_component(model, processing_path=str(tmp_path / "run_async"))
+    asyncio.run(concurrent.run_async())
+    survival = component.outputs["GutsSurvivalReaches"].values
+    assert survival.shape == (3, 6, 2)
+    assert [year for year, _ in component.run_module_async.runs] == [2000, 2001, 2002]
+    np.testing.assert_array_equal(concurrent.outputs["GutsSurvivalReaches"].values, survival)
+    assert np.all((survival > 0) & (survival <= 1))
+    assert np.all(survival[:, :, 1] <= survival[:, :, 0])
+
+
+def write_factor_outputs(model_system_path, directory_index, multiplication_factor, number_runs):
+    factor_path = os.path.join(model_system_path, "x1", f"x1s{directory_index}")
+    os.makedirs(factor_path, exist_ok=True)
+    for run in range(1, number_runs + 1):
+        for file_name in LEffectModule.POPULATION_OUTPUT_FILES:
+            with open(os.path.join(factor_path, file_name.format(directory_index, run)), "w") as f:
+                f.write(f"1\t2000-01-01\t{multiplication_factor}\t{run}\n")
+
+
+def test_prepare_and_merge_population_outputs_of_missing_factors(make_component, tmp_path):
+    processing_path = str(tmp_path / "run")
+    model_system_path = os.path.join(processing_path, "ecotalk", "LPopSD_MoS")
+    component = make_component("LPopSD", processing_path=processing_path)
+    multiplication_factors = [1., 2., 5.]
+    for i, multiplication_factor in enumerate(multiplication_factors, 1):
+        write_factor_outputs(model_system_path, i, multiplication_factor, 2)
+    os.remove(os.path.join(model_system_path, "x1", "x1s2", "x1s2r2_juvenilePopByReach.txt"))
+    manifest = LEffectModule.ResumeManifest(processing_path, {"model": "LPopSD"})
+    missing_factors = component.prepare_population_module_outputs(
+        processing_path, model_system_path, "LPopSD", multiplication_factors, 2, manifest, True)
+    assert missing_factors == [2]
+    assert not os.path.exists(model_system_path)
+    with open(os.path.join(processing_path, "startup.st")) as f:
+        assert "mfs := #(2.0)." in f.read()
+    write_factor_outputs(model_system_path, 1, 2., 2)
+    component.merge_population_module_outputs(model_system_path, missing_factors, 3, 2, manifest)
+    assert not os.path.exists(f"{model_system_path}.retained")
+    for i, multiplication_factor in enumerate(multiplication_factors, 1):
+        assert manifest.is_complete(f"population_factor_{i}")
+        for run in (1, 2):
+            for file_name in LEffectModule.POPULATION_OUTPUT_FILES:
+                with open(os.path.join(model_system_path, "x1", f"x1s{i}", file_name.format(i, run))) as f:
+                    assert f.read() == f"1\t2000-01-01\t{multiplication_factor}\t{run}\n"
+
+
+def test_prepare_population_outputs_of_complete_run(make_component, tmp_path):
+    processing_path = str(tmp_path / "run")
+    model_system_path = os.path.join(processing_path, "ecotalk", "LPopSD_MoS")
+    component = make_component("LPopSD", processing_path=processing_path)
+    write_factor_outputs(model_system_path, 1, 1., 1)
+    manifest = LEffectModule.ResumeManifest(processing_path, {"model": "LPopSD"})
+    assert component.prepare_population_module_outputs(
+        processing_path, model_system_path, "LPopSD", [1.], 1, manifest, True) == []
+    assert os.path.isdir(model_system_path)
+    assert component.prepare_population_module_outputs(
+        processing_path, model_system_path, "LPopSD", [1.], 1, manifest, False) == [1]
+    assert not os.path.exists(model_system_path)
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Processor affinity not supported")
+def test_launcher_configures_started_module(tmp_path):
+    launcher = LEffectModule.ModuleLauncher(str(tmp_path), sys.executable, [0], 3)
+    assert "preexec_fn" not in launcher.subprocess_options
+    command = [
+        sys.executable,
+        "-c",
+        "import os, time; time.sleep(.5); "
+        "open('settings', 'w').write(f'{sorted(os.sched_getaffinity(0))} {os.getpriority(os.PRIO_PROCESS, 0)}')"
+    ]
+    niceness = os.getpriority(os.PRIO_PROCESS, 0)
+    asyncio.run(monitor(tmp_path).run(command, str(tmp_path), launcher))
+    assert (tmp_path / "settings").read_text() == f"[0] {niceness + 3}"
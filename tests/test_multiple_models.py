@@ -0,0 +1,30 @@
+"""Tests of running several models on the same exposure."""
+import os
+import numpy as np
+
+MODELS = ["CatchmentGUTSSD", "CatchmentGUTSIT"]
+
+
+def test_models_share_inputs_and_namespace_outputs(make_component, tmp_path):
+    processing_path = tmp_path / "run"
+    component = make_component("CatchmentGUTSSD", {"Models": MODELS}, processing_path=str(processing_path))
+    prepared = []
+    write_concentrations = component.write_concentrations
+
+    def record(time_slice_path, *args):
+        prepared.append(time_slice_path)
+        write_concentrations(time_slice_path, *args)
+
+    component.write_concentrations = record
+    component.run()
+    assert len(prepared) == 1
+    assert os.path.isdir(processing_path / "shared_inputs")
+    assert sorted(year for year, _ in component.run_module_async.runs) == [2000, 2000, 2001, 2001, 2002, 2002]
+    for model in MODELS:
+        single = make_component(model, processing_path=str(tmp_path / model))
+        single.run()
+        for output_name in ("GutsSurvivalReaches", "LP50"):
+            np.testing.assert_array_equal(
+                component.outputs[f"{model}/{output_name}"].values, single.outputs[output_name].values)
+        assert os.path.isdir(processing_path / model / "ecotalk" / f"{model}ModelSystem_MoS_0")
+    assert "GutsSurvivalReaches" not in component.outputs
@@ -0,0 +1,29 @@
+"""Tests of preparing GUTS parameter sets for parameter sweeps."""
+import pytest
+
+
+class UnreadableInput:
+    def read(self, **keywords):
+        raise AssertionError("Input read although the parameter is specified")
+
+
+def read_coefficients(file_path):
+    with open(file_path) as f:
+        return {line.split(",")[0].rstrip(":"): line.split(",")[1] for line in f if ":," in line}
+
+
+def test_parameters_replace_inputs_without_reading_them(make_component, tmp_path):
+    component = make_component("CatchmentGUTSIT")
+    component.inputs["DominantRateConstant"] = UnreadableInput()
+    component.inputs["ThresholdOfITModel"] = UnreadableInput()
+    component.prepare_coefficients(str(tmp_path / "coefs.csv"), "CatchmentGUTSIT", {"kd": 2.5, "m": 0.})
+    coefficients = read_coefficients(tmp_path / "coefs.csv")
+    assert coefficients["kd"] == "2.5"
+    assert coefficients["m"] == "0.0"
+    assert coefficients["hb"] == "0.01"
+    assert coefficients["beta"] == "2.0"
+
+
+def test_parameter_sweep_requires_parameter_sets(make_component):
+    with pytest.raises(ValueError, match="At least one parameter set"):
+        make_component("CatchmentGUTSIT").run_parameter_sweep([])
@@ -0,0 +1,62 @@
+"""Tests of the integer data types of population outputs."""
+import numpy as np
+import pytest
+import LEffectModule
+
+
+def write_population_file(file_path, values):
+    with open(file_path, "w") as f:
+        for day, value in enumerate(values, 1):
+            f.write(f"{day}\t2000-01-{day:02d}\t{value}\n")
+    return str(file_path)
+
+
+def test_data_type_is_automatic_by_default(make_component):
+    component = make_component("LPopSD")
+    assert component.resolve_population_data_type() is None
+    assert component.resolve_population_data_type(True) == np.uint32
+    component = make_component("LPopSD", {"PopulationDataType": "int32"})
+    assert component.resolve_population_data_type() == np.int32
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_staging_widens_data_type_in_single_pass(tmp_path, monkeypatch, buffered):
+    file_paths = {
+        (1, 1): write_population_file(tmp_path / "x1s1r1_adultMetapop.txt", [5, 200]),
+        (1, 2): write_population_file(tmp_path / "x1s1r2_adultMetapop.txt", [70000, 3]),
+        (2, 1): write_population_file(tmp_path / "x1s2r1_adultMetapop.txt", [300])
+    }
+    read_files = []
+    read_population_file = LEffectModule.read_population_file
+
+    def read_file(file_path, number_columns):
+        read_files.append(file_path)
+        return read_population_file(file_path, number_columns)
+
+    monkeypatch.setattr(LEffectModule, "read_population_file", read_file)
+    buffer_file = str(tmp_path / "Values.buffer") if buffered else None
+    with LEffectModule.stage_population_files(file_paths, 2, 1, buffer_file=buffer_file) as staged:
+        assert staged.dtype == np.uint32
+        np.testing.assert_array_equal(staged[..., 0], [[5, 200], [70000, 3], [300, 0]])
+    assert read_files == list(file_paths.values())
+    assert not list(tmp_path.glob("*.buffer*"))
+
+
+def test_automatic_data_type_of_outputs(make_component, tmp_path):
+    component = make_component("LPopSD", number_years=1)
+    component.run()
+    explicit = make_component("LPopSD", {"PopulationDataType": "uint32"}, number_years=1)
+    explicit.run()
+    for output_name in ("AdultMetaPopulation", "AdultPopulationByReach"):
+        values = component.outputs[output_name].values
+        assert values.dtype == LEffectModule.smallest_integer_type(0, int(values.max()))
+        np.testing.assert_array_equal(values, explicit.outputs[output_name].values)
+        assert explicit.outputs[output_name].values.dtype == np.uint32
+
+
+def test_values_are_checked_against_data_type(tmp_path):
+    file_path = write_population_file(tmp_path / "x1s1r1_adultMetapop.txt", [5, 2 ** 32])
+    with pytest.raises(ValueError):
+        LEffectModule.read_population_values(file_path, 2, 1, np.uint32)
+    np.testing.assert_array_equal(
+        LEffectModule.read_population_values(file_path, 3, 1, np.int64), [[5], [2 ** 32], [0]])
@@ -0,0 +1,144 @@
+"""Tests of the native implementation of the LPop model."""
+import os
+import numpy as np
+import pytest
+import LEffectModule
+
+DEB_PARAMETERS = {
+    "arrhenius_temperature": 8000.,
+    "reference_temperature": 293.15,
+    "energy_conductance": .01,
+    "somatic_maintenance_rate": .1,
+    "energy_investment_ratio": 1.,
+    "length_at_birth": .03,
+    "length_at_metamorphosis": .09,
+    "length_at_puberty": .15,
+    "embryo_development_time": 20.,
+    "maximum_reproduction_rate": 1.,
+    "scaled_functional_response": 1.,
+    "individual_variation": .05,
+    "initial_adults_per_reach": 20
+}
+# noinspection SpellCheckingInspection
+COEFFICIENTS = {
+    "minClutchSize": 5,
+    "backgroundMortality": .002,
+    "muDD": .001,
+    "kd": .5,
+    "hb": .001,
+    "z": .1,
+    "b": .2,
+    "m": .1,
+    "beta": 2.,
+    "envTav": 12.,
+    "envTamp": 8.,
+    "envTminShift": 20,
+    "migrationProb": .01,
+    "downStreamProb": .67,
+    "conversionToGutsFactor": 1.
+}
+CONTROL = {"startYear": "2000", "endYear": "2001", "stepsInHr": "1", "useTemperatureData": "0"}
+DOWNSTREAM_INDICES = np.array([2, 2, 3, -1])
+
+
+def engine(tmp_path, model="LPopSD", deb_parameters=None):
+    return LEffectModule.PopulationEngine(
+        model,
+        COEFFICIENTS,
+        CONTROL,
+        str(tmp_path),
+        DOWNSTREAM_INDICES,
+        np.full(4, 100.),
+        DEB_PARAMETERS if deb_parameters is None else deb_parameters
+    )
+
+
+def simulate(population_engine, multiplication_factor=1., seed=0):
+    return np.stack(list(population_engine.simulate(multiplication_factor, np.random.default_rng(seed))))
+
+
+@pytest.mark.parametrize("model", ["LPopSD", "LPopIT"])
+def test_populations_persist_without_exposure(tmp_path, model):
+    counts = simulate(engine(tmp_path, model))
+    assert counts.shape == (731, 3, 4)
+    assert np.all(counts >= 0)
+    assert np.all(counts[-365:, 2].min(0) > 0)
+    assert counts[:, 0].sum() > 0
+    total = counts.sum((1, 2))
+    assert total[-365:].max() < 3 * total[:365].max()
+    np.testing.assert_array_equal(simulate(engine(tmp_path, model), 1000.), counts)
+
+
+def test_runs_are_reproducible_for_a_seed(tmp_path):
+    counts = simulate(engine(tmp_path), seed=42)
+    np.testing.assert_array_equal(simulate(engine(tmp_path), seed=42), counts)
+    assert not np.array_equal(simulate(engine(tmp_path), seed=43), counts)
+
+
+def test_stage_of_individuals_does_not_decrease(tmp_path):
+    population_engine = engine(tmp_path)
+    state = population_engine.create_individuals(
+        np.random.default_rng(0), np.zeros(2, np.int64), 2, np.array([.16, .16]), np.zeros(2))
+    state["length"][1] = .1
+    population_engine.grow(state, np.ones(2, bool), 1.)
+    np.testing.assert_array_equal(state["stage"], [2, 2])
+
+
+def test_deb_parameters_are_required(tmp_path):
+    with pytest.raises(ValueError, match="Missing DEB parameters: length_at_birth"):
+        engine(tmp_path, deb_parameters={
+            name: value for name, value in DEB_PARAMETERS.items() if name != "length_at_birth"})
+    with pytest.raises(ValueError, match="Unknown DEB parameters: length"):
+        engine(tmp_path, deb_parameters=dict(DEB_PARAMETERS, length=1.))
+
+
+def native_component(make_component, processing_path, **options):
+    return make_component(
+        "LPopSD",
+        dict({
+            "PopulationEngine": "native",
+            "DownstreamReaches": np.array([3, 3, 4, 0, 4, 4]),
+            "DebParameters": DEB_PARAMETERS,
+            "HabitatAreas": np.full(6, 10.),
+            "RandomSeed": 7
+        }, **options),
+        number_years=1,
+        processing_path=processing_path
+    )
+
+
+def test_native_engine_run_is_reproducible(make_component, tmp_path):
+    first = native_component(make_component, str(tmp_path / "first"))
+    first.run()
+    second = native_component(make_component, str(tmp_path / "second"))
+    second.run()
+    assert first.run_module_async.runs == []
+    assert os.path.isdir(tmp_path / "first" / "ecotalk" / "LPopSDModelSystem_MoS" / "x1" / "x1s2")
+    assert not os.path.lexists(tmp_path / "first" / "ecotalk" / "LPopSDModelSystem_Mos")
+    adults = first.outputs["AdultPopulationByReach"].values
+    assert adults.shape == (366, 6, 2, 2)
+    assert adults.sum() > 0
+    np.testing.assert_array_equal(second.outputs["AdultPopulationByReach"].values, adults)
+    np.testing.assert_array_equal(
+        second.outputs["AdultMetaPopulation"].values, first.outputs["AdultMetaPopulation"].values)
+
+
+def test_native_engine_requires_deb_parameters(make_component, tmp_path):
+    component = native_component(make_component, str(tmp_path / "run"), DebParameters=None)
+    with pytest.raises(ValueError, match="DebParameters"):
+        component.run()
+
+
+def test_native_engine_requires_habitat_areas(make_component, tmp_path):
+    component = native_component(make_component, str(tmp_path / "run"), HabitatAreas=None)
+    with pytest.raises(ValueError, match="HabitatAreas"):
+        component.run()
+
+
+def test_native_engine_warns_that_it_is_experimental(make_component, tmp_path, monkeypatch):
+    component = native_component(make_component, str(tmp_path / "run"))
+    messages = []
+    observer = type("Observer", (), {"write_message": lambda self, *message: messages.append(message)})()
+    monkeypatch.setattr(type(component), "default_observer", property(lambda self: observer))
+    component.run()
+    assert any(level == 3 and "experimental" in text for level, text, *_ in messages)
@@ -0,0 +1,17 @@
+"""Tests of summary statistics of population outputs by reach."""
+import numpy as np
+
+
+def test_quantiles_are_named_by_their_values(make_component):
+    component = make_component(
+        "LPopSD",
+        {"PopulationOutputMode": "statistics", "PopulationStatisticsQuantiles": [.1, .9]},
+        number_years=1,
+        number_runs=4
+    )
+    component.run()
+    quantiles = component.outputs["AdultPopulationByReachQuantiles"]
+    assert component.outputs["PopulationQuantiles"].values.tolist() == [.1, .9]
+    assert quantiles.attributes["element_names"][3] is component.outputs["PopulationQuantiles"]
+    assert quantiles.values.shape == (366, 6, 2, 2)
+    assert np.all(quantiles.values[..., 0] <= quantiles.values[..., 1])
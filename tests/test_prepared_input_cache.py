@@ -0,0 +1,61 @@
+"""Tests of caching prepared module inputs across runs."""
+import os
+import threading
+import time
+import numpy as np
+
+
+def test_sequential_runs_reuse_prepared_concentrations(make_component, tmp_path):
+    options = {"PreparedInputCachePath": str(tmp_path / "cache")}
+    first = make_component("CatchmentGUTSIT", options, processing_path=str(tmp_path / "first"))
+    first.run()
+    second = make_component("CatchmentGUTSIT", options, processing_path=str(tmp_path / "second"))
+    prepared = []
+    second.write_concentrations = lambda *args: prepared.append(args)
+    second.run()
+    assert prepared == []
+    np.testing.assert_array_equal(
+        second.outputs["GutsSurvivalReaches"].values, first.outputs["GutsSurvivalReaches"].values)
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+
+def test_concurrent_preparation_builds_entry_once(make_component, tmp_path):
+    component = make_component("CatchmentGUTSIT")
+    builds = []
+
+    def build(staging_path):
+        builds.append(staging_path)
+        time.sleep(.2)
+        with open(os.path.join(staging_path, "values.txt"), "w") as f:
+            f.write("1")
+
+    threads = [
+        threading.Thread(
+            target=component.prepare_cached_files,
+            args=(str(tmp_path / "cache"), "entry", str(tmp_path / f"target_{i}"), build)
+        )
+        for i in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(builds) == 1
+    assert os.listdir(tmp_path / "cache") == ["entry"]
+    for i in range(2):
+        assert (tmp_path / f"target_{i}" / "values.txt").read_text() == "1"
+
+
+def test_entry_built_by_another_process_is_used(make_component, tmp_path):
+    component = make_component("CatchmentGUTSIT")
+    cached_path = tmp_path / "cache" / "entry"
+
+    def build(staging_path):
+        with open(os.path.join(staging_path, "values.txt"), "w") as f:
+            f.write("own")
+        os.makedirs(cached_path)
+        (cached_path / "values.txt").write_text("other")
+
+    component.prepare_cached_files(str(tmp_path / "cache"), "entry", str(tmp_path / "target"), build)
+    assert os.listdir(tmp_path / "cache") == ["entry"]
+    assert (tmp_path / "target" / "values.txt").read_text() == "other"
@@ -0,0 +1,32 @@
+"""Tests of caching reach lists across runs."""
+import os
+
+
+def count_calls(component, method_name):
+    calls = []
+    method = getattr(component, method_name)
+
+    def record(*args):
+        calls.append(args)
+        return method(*args)
+
+    setattr(component, method_name, record)
+    return calls
+
+
+def test_sequential_runs_reuse_reach_list(make_component, tmp_path):
+    options = {"ReachListCachePath": str(tmp_path / "cache")}
+    first = make_component("CatchmentGUTSIT", options, processing_path=str(tmp_path / "first"))
+    first_calls = count_calls(first, "write_reach_list")
+    first.run()
+    second = make_component("CatchmentGUTSIT", options, processing_path=str(tmp_path / "second"))
+    second_calls = count_calls(second, "write_reach_list")
+    second.run()
+    assert len(first_calls) == 1
+    assert second_calls == []
+    # noinspection SpellCheckingInspection
+    reaches_file = os.path.join(
+        "ETInput", "CatchmentGUTSITModelSystem", "maps", "shapes", "reachlist_shp", "Reachlist_shp.shp")
+    with open(tmp_path / "first" / reaches_file) as f, open(tmp_path / "second" / reaches_file) as g:
+        assert f.read() == g.read()
+    assert [name for name in os.listdir(tmp_path / "cache") if name.endswith(".tmp")] == []
@@ -0,0 +1,24 @@
+"""Tests of simulating partitions of reaches concurrently."""
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("options", [{}, {"ReachesOfInterest": [2, 3, 5, 6, 8]}])
+@pytest.mark.parametrize("number_reach_partitions", [2, 3])
+def test_partitioned_run_equals_unpartitioned_run(make_component, tmp_path, options, number_reach_partitions):
+    unpartitioned = make_component(
+        "CatchmentGUTSSD", dict(options), number_reaches=9, processing_path=str(tmp_path / "unpartitioned"))
+    unpartitioned.run()
+    partitioned = make_component(
+        "CatchmentGUTSSD",
+        dict(options, NumberReachPartitions=number_reach_partitions),
+        number_reaches=9,
+        processing_path=str(tmp_path / "partitioned")
+    )
+    partitioned.run()
+    assert len(partitioned.run_module_async.runs) == 3 * number_reach_partitions
+    for output_name in ("GutsSurvivalReaches", "LP50", "DoseResponseConverged"):
+        np.testing.assert_array_equal(
+            partitioned.outputs[output_name].values, unpartitioned.outputs[output_name].values)
+    if options:
+        np.testing.assert_array_equal(partitioned.outputs["SimulatedReaches"].values, [2, 3, 5, 6, 8])
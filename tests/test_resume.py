@@ -0,0 +1,47 @@
+"""Tests of resuming runs in the working directory of a previous run."""
+import numpy as np
+
+
+def test_resume_reuses_completed_years(make_component, tmp_path):
+    processing_path = str(tmp_path / "run")
+    component = make_component("CatchmentGUTSIT", {"Resume": True}, processing_path=processing_path)
+    component.run()
+    resumed = make_component("CatchmentGUTSIT", {"Resume": True}, processing_path=processing_path)
+    resumed.run()
+    assert len(component.run_module_async.runs) == 3
+    assert resumed.run_module_async.runs == []
+    np.testing.assert_array_equal(
+        resumed.outputs["GutsSurvivalReaches"].values, component.outputs["GutsSurvivalReaches"].values)
+
+
+def test_resume_prepares_changed_concentrations_again(make_component, tmp_path):
+    processing_path = str(tmp_path / "run")
+    component = make_component("CatchmentGUTSIT", {"Resume": True}, processing_path=processing_path)
+    component.run()
+    changed = make_component("CatchmentGUTSIT", {"Resume": True}, processing_path=processing_path, seed=1)
+    changed.run()
+    reference = make_component("CatchmentGUTSIT", seed=1)
+    reference.run()
+    assert len(changed.run_module_async.runs) == 3
+    survival = changed.outputs["GutsSurvivalReaches"].values
+    np.testing.assert_array_equal(survival, reference.outputs["GutsSurvivalReaches"].values)
+    assert not np.array_equal(survival, component.outputs["GutsSurvivalReaches"].values)
+
+
+def test_run_without_resume_does_not_fingerprint(make_component, tmp_path):
+    processing_path = str(tmp_path / "run")
+    component = make_component("CatchmentGUTSIT", processing_path=processing_path)
+
+    def fingerprint(*args):
+        raise AssertionError("Concentrations fingerprinted")
+
+    component.fingerprint_concentrations = fingerprint
+    component.run()
+    assert not (tmp_path / "run" / "resume_manifest.json").exists()
+
+
+def test_resume_reuses_fingerprint_of_cache_key(make_component, tmp_path):
+    component = make_component(
+        "CatchmentGUTSIT", {"Resume": True, "PreparedInputCachePath": str(tmp_path / "cache")})
+    component.run()
+    assert len(component._concentration_fingerprints) == 1
@@ -0,0 +1,54 @@
+"""Tests of recording the resource usage of the phases of a component run."""
+import subprocess
+import sys
+import numpy as np
+import pytest
+import LEffectModule
+
+ALLOCATION = 300 * 2 ** 20
+
+
+def test_peak_memory_is_measured_per_phase():
+    statistics = LEffectModule.PhaseStatistics(None)
+    with statistics.measure("run_module"):
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import time; x = bytearray({ALLOCATION}); x[::4096] = b'1' * len(x[::4096]); time.sleep(.5)"
+            ],
+            check=True
+        )
+    with statistics.measure("store_results"):
+        pass
+    peak_rss = statistics.values[:, LEffectModule.PhaseStatistics.METRICS.index("peak_rss")]
+    run_module, store_results = (LEffectModule.PhaseStatistics.PHASES.index(phase) for phase in (
+        "run_module", "store_results"))
+    if np.isnan(peak_rss[run_module]):
+        pytest.skip("Resident memory not available on this platform")
+    assert peak_rss[run_module] >= ALLOCATION
+    assert peak_rss[store_results] < ALLOCATION
+    assert statistics.values[run_module, 0] == statistics.values[store_results, 0] == 1
+
+
+def test_runtime_statistics_are_named(make_component):
+    component = make_component("CatchmentGUTSIT")
+    component.run()
+    assert component.outputs["RuntimeStatisticsPhases"].values.tolist() == list(LEffectModule.PhaseStatistics.PHASES)
+    assert component.outputs["RuntimeStatisticsMetrics"].values.tolist() == list(
+        LEffectModule.PhaseStatistics.METRICS)
+    statistics = component.outputs["RuntimeStatistics"]
+    assert statistics.values.shape == (len(LEffectModule.PhaseStatistics.PHASES), 6)
+    assert statistics.attributes["element_names"] == (
+        component.outputs["RuntimeStatisticsPhases"], component.outputs["RuntimeStatisticsMetrics"])
+    assert statistics.values[LEffectModule.PhaseStatistics.PHASES.index("run_module"), 0] == 3
+
+
+@pytest.mark.parametrize("platform, expected", [("darwin", 2048), ("linux", 2048 * 1024)])
+def test_peak_memory_of_children_is_scaled_by_platform(monkeypatch, platform, expected):
+    if LEffectModule.resource is None:
+        pytest.skip("The resource module is not available")
+    monkeypatch.setattr(LEffectModule.sys, "platform", platform)
+    monkeypatch.setattr(
+        LEffectModule.resource, "getrusage", lambda who: type("Usage", (), {"ru_maxrss": 2048})())
+    assert LEffectModule.PhaseStatistics._children_peak_memory() == expected
@@ -0,0 +1,81 @@
+"""Tests that temporary files of the ingestion of module outputs are removed."""
+import os
+import numpy as np
+import pytest
+import stub_module
+from conftest import SIMULATION_START
+
+NUMBER_YEARS = 1
+NUMBER_REACHES = 6
+NUMBER_MULTIPLICATION_FACTORS = 2
+NUMBER_RUNS = 2
+# noinspection SpellCheckingInspection
+RESULT_SET = {"x1s{}r{}_adultPopByReach.txt": "AdultPopulationByReach"}
+
+
+@pytest.fixture
+def population_outputs(tmp_path):
+    processing_path = str(tmp_path / "LPopSD")
+    stub_module.write_module_outputs(
+        processing_path,
+        "LPopSD",
+        SIMULATION_START.year,
+        NUMBER_YEARS,
+        NUMBER_REACHES,
+        NUMBER_MULTIPLICATION_FACTORS,
+        NUMBER_RUNS
+    )
+    # noinspection SpellCheckingInspection
+    return processing_path, os.path.join(processing_path, "ecotalk", "LPopSDModelSystem_MoS", "x1", "x1s{}")
+
+
+def fail_on_update(output):
+    set_values = output.set_values
+
+    def update(values, slices=None, create=True, **keywords):
+        if not create:
+            raise OSError("Store not writable")
+        set_values(values, slices, create, **keywords)
+
+    output.set_values = update
+
+
+def store_arguments(time_slice_path):
+    return (
+        time_slice_path,
+        RESULT_SET,
+        SIMULATION_START.year,
+        NUMBER_YEARS,
+        0,
+        0,
+        NUMBER_REACHES,
+        NUMBER_MULTIPLICATION_FACTORS,
+        NUMBER_RUNS
+    )
+
+
+def test_buffer_is_removed(make_component, population_outputs, tmp_path):
+    time_slice_path = population_outputs[1]
+    buffer_path = tmp_path / "buffer"
+    buffer_path.mkdir()
+    component = make_component("LPopSD", number_years=NUMBER_YEARS)
+    component.store_results_per_day_and_reach(*store_arguments(time_slice_path), buffer_path=str(buffer_path))
+    reference = make_component("LPopSD", number_years=NUMBER_YEARS)
+    reference.store_results_per_day_and_reach(*store_arguments(time_slice_path))
+    np.testing.assert_array_equal(
+        component.outputs["AdultPopulationByReach"].values, reference.outputs["AdultPopulationByReach"].values)
+    assert os.listdir(buffer_path) == []
+    component = make_component("LPopSD", number_years=NUMBER_YEARS)
+    fail_on_update(component.outputs["AdultPopulationByReach"])
+    with pytest.raises(OSError):
+        component.store_results_per_day_and_reach(*store_arguments(time_slice_path), buffer_path=str(buffer_path))
+    assert os.listdir(buffer_path) == []
+
+
+def test_sparse_values_file_is_removed(make_component, population_outputs):
+    processing_path, time_slice_path = population_outputs
+    component = make_component("LPopSD", number_years=NUMBER_YEARS)
+    fail_on_update(component.outputs["AdultPopulationByReachValues"])
+    with pytest.raises(OSError):
+        component.store_sparse_results_per_day_and_reach(*store_arguments(time_slice_path), processing_path)
+    assert not os.path.exists(os.path.join(processing_path, "AdultPopulationByReachValues.tmp"))
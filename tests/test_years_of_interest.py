@@ -0,0 +1,31 @@
+"""Tests of runs restricted to years of interest."""
+import os
+import numpy as np
+import pytest
+
+
+def test_run_is_restricted_to_years_of_interest(make_component, tmp_path):
+    component = make_component(
+        "CatchmentGUTSIT",
+        {"FirstYearOfInterest": 2001, "LastYearOfInterest": 2002},
+        number_years=4,
+        processing_path=str(tmp_path / "window")
+    )
+    component.run()
+    reference = make_component("CatchmentGUTSIT", number_years=4, processing_path=str(tmp_path / "all"))
+    reference.run()
+    assert [year for year, _ in component.run_module_async.runs] == [2001, 2002]
+    survival = component.outputs["GutsSurvivalReaches"]
+    assert survival.values.shape == (2, 6, 2)
+    assert survival.attributes["offset"] == (2001, None, None)
+    np.testing.assert_array_equal(survival.values, reference.outputs["GutsSurvivalReaches"].values[1:3])
+    # noinspection SpellCheckingInspection
+    prefix = "CatchmentGUTSITModelSystem_MoS_"
+    year_paths = sorted(name for name in os.listdir(tmp_path / "window" / "ecotalk") if name.startswith(prefix))
+    assert year_paths == ["CatchmentGUTSITModelSystem_MoS_1", "CatchmentGUTSITModelSystem_MoS_2"]
+
+
+def test_years_of_interest_must_be_covered(make_component):
+    component = make_component("CatchmentGUTSIT", {"FirstYearOfInterest": 2002, "LastYearOfInterest": 2003})
+    with pytest.raises(ValueError, match="2002 to 2003"):
+        component.run()